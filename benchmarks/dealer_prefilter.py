@@ -0,0 +1,95 @@
+"""
+CPU benchmark: decoding dealer cluster frames vs peeking at their update reason.
+
+Usage:
+    python benchmarks/dealer_prefilter.py [--count 2000] [--queue 80]
+
+The frame is shaped like a connect-state cluster update, with a queue of
+--queue tracks, which is what makes real frames large.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from spotapi.utils import fastjson
+from spotapi.websocket import _is_control_frame, _peek_update_reasons
+
+
+def _track(i: int) -> Dict[str, Any]:
+    return {
+        "uri": f"spotify:track:{i:022d}",
+        "uid": f"{i:016x}",
+        "provider": "context",
+        "metadata": {
+            "album_title": "Some album",
+            "artist_uri": "spotify:artist:0OdUWJ0sBjDrqHygGUXeCF",
+            "image_url": "spotify:image:ab67616d00001e02" + "0" * 24,
+            "context_uri": "spotify:playlist:37i9dQZF1DXcBWIGoYBM5M",
+            "iteration": "0",
+        },
+    }
+
+
+def _frame(queue: int) -> str:
+    cluster = {
+        "timestamp": "1700000000000",
+        "active_device_id": "a" * 40,
+        "player_state": {
+            "timestamp": "1700000000000",
+            "context_uri": "spotify:playlist:37i9dQZF1DXcBWIGoYBM5M",
+            "track": _track(0),
+            "next_tracks": [_track(i) for i in range(1, queue + 1)],
+            "prev_tracks": [_track(i) for i in range(queue + 1, queue + 11)],
+            "is_playing": True,
+            "is_paused": False,
+            "position_as_of_timestamp": "1000",
+            "duration": "215000",
+        },
+        "devices": {
+            f"device{i}": {"name": f"Device {i}", "volume": 65535} for i in range(3)
+        },
+    }
+    return json.dumps(
+        {
+            "headers": {"Content-Type": "application/json"},
+            "payloads": [
+                {
+                    "cluster": cluster,
+                    "update_reason": "DEVICE_STATE_CHANGED",
+                    "devices_that_changed": ["a" * 40],
+                }
+            ],
+            "type": "message",
+            "method": "PUT",
+            "uri": "hm://connect-state/v1/cluster",
+        }
+    )
+
+
+def _time(name: str, func: Callable[[str], Any], frame: str, count: int) -> None:
+    start = time.perf_counter()
+    for _ in range(count):
+        func(frame)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {elapsed / count * 1e6:>9.1f} us/frame")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--queue", type=int, default=80)
+    args = parser.parse_args()
+
+    frame = _frame(args.queue)
+    print(f"frame size: {len(frame)} bytes, orjson: {fastjson.HAS_ORJSON}")
+
+    _time("json.loads", json.loads, frame, args.count)
+    _time("fastjson.loads", fastjson.loads, frame, args.count)
+    _time("peek update_reason", _peek_update_reasons, frame, args.count)
+    _time("control frame check", _is_control_frame, '{"type":"pong"}', args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Load benchmark: many accounts consuming a replayed dealer session, fully offline.
+
+Usage:
+    python benchmarks/dealer_replay.py [--mode hub|events] [--accounts 1000]
+        [--recording session.jsonl.gz] [--speed 10] [--duration 10]
+
+Without --recording, a session is synthesized from a cluster payload of
+benchmarks/fixtures (--fixture, one update every 50ms). Record a real one with
+spotapi.utils.replay.DealerRecorder.
+
+Every account connects to a local DealerReplayServer, the HTTP side of the dealer
+(token, device registration, cluster fetch) is answered locally. Reports the events
+delivered per second, the dispatch latency and the peak RSS.
+"""
+
+import argparse
+import json
+import os
+import resource
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+from spotapi import websocket as websocket_module
+from spotapi.client import BaseClient
+from spotapi.http.request import TLSClient
+from spotapi.hub import DealerHub
+from spotapi.status import EventManager
+from spotapi.types.data import LatencyStats
+from spotapi.utils.replay import DealerReplayServer, load_recording
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "cluster_small.json")
+
+
+def _synthetic_session(
+    fixture: str,
+) -> Tuple[List[Tuple[float, str]], Dict[str, Any]]:
+    with open(fixture, encoding="utf-8") as f:
+        cluster_payload = json.load(f)
+
+    frames = []
+    for i in range(40):
+        payload = dict(cluster_payload)
+        payload["update_reason"] = (
+            "PLAYER_STATE_CHANGED" if i % 4 else "DEVICE_STATE_CHANGED"
+        )
+        frame = {
+            "type": "message",
+            "method": "PUT",
+            "uri": "hm://connect-state/v1/cluster",
+            "headers": {"Content-Type": "application/json"},
+            "payloads": [payload],
+        }
+        frames.append((i * 0.05, json.dumps(frame, separators=(",", ":"))))
+
+    return frames, cluster_payload["cluster"]
+
+
+def _offline(cluster: Dict[str, Any]) -> None:
+    def session(self: BaseClient) -> None:
+        self.access_token = "offline"
+
+    BaseClient.get_session = session  # type: ignore[method-assign]
+    BaseClient.get_client_token = lambda self: None  # type: ignore[method-assign]
+    BaseClient.refresh_access_token = (  # type: ignore[method-assign]
+        lambda self, force=False: session(self)
+    )
+    websocket_module._register_device = lambda *_: None
+    websocket_module._connect_device = lambda *_: cluster
+    websocket_module.signal.signal = lambda *_: None  # type: ignore[assignment]
+
+
+def _login() -> Any:
+    return SimpleNamespace(logged_in=True, client=TLSClient("chrome_120", ""))
+
+
+def _rss_mb() -> float:
+    # Kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_hub(accounts: int, duration: float) -> Tuple[int, LatencyStats]:
+    delivered = [0]
+    lock = threading.Lock()
+
+    def on_event(payload: Dict[str, Any]) -> None:
+        with lock:
+            delivered[0] += 1
+
+    with DealerHub(workers=8) as hub:
+        for i in range(accounts):
+            key = hub.add(_login(), key=f"account{i}")
+            hub.subscribe(key, "PLAYER_STATE_CHANGED")(on_event)
+
+        before = delivered[0]
+        time.sleep(duration)
+        return delivered[0] - before, hub.metrics().dispatch_lag
+
+
+def _run_events(accounts: int, duration: float) -> Tuple[int, LatencyStats]:
+    delivered = [0]
+    lock = threading.Lock()
+
+    def on_event(payload: Dict[str, Any]) -> None:
+        with lock:
+            delivered[0] += 1
+
+    managers = []
+    for _ in range(accounts):
+        manager = EventManager(_login())
+        manager.subscribe("PLAYER_STATE_CHANGED")(on_event)
+        managers.append(manager)
+
+    before = delivered[0]
+    time.sleep(duration)
+    count = delivered[0] - before
+
+    latency = LatencyStats()
+    for manager in managers:
+        for stats in manager.dispatch_stats():
+            latency.count += stats.latency.count
+            latency.total += stats.latency.total
+            latency.max = max(latency.max, stats.latency.max)
+        manager.close()
+
+    return count, latency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=("hub", "events"), default="hub")
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--recording")
+    parser.add_argument("--fixture", default=FIXTURE)
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    frames, cluster = _synthetic_session(args.fixture)
+    if args.recording:
+        frames = load_recording(args.recording)
+
+    _offline(cluster)
+    with DealerReplayServer(frames, speed=args.speed, repeat=True) as server:
+        websocket_module.DEALER_URL = server.url
+
+        run = _run_hub if args.mode == "hub" else _run_events
+        delivered, latency = run(args.accounts, args.duration)
+
+        print(f"mode: {args.mode}, accounts: {args.accounts}, speed: {args.speed}x")
+        print(f"frames served:    {server.frames_sent}")
+        print(
+            f"events delivered: {delivered} ({delivered / args.duration:.0f}/s once connected)"
+        )
+        print(
+            f"dispatch latency: mean {latency.mean * 1e3:.2f} ms, max {latency.max * 1e3:.2f} ms"
+        )
+        print(f"peak rss:         {_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+CPU benchmark: eager PlayerState / Devices parsing vs the lazily parsed variants.
+
+Usage:
+    python benchmarks/lazy_state.py [--count 500] [--fixtures "benchmarks/fixtures/*.json"]
+
+Every fixture is one cluster payload, as found in the dealer's connect-state frames
+(`payloads[0]`). The bundled fixtures are synthetic payloads shaped after recorded ones,
+drop real recordings in the same directory (or point --fixtures at them) to compare.
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+from typing import Any, Callable, Dict
+
+from spotapi.types.data import Devices, LazyDevices, LazyPlayerState, PlayerState
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "cluster_*.json")
+
+
+def _eager_scalars(cluster: Dict[str, Any]) -> Any:
+    state = PlayerState.from_dict(cluster["player_state"])
+    devices = Devices.from_dict(cluster["devices"], cluster["active_device_id"])
+    return state.is_paused, state.track.uri, devices.active_device_id
+
+
+def _lazy_scalars(cluster: Dict[str, Any]) -> Any:
+    state = LazyPlayerState.from_dict(cluster["player_state"])
+    devices = LazyDevices.from_dict(cluster["devices"], cluster["active_device_id"])
+    return state.is_paused, state.track.uri, devices.active_device_id
+
+
+def _eager_queue(cluster: Dict[str, Any]) -> Any:
+    state = PlayerState.from_dict(cluster["player_state"])
+    return [track.uri for track in state.next_tracks]
+
+
+def _lazy_queue(cluster: Dict[str, Any]) -> Any:
+    return LazyPlayerState.from_dict(cluster["player_state"]).next_tracks.uris()
+
+
+def _eager_full(cluster: Dict[str, Any]) -> Any:
+    state = PlayerState.from_dict(cluster["player_state"])
+    devices = Devices.from_dict(cluster["devices"], cluster["active_device_id"])
+    return state.next_tracks[-1:], list(devices.devices.values())
+
+
+def _lazy_full(cluster: Dict[str, Any]) -> Any:
+    state = LazyPlayerState.from_dict(cluster["player_state"])
+    devices = LazyDevices.from_dict(cluster["devices"], cluster["active_device_id"])
+    return list(state.next_tracks)[-1:], list(devices.values())
+
+
+def _time(
+    name: str,
+    func: Callable[[Dict[str, Any]], Any],
+    cluster: Dict[str, Any],
+    count: int,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func(cluster)
+    per_call = (time.perf_counter() - start) / count * 1e6
+    print(f"  {name:<22} {per_call:>9.1f} us")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--fixtures", default=FIXTURES)
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(args.fixtures))
+    if not paths:
+        parser.error(f"No fixtures match {args.fixtures}")
+
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+
+        cluster = payload.get("cluster", payload)
+        queue = len(cluster["player_state"].get("next_tracks", []))
+        print(f"{os.path.basename(path)}: {queue} queued tracks")
+
+        for label, eager, lazy in (
+            ("scalars", _eager_scalars, _lazy_scalars),
+            ("queue uris", _eager_queue, _lazy_queue),
+            ("full access", _eager_full, _lazy_full),
+        ):
+            before = _time(f"eager {label}", eager, cluster, args.count)
+            after = _time(f"lazy {label}", lazy, cluster, args.count)
+            print(f"  {'speedup':<22} {before / after:>9.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: PublicPlaylist, PublicAlbum and Song searches under load, against the local
+mock Spotify server instead of the network.
+
+Usage:
+    python benchmarks/public_mock.py [--workers 16] [--jobs 200] [--latency 0.02,0.08]
+                                     [--error-rate 0.0] [--rate-limit 0.0]
+
+Every worker has its own TLSClient and runs jobs (a full playlist pagination, an album or
+a search page) until --jobs are done. Reports jobs and requests per second, job latency
+percentiles and the failed jobs, with the responses the server injected.
+"""
+
+import argparse
+import random
+import statistics
+import threading
+import time
+from typing import Callable, List
+
+from spotapi import client as client_module
+from spotapi.album import PublicAlbum
+from spotapi.http.request import TLSClient
+from spotapi.playlist import PublicPlaylist
+from spotapi.song import Song
+from spotapi.utils.mock_server import MockSpotifyServer
+
+
+def _jobs(client: TLSClient) -> List[Callable[[], object]]:
+    playlist = PublicPlaylist("37i9dQZF1DXcBWIGoYBM5M", client=client)
+    album = PublicAlbum("4aawyAB9vmqN3uQ7FjRGTy", client=client)
+    song = Song(client=client)
+    return [
+        lambda: list(playlist.paginate_playlist()),
+        album.get_album_info,
+        lambda: song.query_songs(random.choice(("weezer", "lorde", "abba"))),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--latency", default="0.02,0.08")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    args = parser.parse_args()
+
+    low, _, high = args.latency.partition(",")
+    latency = (float(low), float(high or low))
+
+    timings: List[float] = []
+    failures: List[str] = []
+    lock = threading.Lock()
+    remaining = iter(range(args.jobs))
+
+    with MockSpotifyServer(
+        latency=latency, error_rate=args.error_rate, rate_limit=args.rate_limit
+    ) as server:
+        client_module.SECRETS_URL = server.secrets_url
+
+        def work() -> None:
+            client = server.install(TLSClient("chrome120", "", auto_retries=1))
+            jobs = _jobs(client)
+            while True:
+                with lock:
+                    if next(remaining, None) is None:
+                        return
+
+                start = time.perf_counter()
+                try:
+                    random.choice(jobs)()
+                except Exception as e:
+                    with lock:
+                        failures.append(type(e).__name__)
+                    continue
+
+                with lock:
+                    timings.append(time.perf_counter() - start)
+
+        threads = [threading.Thread(target=work) for _ in range(args.workers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        requests = sum(server.hits.values())
+        statuses = dict(sorted(server.statuses.items()))
+
+    quantiles = statistics.quantiles(timings, n=100) if len(timings) > 1 else [0] * 99
+    print(f"workers         {args.workers}")
+    print(f"jobs            {len(timings)} ok, {len(failures)} failed")
+    print(f"jobs/s          {len(timings) / elapsed:.1f}")
+    print(f"requests/s      {requests / elapsed:.1f}")
+    print(f"job p50         {quantiles[49] * 1000:.1f} ms")
+    print(f"job p99         {quantiles[98] * 1000:.1f} ms")
+    print(f"statuses        {statuses}")
+
+
+if __name__ == "__main__":
+    main()
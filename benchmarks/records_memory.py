@@ -0,0 +1,132 @@
+"""
+Memory benchmark: raw fetchPlaylist items (nested dicts) vs TrackRecord.
+
+Usage:
+    python benchmarks/records_memory.py [--count 1000000]
+
+Both sides are built from freshly decoded JSON so nothing is shared between
+items, the same as holding the pages returned by paginate_playlist.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from spotapi.types.data import TrackRecord
+
+_ITEM_TEMPLATE = {
+    "uid": "",
+    "addedAt": {"isoString": "2024-01-01T00:00:00Z"},
+    "addedBy": {
+        "data": {"__typename": "User", "name": "someone", "uri": "spotify:user:someone"}
+    },
+    "attributes": [],
+    "itemV2": {
+        "__typename": "TrackResponseWrapper",
+        "data": {
+            "__typename": "Track",
+            "uri": "",
+            "name": "",
+            "trackDuration": {"totalMilliseconds": 215000},
+            "playcount": "1234567",
+            "discNumber": 1,
+            "trackNumber": 4,
+            "contentRating": {"label": "NONE"},
+            "playability": {"playable": True, "reason": "PLAYABLE"},
+            "albumOfTrack": {
+                "uri": "spotify:album:4yP0hdKOZPNshxUOjY0cZj",
+                "name": "After Hours",
+                "artists": {
+                    "items": [
+                        {
+                            "uri": "spotify:artist:1Xyo4u8uXC1ZmMpatF05PJ",
+                            "profile": {"name": "The Weeknd"},
+                        }
+                    ]
+                },
+                "coverArt": {
+                    "sources": [
+                        {
+                            "url": "https://i.scdn.co/image/ab67616d00001e02",
+                            "width": 300,
+                            "height": 300,
+                        },
+                        {
+                            "url": "https://i.scdn.co/image/ab67616d00004851",
+                            "width": 64,
+                            "height": 64,
+                        },
+                        {
+                            "url": "https://i.scdn.co/image/ab67616d0000b273",
+                            "width": 640,
+                            "height": 640,
+                        },
+                    ]
+                },
+            },
+            "artists": {
+                "items": [
+                    {
+                        "uri": "spotify:artist:1Xyo4u8uXC1ZmMpatF05PJ",
+                        "profile": {"name": "The Weeknd"},
+                    }
+                ]
+            },
+        },
+    },
+}
+
+
+def _raw_items(count: int) -> List[str]:
+    # Serialised templates are tiny and shared, decoding them is what allocates
+    raw = json.dumps(_ITEM_TEMPLATE)
+    return [
+        raw.replace('"uri": ""', f'"uri": "spotify:track:{i:022d}"', 1)
+        .replace('"name": ""', f'"name": "Track {i}"', 1)
+        .replace('"uid": ""', f'"uid": "{i:016x}"', 1)
+        for i in range(count)
+    ]
+
+
+def _measure(label: str, build: Callable[[], List[Any]], count: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    held = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{label:<12} {len(held):>10,} items  "
+        f"{current / 1024 / 1024:>10.1f} MiB  "
+        f"{current / count:>8.0f} B/item  "
+        f"{elapsed:>7.2f}s"
+    )
+    del held
+    gc.collect()
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    raws = _raw_items(args.count)
+
+    as_dicts = _measure("dict", lambda: [json.loads(r) for r in raws], args.count)
+    as_records = _measure(
+        "TrackRecord",
+        lambda: [TrackRecord.from_item(json.loads(r)) for r in raws],
+        args.count,
+    )
+
+    print(f"\nTrackRecord uses {as_dicts / max(as_records, 1):.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: the save after every login, straight to SqliteSaver vs through CachedSaver.
+
+Usage:
+    python benchmarks/saver_cached.py [--logins 5000] [--accounts 500]
+
+Every login saves its session and the next one for the same account loads it, as the
+login workers do. Reports the time spent in the saver on that path, then the time
+CachedSaver.close() takes to write what is still pending.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict
+
+from spotapi.utils.saver import CachedSaver, SqliteSaver
+
+
+def _session(i: int, refresh: int) -> Dict[str, Any]:
+    return {
+        "identifier": f"user{i}@example.com",
+        "password": "password",
+        "cookies": {"sp_dc": f"{refresh:0>400}", "sp_key": "y" * 36},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=5000)
+    parser.add_argument("--accounts", type=int, default=500)
+    args = parser.parse_args()
+
+    accounts = [random.randrange(args.accounts) for _ in range(args.logins)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, saver in (
+            ("SqliteSaver", SqliteSaver(os.path.join(tmp, "direct.db"))),
+            ("CachedSaver", CachedSaver(SqliteSaver(os.path.join(tmp, "cached.db")))),
+        ):
+            saver.save([_session(i, 0) for i in range(args.accounts)])
+
+            start = time.perf_counter()
+            for refresh, i in enumerate(accounts):
+                saver.load({"identifier": f"user{i}@example.com"})
+                saver.save([_session(i, refresh)])
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed / args.logins * 1e6:>8.1f} us/login")
+
+            start = time.perf_counter()
+            saver.close()
+            print(f"  close: {(time.perf_counter() - start) * 1e3:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
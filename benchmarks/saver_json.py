@@ -0,0 +1,65 @@
+"""
+Benchmark: JSONSaver vs the append-only JSONLogSaver with many stored sessions.
+
+Usage:
+    python benchmarks/saver_json.py [--sessions 20000] [--ops 50]
+
+Each saver is filled with --sessions sessions, then --ops single session saves and
+--ops loads by identifier are timed, then one load_many and one iter_all of every session.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from spotapi.utils.saver import JSONLogSaver, JSONSaver
+
+
+def _session(i: int) -> Dict[str, Any]:
+    return {
+        "identifier": f"user{i}@example.com",
+        "password": "password",
+        "cookies": {"sp_dc": "x" * 400, "sp_key": "y" * 36, "sp_t": "z" * 32},
+    }
+
+
+def _time(name: str, func: Callable[[int], Any], ops: List[int]) -> None:
+    start = time.perf_counter()
+    for i in ops:
+        func(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<10} {elapsed / len(ops) * 1e3:>9.2f} ms/op")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=20000)
+    parser.add_argument("--ops", type=int, default=50)
+    args = parser.parse_args()
+
+    sessions = [_session(i) for i in range(args.sessions)]
+    identifiers = [session["identifier"] for session in sessions]
+    ops = random.sample(range(args.sessions), args.ops)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for saver in (
+            JSONSaver(os.path.join(tmp, "sessions.json")),
+            JSONLogSaver(os.path.join(tmp, "sessions.jsonl")),
+        ):
+            saver.save(sessions)
+            print(f"{saver.__class__.__name__}, {args.sessions} sessions:")
+            _time("save", lambda i: saver.save([_session(i)]), ops)
+            _time(
+                "load",
+                lambda i: saver.load({"identifier": f"user{i}@example.com"}),
+                ops,
+            )
+            _time("load_many", lambda _: saver.load_many(identifiers), [0])
+            _time("iter_all", lambda _: list(saver.iter_all()), [0])
+
+
+if __name__ == "__main__":
+    main()
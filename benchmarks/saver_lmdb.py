@@ -0,0 +1,113 @@
+"""
+Benchmark: LMDBSaver against JSONSaver and SqliteSaver at growing session counts.
+
+Usage:
+    python benchmarks/saver_lmdb.py [--sizes 10000,100000,1000000] [--savers json,sqlite,lmdb]
+                                    [--processes 4]
+
+For every size and saver: one batched save of every session, single loads by
+identifier, one load_many and one iter_all of every session, and the total rate of
+single loads from --processes reader processes at once (sqlite and lmdb only).
+Requires lmdb.
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from spotapi.utils.saver import JSONSaver, LMDBSaver, SqliteSaver
+
+SAVERS: Dict[str, Callable[[str, int], Any]] = {
+    "json": lambda tmp, _: JSONSaver(os.path.join(tmp, "sessions.json")),
+    "sqlite": lambda tmp, _: SqliteSaver(os.path.join(tmp, "sessions.db")),
+    # Room for the sessions with B-tree overhead
+    "lmdb": lambda tmp, size: LMDBSaver(
+        os.path.join(tmp, "sessions.lmdb"), map_size=max(size * 2048, 1 << 26)
+    ),
+}
+
+
+def _session(i: int) -> Dict[str, Any]:
+    return {
+        "identifier": f"user{i}@example.com",
+        "password": "password",
+        "cookies": {"sp_dc": "x" * 400, "sp_key": "y" * 36, "sp_t": "z" * 32},
+    }
+
+
+def _read(args: tuple) -> float:
+    name, tmp, size, identifiers = args
+    saver = SAVERS[name](tmp, size)
+    start = time.perf_counter()
+    for identifier in identifiers:
+        saver.load({"identifier": identifier})
+    elapsed = time.perf_counter() - start
+    saver.close()
+    return elapsed
+
+
+def _bench(name: str, size: int, processes: int) -> List[str]:
+    sessions = [_session(i) for i in range(size)]
+    identifiers = [session["identifier"] for session in sessions]
+    # A JSONSaver load reads the whole file
+    sample = random.sample(identifiers, 5 if name == "json" else 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = SAVERS[name](tmp, size)
+        row = [f"{name:<7} {size:>8}"]
+
+        start = time.perf_counter()
+        saver.save(sessions)
+        row.append(f"{time.perf_counter() - start:>9.3f} s")
+
+        start = time.perf_counter()
+        for identifier in sample:
+            saver.load({"identifier": identifier})
+        row.append(f"{(time.perf_counter() - start) / len(sample) * 1e6:>11.1f} us")
+
+        start = time.perf_counter()
+        saver.load_many(identifiers)
+        row.append(f"{time.perf_counter() - start:>9.3f} s")
+
+        start = time.perf_counter()
+        for _ in saver.iter_all():
+            pass
+        row.append(f"{time.perf_counter() - start:>9.3f} s")
+
+        if hasattr(saver, "close"):
+            saver.close()
+
+        if name == "json" or processes < 2:
+            row.append(f"{'-':>13}")
+        else:
+            reads = random.choices(identifiers, k=20000)
+            with multiprocessing.get_context("spawn").Pool(processes) as pool:
+                # Timed in the readers, without process startup
+                elapsed = max(pool.map(_read, [(name, tmp, size, reads)] * processes))
+            row.append(f"{len(reads) * processes / elapsed:>9.0f} /s")
+
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--savers", default="json,sqlite,lmdb")
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+
+    print(
+        f"{'saver':<7} {'sessions':>8} {'save all':>11} {'load one':>14} "
+        f"{'load_many':>11} {'iter_all':>11} {'readers':>13}"
+    )
+    for size in map(int, args.sizes.split(",")):
+        for name in args.savers.split(","):
+            print("  ".join(_bench(name, size, args.processes)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: storing and restoring many sessions with SqliteSaver.
+
+Usage:
+    python benchmarks/saver_sqlite.py [--sessions 50000]
+
+Times one batched save of every session, one load_many of all of them (the restore
+at process start) and single loads by identifier.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict
+
+from spotapi.utils.saver import SqliteSaver
+
+
+def _session(i: int) -> Dict[str, Any]:
+    return {
+        "identifier": f"user{i}@example.com",
+        "password": "password",
+        "cookies": {"sp_dc": "x" * 400, "sp_key": "y" * 36, "sp_t": "z" * 32},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=50000)
+    args = parser.parse_args()
+
+    sessions = [_session(i) for i in range(args.sessions)]
+    identifiers = [session["identifier"] for session in sessions]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = SqliteSaver(os.path.join(tmp, "sessions.db"))
+
+        start = time.perf_counter()
+        saver.save(sessions)
+        print(f"save {args.sessions}:      {time.perf_counter() - start:>8.3f} s")
+
+        start = time.perf_counter()
+        loaded = saver.load_many(identifiers)
+        print(f"load_many {len(loaded)}: {time.perf_counter() - start:>8.3f} s")
+
+        sample = random.sample(identifiers, 1000)
+        start = time.perf_counter()
+        for identifier in sample:
+            saver.load({"identifier": identifier})
+        elapsed = (time.perf_counter() - start) / len(sample)
+        print(f"load one:         {elapsed * 1e6:>8.1f} us")
+
+        saver.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: stored size and encode/decode time of a session pool per serializer.
+
+Usage:
+    python benchmarks/serializer.py [--sessions 100000]
+
+Sessions carry the cookies a logged in client holds, with random values. "json indent=4"
+is what JSONSaver writes by default, "json" what RedisSaver and LMDBSaver store without
+a serializer. The dictionary is trained on 5000 other sessions. Requires msgpack, and
+zstandard for the zstd rows.
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Tuple
+
+from spotapi.utils.serializer import JSONSerializer, MsgpackSerializer, train_dictionary
+
+
+def _token(size: int) -> str:
+    return base64.urlsafe_b64encode(os.urandom(size)).decode().rstrip("=")
+
+
+def _session(i: int) -> Dict[str, Any]:
+    return {
+        "identifier": f"user{i}@example.com",
+        "password": _token(12),
+        "cookies": {
+            "sp_dc": _token(120),
+            "sp_key": str(uuid.uuid4()),
+            "sp_t": uuid.uuid4().hex,
+            "sp_landing": "https%3A%2F%2Fopen.spotify.com%2F",
+            "sp_new": "1",
+            "__Host-sp_csrf_sid": _token(48),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=100000)
+    args = parser.parse_args()
+
+    sessions = [_session(i) for i in range(args.sessions)]
+
+    pretty: Tuple[Callable[[Any], bytes], Callable[[bytes], Any]] = (
+        lambda item: json.dumps(item, indent=4).encode(),
+        json.loads,
+    )
+    codecs: List[Tuple[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]]] = [
+        ("json indent=4", pretty),
+    ]
+    for name, serializer in (
+        ("json", JSONSerializer()),
+        ("msgpack", MsgpackSerializer()),
+        ("msgpack+zstd 3", MsgpackSerializer(level=3)),
+        ("msgpack+zstd 19", MsgpackSerializer(level=19)),
+        (
+            "msgpack+zstd dict",
+            MsgpackSerializer(
+                dictionary=train_dictionary(_session(-i) for i in range(5000))
+            ),
+        ),
+    ):
+        codecs.append((name, (serializer.dumps, serializer.loads)))
+
+    print(
+        f"{'serializer':<18} {'total':>10} {'per session':>12} {'dumps':>10} {'loads':>10}"
+    )
+    for name, (dumps, loads) in codecs:
+        start = time.perf_counter()
+        blobs = [dumps(session) for session in sessions]
+        dumped = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for blob in blobs:
+            loads(blob)
+        loaded = time.perf_counter() - start
+
+        size = sum(map(len, blobs))
+        print(
+            f"{name:<18} {size / 1e6:>7.1f} MB {size / len(blobs):>10.0f} B "
+            f"{dumped / len(blobs) * 1e6:>7.2f} us {loaded / len(blobs) * 1e6:>7.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""BaseClient bootstrap, persisted query hash lookups and response parsing."""
+
+import json
+
+import pytest
+
+from spotapi import client as client_module
+from spotapi.client import BaseClient
+
+# The real web-player pack and chunks add up to about this much JavaScript
+RAW_HASHES_SIZE = 1_500_000
+
+
+def _bootstrap(base: BaseClient) -> None:
+    base.get_session()
+    base.get_client_token()
+    base.get_sha256_hash()
+
+
+@pytest.mark.benchmark(group="bootstrap")
+def test_bootstrap_cold(benchmark, make_client):
+    # A new client and connection, the TOTP secrets fetched again
+    def setup():
+        client_module._secret_cache = None
+        return (BaseClient(make_client()),), {}
+
+    benchmark.pedantic(_bootstrap, setup=setup, rounds=20)
+
+
+@pytest.mark.benchmark(group="bootstrap")
+def test_bootstrap_warm(benchmark, make_client):
+    # The connection and TOTP secrets of the previous bootstrap are reused
+    client = make_client()
+    _bootstrap(BaseClient(client))
+
+    benchmark.pedantic(_bootstrap, setup=lambda: ((BaseClient(client),), {}), rounds=20)
+
+
+@pytest.mark.benchmark(group="part_hash")
+@pytest.mark.parametrize("operation", ["fetchPlaylist", "searchDesktop"])
+def test_part_hash(benchmark, base, make_client, operation):
+    # fetchPlaylist is in the pack, searchDesktop at the end of a chunk
+    padded = BaseClient(make_client())
+    filler = 'e.l("placeholder","query","0",null);'
+    padded.raw_hashes = filler * (RAW_HASHES_SIZE // len(filler)) + base.raw_hashes
+
+    assert benchmark(padded.part_hash, operation) == base.part_hash(operation)
+
+
+@pytest.mark.benchmark(group="parse_response")
+def test_parse_response(benchmark, base):
+    # One full fetchPlaylist page, as paginate_playlist requests them
+    params = {
+        "operationName": "fetchPlaylist",
+        "variables": json.dumps(
+            {
+                "uri": "spotify:playlist:37i9dQZF1DXcBWIGoYBM5M",
+                "offset": 0,
+                "limit": 343,
+            }
+        ),
+        "extensions": json.dumps(
+            {
+                "persistedQuery": {
+                    "version": 1,
+                    "sha256Hash": base.part_hash("fetchPlaylist"),
+                }
+            }
+        ),
+    }
+    raw = base.client.build_request(
+        "POST",
+        "https://api-partner.spotify.com/pathfinder/v1/query",
+        **base._auth_rule({"params": params}),
+    )
+
+    parsed = benchmark(base.client.parse_response, raw, "POST", False)
+    assert len(parsed.response["data"]["playlistV2"]["content"]["items"]) == 343
@@ -0,0 +1,30 @@
+"""Overhead of the runtime type checks added by @enforce."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from spotapi.client import BaseClient
+from spotapi.types.annotations import enforce_types
+
+
+def _lookup(name: str, items: List[str], options: Dict[str, Any] | None = None) -> int:
+    return len(name) + len(items)
+
+
+_checked_lookup = enforce_types(_lookup)
+_ARGS = ("fetchPlaylist", ["a", "b", "c"], {"limit": 25})
+
+
+@pytest.mark.benchmark(group="enforce")
+@pytest.mark.parametrize("func", [_lookup, _checked_lookup], ids=["plain", "enforced"])
+def test_function_call(benchmark, func):
+    assert benchmark(func, *_ARGS) == 16
+
+
+@pytest.mark.benchmark(group="enforce part_hash")
+@pytest.mark.parametrize("enforced", [False, True], ids=["plain", "enforced"])
+def test_part_hash_call(benchmark, base, enforced):
+    # BaseClient is decorated with @enforce, __wrapped__ is the method without checks
+    method = BaseClient.part_hash if enforced else BaseClient.part_hash.__wrapped__
+    assert benchmark(method, base, "fetchPlaylist")
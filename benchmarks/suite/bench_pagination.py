@@ -0,0 +1,23 @@
+"""Paginating a playlist of PLAYLIST_TRACKS tracks from the mock server."""
+
+import pytest
+from conftest import PLAYLIST_TRACKS
+
+from spotapi.playlist import PublicPlaylist
+
+
+@pytest.mark.benchmark(group="pagination")
+def test_paginate_playlist(benchmark, make_client):
+    playlist = PublicPlaylist("37i9dQZF1DXcBWIGoYBM5M", client=make_client())
+    # Bootstrapped outside the measurement
+    playlist.get_playlist_info(limit=1)
+
+    def paginate() -> int:
+        return sum(len(page["items"]) for page in playlist.paginate_playlist())
+
+    assert benchmark.pedantic(paginate, rounds=5) == PLAYLIST_TRACKS
+    # No stats with --benchmark-disable
+    if benchmark.stats is not None:
+        benchmark.extra_info["tracks_per_second"] = round(
+            PLAYLIST_TRACKS / benchmark.stats.stats.mean
+        )
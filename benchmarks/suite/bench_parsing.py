@@ -0,0 +1,37 @@
+"""Parsing dealer player states and pathfinder track items."""
+
+import glob
+import json
+import os
+
+import pytest
+
+from spotapi.playlist import PublicPlaylist
+from spotapi.types.data import PlayerState, TrackRecord
+
+FIXTURES = sorted(
+    glob.glob(
+        os.path.join(os.path.dirname(__file__), "..", "fixtures", "cluster_*.json")
+    )
+)
+
+
+@pytest.mark.benchmark(group="PlayerState.from_dict")
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_player_state_from_dict(benchmark, path):
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    state = payload.get("cluster", payload)["player_state"]
+
+    assert benchmark(PlayerState.from_dict, state).track is not None
+
+
+@pytest.mark.benchmark(group="TrackRecord.from_item")
+def test_track_records_from_page(benchmark, make_client):
+    # The items of one full fetchPlaylist page
+    playlist = PublicPlaylist("37i9dQZF1DXcBWIGoYBM5M", client=make_client())
+    page = playlist.get_playlist_info(limit=343)
+    items = page["data"]["playlistV2"]["content"]["items"]
+
+    records = benchmark(lambda: [TrackRecord.from_item(item) for item in items])
+    assert len(records) == 343
@@ -0,0 +1,83 @@
+"""
+Saver save and load at scale.
+
+SPOTAPI_BENCH_SESSIONS sets the number of sessions, 10k by default.
+"""
+
+import importlib.util
+import itertools
+import os
+import random
+from typing import Any, Callable, Dict
+
+import pytest
+
+from spotapi.utils.saver import JSONSaver, LMDBSaver, SqliteSaver
+
+SESSIONS = int(os.environ.get("SPOTAPI_BENCH_SESSIONS", "10000"))
+
+SAVERS: Dict[str, Callable[[str], Any]] = {
+    "json": lambda tmp: JSONSaver(os.path.join(tmp, "sessions.json")),
+    "sqlite": lambda tmp: SqliteSaver(os.path.join(tmp, "sessions.db")),
+    "lmdb": lambda tmp: LMDBSaver(
+        os.path.join(tmp, "sessions.lmdb"), map_size=max(SESSIONS * 2048, 1 << 26)
+    ),
+}
+
+
+def _session(i: int) -> Dict[str, Any]:
+    return {
+        "identifier": f"user{i}@example.com",
+        "password": "password",
+        "cookies": {"sp_dc": "x" * 400, "sp_key": "y" * 36, "sp_t": "z" * 32},
+    }
+
+
+SESSION_DATA = [_session(i) for i in range(SESSIONS)]
+IDENTIFIERS = [session["identifier"] for session in SESSION_DATA]
+
+
+@pytest.fixture(params=list(SAVERS))
+def make_saver(request, tmp_path_factory):
+    if request.param == "lmdb" and importlib.util.find_spec("lmdb") is None:
+        pytest.skip("lmdb is not installed")
+
+    savers = []
+
+    def make() -> Any:
+        savers.append(SAVERS[request.param](str(tmp_path_factory.mktemp("saver"))))
+        return savers[-1]
+
+    yield make
+    for saver in savers:
+        if hasattr(saver, "close"):
+            saver.close()
+
+
+@pytest.fixture
+def filled(make_saver):
+    saver = make_saver()
+    saver.save(SESSION_DATA)
+    return saver
+
+
+@pytest.mark.benchmark(group="saver save")
+def test_save(benchmark, make_saver):
+    # Every round saves into an empty store
+    benchmark.pedantic(
+        lambda saver: saver.save(SESSION_DATA),
+        setup=lambda: ((make_saver(),), {}),
+        rounds=3,
+    )
+
+
+@pytest.mark.benchmark(group="saver load")
+def test_load(benchmark, filled):
+    identifiers = itertools.cycle(random.Random(0).sample(IDENTIFIERS, 100))
+    benchmark(lambda: filled.load({"identifier": next(identifiers)}))
+
+
+@pytest.mark.benchmark(group="saver load_many")
+def test_load_many(benchmark, filled):
+    result = benchmark.pedantic(filled.load_many, args=(IDENTIFIERS,), rounds=3)
+    assert len(result) == SESSIONS
@@ -0,0 +1,53 @@
+"""
+Shared fixtures of the benchmark suite: the mock Spotify server and bootstrapped clients.
+
+Runs are saved to benchmarks/.benchmarks (see pytest.ini), wherever pytest is run from,
+so a run can be compared with the ones before it.
+"""
+
+import os
+
+import pytest
+
+from spotapi import client as client_module
+from spotapi.client import BaseClient
+from spotapi.http.request import TLSClient
+from spotapi.utils.mock_server import MockSpotifyServer
+
+STORAGE = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".benchmarks")
+
+# Tracks of the playlist paginated by bench_pagination.py
+PLAYLIST_TRACKS = 10_000
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Runs before pytest-benchmark reads its options
+    if getattr(config.option, "benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{STORAGE}"
+
+
+@pytest.fixture(scope="session")
+def server():
+    with MockSpotifyServer(playlist_tracks=PLAYLIST_TRACKS) as server:
+        secrets_url = client_module.SECRETS_URL
+        client_module.SECRETS_URL = server.secrets_url
+        try:
+            yield server
+        finally:
+            client_module.SECRETS_URL = secrets_url
+
+
+@pytest.fixture(scope="session")
+def make_client(server):
+    """Creates TLSClients talking to the mock server."""
+    return lambda: server.install(TLSClient("chrome120", "", auto_retries=1))
+
+
+@pytest.fixture(scope="session")
+def base(make_client):
+    """A BaseClient with its session, tokens and hashes loaded."""
+    base = BaseClient(make_client())
+    base.get_session()
+    base.get_client_token()
+    base.get_sha256_hash()
+    return base
@@ -16,6 +16,12 @@ __extras__ = {
     "websocket": ["websockets"],
     "redis": ["redis"],
     "pymongo": ["pymongo"],
+    "arrow": ["pyarrow"],
+    "orjson": ["orjson"],
+    "lmdb": ["lmdb"],
+    "msgpack": ["msgpack"],
+    "zstd": ["msgpack", "zstandard"],
+    "benchmark": ["pytest", "pytest-benchmark"],
 }
 
 with open("README.md", "r") as f:
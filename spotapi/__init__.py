@@ -13,6 +13,7 @@ from spotapi.utils.logger import *
 from spotapi.utils.saver import *
 from spotapi.websocket import *
 from spotapi.status import *
+from spotapi.hub import *
 from spotapi.player import *
 from spotapi.family import *
 from spotapi.http import *
@@ -2,7 +2,16 @@
 from spotapi.types.annotations import enforce
 
 import pytest
-from typing import List, Dict, Tuple, Sequence, Iterable, Mapping, Generator
+from typing import (
+    List,
+    Dict,
+    Literal,
+    Tuple,
+    Sequence,
+    Iterable,
+    Mapping,
+    Generator,
+)
 
 
 @enforce
@@ -51,6 +60,9 @@ class _TCLASS:
     ) -> None:
         pass
 
+    def test_literal_or_none(self, _: Literal["a", "b"] | None) -> None:
+        pass
+
 
 def test_int_pass():
     instance = _TCLASS()
@@ -222,3 +234,15 @@ def test_sequence_or_generator_fail():
     instance = _TCLASS()
     with pytest.raises(TypeError):
         instance.test_sequence_or_generator(iter([1, "string"]))
+
+
+def test_literal_or_none_pass():
+    instance = _TCLASS()
+    instance.test_literal_or_none("a")
+    instance.test_literal_or_none(None)
+
+
+def test_literal_or_none_fail():
+    instance = _TCLASS()
+    with pytest.raises(TypeError):
+        instance.test_literal_or_none("c")
@@ -0,0 +1,99 @@
+# type: ignore
+"""Unit tests for the file backed async savers."""
+
+import asyncio
+
+import pytest
+
+from spotapi.exceptions import SaverError
+from spotapi.types.interfaces import AsyncSaverProtocol
+from spotapi.utils.async_saver import AsyncJSONSaver, AsyncSqliteSaver
+
+
+def _session(i, password="pw"):
+    return {
+        "identifier": f"user{i}@example.com",
+        "password": password,
+        "cookies": {"sp_dc": f"cookie{i}"},
+    }
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def make_saver(request, tmp_path):
+    if request.param == "json":
+        return lambda: AsyncJSONSaver(str(tmp_path / "sessions.json"))
+    return lambda: AsyncSqliteSaver(str(tmp_path / "sessions.db"))
+
+
+def test_async_saver_crud(make_saver):
+    async def run():
+        async with make_saver() as saver:
+            assert isinstance(saver, AsyncSaverProtocol)
+
+            await saver.save([_session(i) for i in range(20)])
+            await saver.save([_session(3, password="new")])
+
+            loaded = await saver.load({"identifier": "user3@example.com"})
+            assert loaded == _session(3, password="new")
+
+            many = await saver.load_many(
+                ["user5@example.com", "missing@example.com", "user0@example.com"]
+            )
+            assert [item["identifier"] for item in many] == [
+                "user5@example.com",
+                "user0@example.com",
+            ]
+
+            every = [item async for item in saver.iter_all()]
+            assert len(every) == 20
+
+            await saver.delete({"identifier": "user3@example.com"})
+            with pytest.raises(SaverError):
+                await saver.load({"identifier": "user3@example.com"})
+
+    asyncio.run(run())
+
+
+def test_async_saver_runs_off_the_loop(make_saver):
+    ticks = []
+
+    async def ticker(stop):
+        while not stop.is_set():
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def run():
+        async with make_saver() as saver:
+            await saver.save([_session(i) for i in range(5000)])
+
+            stop = asyncio.Event()
+            task = asyncio.create_task(ticker(stop))
+            loaded = await saver.load_many(
+                [f"user{i}@example.com" for i in range(5000)]
+            )
+            stop.set()
+            await task
+            return loaded
+
+    assert len(asyncio.run(run())) == 5000
+    # The loop kept running while the sessions were read on the pool
+    assert len(ticks) > 1
+
+
+def test_async_sqlite_saver_pools_connections(tmp_path):
+    async def run():
+        async with AsyncSqliteSaver(
+            str(tmp_path / "sessions.db"), pool_size=3
+        ) as saver:
+            await saver.save([_session(i) for i in range(30)])
+            loads = await asyncio.gather(
+                *(saver.load({"identifier": f"user{i}@example.com"}) for i in range(30))
+            )
+            return loads, len(saver.saver._connections)
+
+    loads, connections = asyncio.run(run())
+    assert [item["identifier"] for item in loads] == [
+        f"user{i}@example.com" for i in range(30)
+    ]
+    # The constructor's connection, plus one per pool thread at most
+    assert connections <= 4
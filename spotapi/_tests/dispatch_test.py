@@ -0,0 +1,178 @@
+# type: ignore
+"""Unit tests for EventDispatcher and its use in EventManager."""
+
+import threading
+import time
+
+import pytest
+
+from spotapi.status import EventManager
+from spotapi.utils.dispatch import EventDispatcher
+
+
+@pytest.fixture
+def dispatcher():
+    instance = EventDispatcher(workers=4)
+    yield instance
+    instance.close(wait=False)
+
+
+def _gate():
+    """A subscriber that blocks until released, to fill mailboxes deterministically."""
+    release, started, seen = threading.Event(), threading.Event(), []
+
+    def func(value):
+        started.set()
+        release.wait(5)
+        seen.append(value)
+
+    return func, release, started, seen
+
+
+def test_slow_subscriber_does_not_block_others(dispatcher):
+    slow, release, started, _ = _gate()
+    fast = []
+    dispatcher.add("event", slow)
+    dispatcher.add("event", fast.append)
+
+    for i in range(5):
+        dispatcher.dispatch("event", i)
+
+    assert started.wait(1)
+    deadline = time.monotonic() + 1
+    while len(fast) < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # The fast subscriber got everything, in order, while the slow one is stuck
+    assert fast == [0, 1, 2, 3, 4]
+    release.set()
+    assert dispatcher.join(1)
+
+
+def test_drop_oldest(dispatcher):
+    func, release, started, seen = _gate()
+    dispatcher.add("event", func, maxsize=2, policy="drop_oldest")
+
+    dispatcher.dispatch("event", 0)
+    assert started.wait(1)
+    for i in range(1, 5):
+        dispatcher.dispatch("event", i)
+
+    release.set()
+    assert dispatcher.join(1)
+    assert seen == [0, 3, 4]
+
+    (stats,) = dispatcher.stats()
+    assert (stats.delivered, stats.dropped, stats.queued) == (3, 2, 0)
+    assert stats.latency.count == 3
+
+
+def test_coalesce_keeps_latest_per_key(dispatcher):
+    func, release, started, seen = _gate()
+    dispatcher.add(
+        "event", func, policy="coalesce", coalesce_key=lambda value: value[0]
+    )
+
+    dispatcher.dispatch("event", "x0")
+    assert started.wait(1)
+    for value in ("a1", "b1", "a2", "a3", "b2"):
+        dispatcher.dispatch("event", value)
+
+    release.set()
+    assert dispatcher.join(1)
+    assert seen == ["x0", "a3", "b2"]
+    assert dispatcher.stats()[0].coalesced == 3
+
+
+def test_block_applies_backpressure(dispatcher):
+    func, release, started, seen = _gate()
+    dispatcher.add("event", func, maxsize=1, policy="block")
+
+    dispatcher.dispatch("event", 0)
+    assert started.wait(1)
+    dispatcher.dispatch("event", 1)
+
+    producer = threading.Thread(target=dispatcher.dispatch, args=("event", 2))
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()  # waiting for room
+
+    release.set()
+    producer.join(1)
+    assert dispatcher.join(1)
+    assert seen == [0, 1, 2]
+    assert dispatcher.stats()[0].dropped == 0
+
+
+def test_async_subscriber_and_errors(dispatcher):
+    seen = []
+
+    async def on_event(value):
+        seen.append(value)
+
+    def broken(value):
+        raise RuntimeError("boom")
+
+    dispatcher.add("event", on_event)
+    dispatcher.add("event", broken)
+    dispatcher.dispatch("event", 1)
+    dispatcher.dispatch("other", 2)
+
+    assert dispatcher.join(1)
+    assert seen == [1]
+    stats = {s.subscriber: s for s in dispatcher.stats()}
+    assert stats["test_async_subscriber_and_errors.<locals>.broken"].errors == 1
+    assert (
+        "boom" in stats["test_async_subscriber_and_errors.<locals>.broken"].last_error
+    )
+
+
+@pytest.mark.parametrize("is_async", [False, True], ids=["sync", "async"])
+def test_close_from_a_subscriber(is_async):
+    dispatcher = EventDispatcher(workers=2)
+    seen, closed = [], threading.Event()
+
+    def on_event(value):
+        seen.append(value)
+        if value == 1:
+            dispatcher.close()
+            closed.set()
+
+    async def on_event_async(value):
+        on_event(value)
+
+    dispatcher.add("event", on_event_async if is_async else on_event)
+    for i in range(3):
+        dispatcher.dispatch("event", i)
+
+    assert closed.wait(1)
+    # Dispatched before the close, still delivered
+    assert dispatcher.join(1)
+    assert seen == [0, 1, 2]
+    assert dispatcher.stats()[0].errors == 0
+
+
+def test_event_manager_emits_through_dispatcher(dispatcher):
+    manager = object.__new__(EventManager)
+    manager.wlock = threading.Lock()
+    manager._subscriptions = {}
+    manager.dispatcher = dispatcher
+
+    seen = []
+
+    @manager.subscribe("PLAYER_STATE_CHANGED", policy="coalesce")
+    def on_state(payload):
+        seen.append(payload)
+
+    with pytest.raises(ValueError):
+        manager.subscribe("PLAYER_STATE_CHANGED")(on_state)
+
+    manager._emit("PLAYER_STATE_CHANGED", {"n": 1})
+    assert dispatcher.join(1)
+    assert seen == [{"n": 1}]
+
+    manager.unsubscribe("PLAYER_STATE_CHANGED", on_state)
+    manager._emit("PLAYER_STATE_CHANGED", {"n": 2})
+    assert dispatcher.join(1)
+    assert seen == [{"n": 1}]
+    assert manager.dispatch_stats() == []
@@ -0,0 +1,263 @@
+# type: ignore
+"""Unit tests for the PlayerState / Devices differ and the typed events of EventManager."""
+
+import queue
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from spotapi.status import ClusterMirror, EventManager
+from spotapi.types.data import Devices, PlayerState
+from spotapi.types.events import (
+    ContextChanged,
+    DeviceSwitched,
+    DevicesChanged,
+    OptionsChanged,
+    PlaybackPaused,
+    PlaybackResumed,
+    PlaybackStopped,
+    QueueChanged,
+    Seeked,
+    StateDiffer,
+    TrackChanged,
+    VolumeChanged,
+    diff_devices,
+    diff_player_state,
+)
+from spotapi.utils.dispatch import EventDispatcher
+
+
+def _state(**overrides):
+    data = {
+        "timestamp": "10000",
+        "context_uri": "spotify:playlist:a",
+        "track": {"uri": "spotify:track:1"},
+        "position_as_of_timestamp": "5000",
+        "is_playing": True,
+        "is_paused": False,
+        "queue_revision": "r1",
+        "next_tracks": [{"uri": "spotify:track:2"}, {"uri": "spotify:track:3"}],
+        "options": {"shuffling_context": False, "repeating_track": False},
+    }
+    data.update(overrides)
+    return PlayerState.from_dict(data)
+
+
+def _device(volume):
+    return {
+        "can_play": True,
+        "volume": volume,
+        "name": "device",
+        "capabilities": {},
+        "device_software_version": "1.0",
+        "device_type": "COMPUTER",
+        "device_id": "device",
+        "client_id": "client",
+        "brand": "spotify",
+        "model": "model",
+        "public_ip": "127.0.0.1",
+        "license": "premium",
+    }
+
+
+def _types(events):
+    return [type(event) for event in events]
+
+
+def test_identical_states_produce_nothing():
+    assert diff_player_state(_state(), _state()) == []
+
+
+def test_playback_drift_is_not_a_seek():
+    # 3s later and 3.5s further into the track
+    later = _state(timestamp="13000", position_as_of_timestamp="8500")
+    assert diff_player_state(_state(), later) == []
+
+
+def test_seek():
+    (event,) = diff_player_state(
+        _state(), _state(timestamp="11000", position_as_of_timestamp="60000")
+    )
+    assert isinstance(event, Seeked)
+    assert (event.from_ms, event.to_ms) == (6000, 60000)
+
+
+def test_pause_and_resume():
+    paused = _state(timestamp="12000", position_as_of_timestamp="7000", is_paused=True)
+    assert _types(diff_player_state(_state(), paused)) == [PlaybackPaused]
+
+    # Paused positions do not move, so resuming later is not a seek
+    resumed = _state(timestamp="90000", position_as_of_timestamp="7000")
+    (event,) = diff_player_state(paused, resumed)
+    assert isinstance(event, PlaybackResumed) and event.position_ms == 7000
+
+    assert _types(diff_player_state(resumed, _state(is_playing=False))) == [
+        PlaybackStopped
+    ]
+
+
+def test_next_track_is_not_a_queue_edit():
+    advanced = _state(
+        track={"uri": "spotify:track:2"},
+        queue_revision="r2",
+        next_tracks=[{"uri": "spotify:track:3"}],
+        position_as_of_timestamp="0",
+    )
+    (event,) = diff_player_state(_state(), advanced)
+    assert isinstance(event, TrackChanged)
+    assert (event.previous.uri, event.current.uri) == (
+        "spotify:track:1",
+        "spotify:track:2",
+    )
+
+
+def test_queue_edits():
+    edited = _state(
+        queue_revision="r2",
+        next_tracks=[{"uri": "spotify:track:3"}, {"uri": "spotify:track:9"}],
+    )
+    (event,) = diff_player_state(_state(), edited)
+    assert isinstance(event, QueueChanged)
+    assert (event.added, event.removed, event.reordered) == (
+        ["spotify:track:9"],
+        ["spotify:track:2"],
+        False,
+    )
+
+    reordered = _state(
+        queue_revision="r2",
+        next_tracks=[{"uri": "spotify:track:3"}, {"uri": "spotify:track:2"}],
+    )
+    assert diff_player_state(_state(), reordered)[0].reordered
+
+    # Same revision, the lists are not compared
+    assert diff_player_state(_state(), _state(next_tracks=[])) == []
+
+
+def test_context_and_options():
+    changed = _state(
+        context_uri="spotify:album:b",
+        options={"shuffling_context": True, "repeating_track": False},
+    )
+    context, options = diff_player_state(_state(), changed)
+    assert isinstance(context, ContextChanged)
+    assert context.current_uri == "spotify:album:b"
+    assert isinstance(options, OptionsChanged)
+    assert options.changes == {"shuffling_context": (False, True)}
+
+
+def test_devices():
+    before = Devices.from_dict({"a": _device(100), "b": _device(100)}, "a")
+    after = Devices.from_dict({"a": _device(50), "c": _device(100)}, "c")
+
+    switched, changed, volume = diff_devices(before, after)
+    assert isinstance(switched, DeviceSwitched)
+    assert (switched.previous_device_id, switched.current_device_id) == ("a", "c")
+    assert isinstance(changed, DevicesChanged)
+    assert (changed.added, changed.removed) == (["c"], ["b"])
+    assert isinstance(volume, VolumeChanged)
+    assert (volume.device_id, volume.previous, volume.current) == ("a", 100, 50)
+
+
+def test_differ_uses_first_snapshot_as_baseline():
+    differ = StateDiffer()
+    assert differ.update(_state()) == []
+    assert _types(differ.update(_state(track={"uri": "spotify:track:x"}))) == [
+        TrackChanged
+    ]
+
+
+@pytest.fixture
+def manager():
+    instance = object.__new__(EventManager)
+    instance.wlock = threading.Lock()
+    instance._subscriptions = {}
+    instance.dispatcher = EventDispatcher()
+    instance.differ = StateDiffer()
+    instance.mirror = ClusterMirror()
+    instance.mirror.reset(
+        {
+            "player_state": {"track": {"uri": "spotify:track:1"}, "is_playing": True},
+            "devices": {"a": _device(100)},
+            "active_device_id": "a",
+        }
+    )
+    instance.reader_thread = threading.Thread()
+    instance.reader_thread.is_alive = lambda: True
+    yield instance
+    instance.dispatcher.close(wait=False)
+
+
+def test_event_manager_emits_typed_events(manager):
+    tracks, raw = [], []
+
+    @manager.subscribe(TrackChanged)
+    def on_track(event):
+        tracks.append(event.current.uri)
+
+    manager.subscribe("PLAYER_STATE_CHANGED")(raw.append)
+
+    assert manager._wants_update(["DEVICE_STATE_CHANGED"])
+
+    cluster = {
+        "player_state": {"track": {"uri": "spotify:track:2"}, "is_playing": True},
+        "devices": {"a": _device(100)},
+        "active_device_id": "a",
+    }
+    manager._emit_changes(cluster)
+    assert manager.dispatcher.join(1)
+
+    # The baseline was taken from the mirror when subscribing
+    assert tracks == ["spotify:track:2"]
+    assert raw == []
+
+    manager.unsubscribe(TrackChanged, on_track)
+    assert not manager._has_state_subscribers()
+
+
+def test_event_manager_coalesces_and_closes_its_dispatcher(manager):
+    delivered, started, release = [], threading.Event(), threading.Event()
+
+    @manager.subscribe(
+        "PLAYER_STATE_CHANGED",
+        policy="coalesce",
+        coalesce_key=lambda payload: payload["uri"],
+    )
+    def on_state(payload):
+        started.set()
+        release.wait(1)
+        delivered.append(payload["n"])
+
+    manager._emit("PLAYER_STATE_CHANGED", {"uri": "a", "n": 0})
+    assert started.wait(1)
+    # The subscriber is busy, these wait in the mailbox
+    for n, uri in enumerate(["a", "b", "a"], 1):
+        manager._emit("PLAYER_STATE_CHANGED", {"uri": uri, "n": n})
+    release.set()
+
+    manager._outbox = queue.Queue()
+    manager.ws = SimpleNamespace(close=lambda: None)
+    manager.close()
+
+    # The last "a" took the place of the pending one, all were delivered before the close
+    assert delivered == [0, 3, 2]
+    assert manager.dispatcher._closed
+
+
+def test_event_manager_closes_from_a_subscriber(manager):
+    manager._outbox = queue.Queue()
+    manager.ws = SimpleNamespace(close=lambda: None)
+    seen = []
+
+    @manager.subscribe("PLAYER_STATE_CHANGED")
+    def stop_after_first(payload):
+        seen.append(payload)
+        manager.close()
+
+    manager._emit("PLAYER_STATE_CHANGED", {"n": 1})
+    assert manager.dispatcher.join(1)
+    manager._emit("PLAYER_STATE_CHANGED", {"n": 2})
+
+    assert seen == [{"n": 1}]
+    assert manager.dispatch_stats()[0].errors == 0
@@ -0,0 +1,118 @@
+# type: ignore
+"""Unit tests for the streaming exporters in spotapi.utils.export."""
+
+import dataclasses
+import json
+
+import pytest
+
+from spotapi.types.data import AlbumRecord, ArtistRecord, EpisodeRecord, TrackRecord
+from spotapi.utils import fastjson
+from spotapi.utils.export import SCHEMAS, NDJSONExporter, _Exporter, export_pages
+
+
+def _playlist_page(start, count):
+    items = []
+    for i in range(start, start + count):
+        items.append(
+            {
+                "uid": f"uid{i}",
+                "itemV2": {
+                    "data": {
+                        "uri": f"spotify:track:{i}",
+                        "name": f"Track {i}",
+                        "trackDuration": {"totalMilliseconds": 1000 + i},
+                        "artists": {
+                            "items": [
+                                {"uri": "spotify:artist:a", "profile": {"name": "A"}}
+                            ]
+                        },
+                    }
+                },
+            }
+        )
+    # A podcast episode inside a playlist must not end up in a track export
+    items.append({"uid": "ep", "itemV2": {"data": {"uri": "spotify:episode:e"}}})
+    return {"items": items, "totalCount": 0}
+
+
+@pytest.mark.parametrize(
+    "kind,record",
+    [
+        ("track", TrackRecord),
+        ("album", AlbumRecord),
+        ("artist", ArtistRecord),
+        ("episode", EpisodeRecord),
+    ],
+)
+def test_schema_matches_record(kind, record):
+    assert tuple(f.name for f in dataclasses.fields(record)) == tuple(
+        name for name, _ in SCHEMAS[kind]
+    )
+
+
+@pytest.mark.parametrize("orjson_enabled", [True, False])
+def test_ndjson_export_pages(tmp_path, monkeypatch, orjson_enabled):
+    if orjson_enabled and not fastjson.HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(fastjson, "HAS_ORJSON", orjson_enabled)
+    if not orjson_enabled:
+        monkeypatch.setattr(fastjson, "orjson", None)
+
+    path = tmp_path / "tracks.ndjson"
+    pages = (_playlist_page(start, 7) for start in (0, 7, 14))
+
+    with NDJSONExporter(str(path), "track", batch_size=5) as exporter:
+        exporter.write_pages(pages)
+
+    lines = path.read_text().splitlines()
+    assert exporter.rows == 21
+    assert exporter.skipped == 3
+    assert len(lines) == 21
+
+    first = json.loads(lines[0])
+    assert list(first) == [name for name, _ in SCHEMAS["track"]]
+    assert first["uri"] == "spotify:track:0"
+    assert first["artist_names"] == ["A"]
+    assert json.loads(lines[-1])["duration_ms"] == 1020
+
+
+def test_export_pages_accepts_item_lists(tmp_path):
+    path = tmp_path / "artists.ndjson"
+    page = [{"data": {"uri": "spotify:artist:a", "profile": {"name": "A"}}}]
+
+    rows = export_pages([page, page], str(path), "artist")
+
+    assert rows == 2
+    assert len(path.read_text().splitlines()) == 2
+
+
+def test_parquet_export(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "tracks.parquet"
+
+    rows = export_pages(
+        [_playlist_page(0, 10)], str(path), "track", format="parquet", batch_size=4
+    )
+    table = parquet.read_table(str(path))
+
+    assert rows == 10
+    assert table.num_rows == 10
+    assert table.column_names == [name for name, _ in SCHEMAS["track"]]
+
+
+def test_unknown_kind_and_format(tmp_path):
+    with pytest.raises(ValueError):
+        NDJSONExporter(str(tmp_path / "x"), "playlist")
+
+    with pytest.raises(ValueError):
+        export_pages([], str(tmp_path / "x"), "track", format="csv")
+
+
+def test_exporters_must_implement_the_writer(tmp_path):
+    class Partial(_Exporter):
+        def _write_batch(self, batch):
+            pass
+
+    with pytest.raises(TypeError, match="_close"):
+        Partial(str(tmp_path / "x"), "track")
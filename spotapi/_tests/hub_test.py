@@ -0,0 +1,171 @@
+# type: ignore
+"""Unit tests for DealerHub against a local dealer stand-in."""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from websockets.sync.server import serve
+
+from spotapi import websocket as websocket_module
+from spotapi.client import BaseClient
+from spotapi.http.request import TLSClient
+from spotapi.hub import DealerHub
+from spotapi.websocket import AsyncWebsocketStreamer
+
+
+def _payload(reason, account):
+    return json.dumps({"payloads": [{"update_reason": reason, "account": account}]})
+
+
+@pytest.fixture
+def dealer(monkeypatch):
+    def refresh(self, *, force=False):
+        self.access_token = self.client.headers["X-Test-Account"]
+
+    monkeypatch.setattr(BaseClient, "refresh_access_token", refresh)
+    monkeypatch.setattr(websocket_module, "_register_device", lambda *_: None)
+    monkeypatch.setattr(websocket_module, "_connect_device", lambda *_: {})
+
+    release = threading.Event()
+
+    def handler(ws):
+        account = ws.request.path.split("=")[1]
+        ws.send(json.dumps({"headers": {"Spotify-Connection-Id": account}}))
+        ws.send(json.dumps({"type": "pong"}))
+        if account == "malformed":
+            ws.send("{not json")
+        ws.send(_payload("DEVICE_STATE_CHANGED", account))
+        ws.send(_payload("PLAYER_STATE_CHANGED", account))
+        release.wait(5)
+
+    server = serve(handler, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        websocket_module,
+        "DEALER_URL",
+        f"ws://127.0.0.1:{server.socket.getsockname()[1]}/",
+    )
+    yield
+
+    release.set()
+    server.shutdown()
+    thread.join()
+
+
+def _login(name):
+    client = TLSClient("chrome_120", "")
+    client.headers["X-Test-Account"] = name
+    return SimpleNamespace(logged_in=True, client=client, identifier_credentials=name)
+
+
+def _wait(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out")
+        time.sleep(0.01)
+
+
+def test_routes_events_per_account(dealer):
+    received = []
+
+    with DealerHub(workers=2) as hub:
+        keys = [hub.add(_login(name)) for name in ("a", "b", "c")]
+        assert keys == ["a", "b", "c"]
+
+        @hub.subscribe("a", "PLAYER_STATE_CHANGED")
+        def on_a(payload):
+            received.append(("a", payload["account"]))
+
+        @hub.subscribe("b", "PLAYER_STATE_CHANGED")
+        async def on_b(payload):
+            received.append(("b", payload["account"]))
+
+        _wait(lambda: len(received) == 2)
+        assert sorted(received) == [("a", "a"), ("b", "b")]
+
+        _wait(lambda: hub.metrics().messages == 6)
+        metrics = hub.metrics()
+        assert metrics.accounts == metrics.connected == 3
+        # The pongs are skipped before decoding
+        assert metrics.account_messages == {"a": 2, "b": 2, "c": 2}
+        assert metrics.errors == {}
+        assert metrics.dispatch_lag.count == 2
+
+        hub.remove("c")
+        assert "c" not in hub
+        assert hub.metrics().accounts == 2
+
+
+def test_duplicate_account(dealer):
+    with DealerHub() as hub:
+        hub.add(_login("a"))
+        with pytest.raises(ValueError):
+            hub.add(_login("a"))
+
+
+def test_subscriber_errors_are_counted(dealer):
+    started = threading.Event()
+
+    with DealerHub(workers=2) as hub:
+        hub.add(_login("a"))
+
+        @hub.subscribe("a", "PLAYER_STATE_CHANGED")
+        def sync_fails(payload):
+            raise ValueError("sync")
+
+        @hub.subscribe("a", "PLAYER_STATE_CHANGED")
+        async def async_fails(payload):
+            raise ValueError("async")
+
+        @hub.subscribe("a", "PLAYER_STATE_CHANGED")
+        async def slow(payload):
+            started.set()
+            await asyncio.sleep(60)
+
+        _wait(lambda: hub.metrics().callback_errors == 2)
+        assert started.wait(5)
+        # The running subscriber is held by the hub until it ends
+        assert len(hub._accounts["a"].callbacks) == 1
+
+
+def test_malformed_frames_are_skipped(dealer):
+    received = []
+
+    with DealerHub() as hub:
+        hub.add(_login("malformed"))
+        hub.subscribe("malformed", "PLAYER_STATE_CHANGED")(received.append)
+
+        _wait(lambda: hub.metrics().messages == 2)
+        assert hub.streamer("malformed").frames_skipped == 1
+        metrics = hub.metrics()
+        assert metrics.connected == 1
+        assert metrics.errors == {}
+
+
+def test_stream_failures_reconnect(dealer, monkeypatch):
+    recv = AsyncWebsocketStreamer._recv
+    calls = []
+
+    async def fail_once(self):
+        calls.append(self)
+        # The first call reads the init packet, the second one fails
+        if len(calls) == 2:
+            raise RuntimeError("boom")
+        return await recv(self)
+
+    monkeypatch.setattr(AsyncWebsocketStreamer, "_recv", fail_once)
+
+    with DealerHub() as hub:
+        hub.add(_login("a"))
+
+        _wait(lambda: hub.metrics().messages == 2)
+        metrics = hub.metrics()
+        assert metrics.reconnects == 1
+        assert metrics.connected == 1
+        assert metrics.errors == {"a": "RuntimeError('boom')"}
@@ -0,0 +1,144 @@
+# type: ignore
+"""Unit tests for the lazily parsed LazyPlayerState / LazyDevices."""
+
+import copy
+import json
+
+import pytest
+
+from spotapi.types import data as data_module
+from spotapi.types.data import (
+    Devices,
+    LazyDevices,
+    LazyPlayerState,
+    PlayerState,
+)
+from spotapi.types.events import QueueChanged, diff_devices, diff_player_state
+
+
+def _raw_state(queue=50):
+    return {
+        "timestamp": "1000",
+        "is_paused": True,
+        "is_playing": True,
+        "queue_revision": "r1",
+        "track": {"uri": "spotify:track:current", "metadata": {"title": "t"}},
+        "options": {"shuffling_context": True},
+        "index": {"page": 0, "track": 3},
+        "next_tracks": [{"uri": f"spotify:track:{i}"} for i in range(queue)],
+        "prev_tracks": [{"uri": "spotify:track:prev"}],
+    }
+
+
+def _device(volume):
+    return {
+        "can_play": True,
+        "volume": volume,
+        "name": "device",
+        "capabilities": {"can_be_player": True},
+        "device_software_version": "1.0",
+        "device_type": "COMPUTER",
+        "device_id": "device",
+        "client_id": "client",
+        "brand": "spotify",
+        "model": "model",
+        "public_ip": "127.0.0.1",
+        "license": "premium",
+    }
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """Counts the tracks and devices parsed."""
+    counts = {"track": 0, "device": 0}
+    track_from_dict = data_module.Track.from_dict.__func__
+    device_from_dict = data_module.Device.from_dict
+
+    def count_track(cls, data):
+        counts["track"] += 1
+        return track_from_dict(cls, data)
+
+    def count_device(data):
+        counts["device"] += 1
+        return device_from_dict(data)
+
+    monkeypatch.setattr(data_module.Track, "from_dict", classmethod(count_track))
+    monkeypatch.setattr(data_module.Device, "from_dict", staticmethod(count_device))
+    return counts
+
+
+def test_scalar_reads_parse_nothing(parsed):
+    state = LazyPlayerState.from_dict(_raw_state())
+
+    assert state.is_paused is True
+    assert state.queue_revision == "r1"
+    assert len(state.next_tracks) == 50
+    assert parsed["track"] == 0
+
+    assert state.track.uri == "spotify:track:current"
+    assert state.track is state.track
+    assert state.next_tracks[10].uri == "spotify:track:10"
+    assert parsed["track"] == 2
+
+
+def test_matches_eager_parsing():
+    lazy = LazyPlayerState.from_dict(_raw_state())
+    eager = PlayerState.from_dict(_raw_state())
+
+    for name in PlayerState.__annotations__:
+        assert getattr(lazy, name) == getattr(eager, name), name
+
+    assert lazy.to_player_state() == eager
+    assert LazyPlayerState.from_dict({}).next_tracks == []
+
+
+def test_parsing_leaves_the_raw_payload_serializable():
+    # The cluster is shared with the raw update_reason subscribers
+    payload = {"update_reason": "DEVICE_STATE_CHANGED", "cluster": {}}
+    payload["cluster"]["player_state"] = _raw_state(queue=3)
+    before = copy.deepcopy(payload)
+
+    lazy = LazyPlayerState.from_dict(payload["cluster"]["player_state"])
+    assert lazy.track.metadata.title == "t"
+    assert [track.uri for track in lazy.next_tracks] == [
+        f"spotify:track:{i}" for i in range(3)
+    ]
+    lazy.to_player_state()
+    PlayerState.from_dict(payload["cluster"]["player_state"])
+
+    assert json.loads(json.dumps(payload)) == before
+
+
+def test_lazy_devices(parsed):
+    raw = {"a": _device(10), "b": _device(20)}
+    devices = LazyDevices.from_dict(raw, "a")
+
+    assert devices.active_device_id == "a"
+    assert list(devices.devices) == ["a", "b"]
+    assert devices.volume("b") == 20
+    assert parsed["device"] == 0
+
+    assert devices.devices["a"].capabilities.can_be_player is True
+    assert parsed["device"] == 1
+    assert devices.to_devices() == Devices.from_dict(raw, "a")
+
+
+def test_differ_compares_queues_without_parsing(parsed):
+    before = LazyPlayerState.from_dict(_raw_state(300))
+    raw = _raw_state(300)
+    raw["queue_revision"] = "r2"
+    raw["next_tracks"].append({"uri": "spotify:track:new"})
+    after = LazyPlayerState.from_dict(raw)
+
+    (event,) = diff_player_state(before, after)
+    assert isinstance(event, QueueChanged) and event.added == ["spotify:track:new"]
+
+    raw_devices = {"a": _device(10)}
+    changed = {"a": _device(30)}
+    (volume,) = diff_devices(
+        LazyDevices.from_dict(raw_devices, "a"), LazyDevices.from_dict(changed, "a")
+    )
+    assert (volume.previous, volume.current) == (10, 30)
+
+    # Only the current tracks were parsed, none of the 600 queued ones
+    assert parsed == {"track": 2, "device": 0}
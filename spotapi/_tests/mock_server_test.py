@@ -0,0 +1,126 @@
+# type: ignore
+"""Tests for the public classes against the local mock Spotify server."""
+
+import json
+import time
+
+import pytest
+import requests
+
+from spotapi import client as client_module
+from spotapi.album import AlbumError, PublicAlbum
+from spotapi.http.request import TLSClient
+from spotapi.playlist import PublicPlaylist
+from spotapi.song import Song
+from spotapi.types.data import TrackRecord
+from spotapi.utils.mock_server import MockSpotifyServer
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with MockSpotifyServer(playlist_tracks=700) as server:
+        monkeypatch.setattr(client_module, "SECRETS_URL", server.secrets_url)
+        monkeypatch.setattr(client_module, "_secret_cache", None)
+        yield server
+
+
+def _client(server):
+    return server.install(TLSClient("chrome120", "", auto_retries=1))
+
+
+def test_redirects_only_the_listed_hosts():
+    client = TLSClient("chrome120", "")
+    client.redirects["open.spotify.com"] = "http://127.0.0.1:1/open.spotify.com"
+
+    assert client._redirect("https://open.spotify.com") == (
+        "http://127.0.0.1:1/open.spotify.com"
+    )
+    assert client._redirect("https://open.spotify.com/api/token?a=1") == (
+        "http://127.0.0.1:1/open.spotify.com/api/token?a=1"
+    )
+    assert client._redirect("https://spclient.wg.spotify.com/x") == (
+        "https://spclient.wg.spotify.com/x"
+    )
+
+
+def test_public_classes_paginate_offline(server):
+    client = _client(server)
+
+    playlist = PublicPlaylist("37i9dQZF1DXcBWIGoYBM5M", client=client)
+    items = [item for page in playlist.paginate_playlist() for item in page["items"]]
+    assert len(items) == 700
+    assert len({item["itemV2"]["data"]["uri"] for item in items}) == 700
+    assert TrackRecord.from_item(items[0]).artist_names == ("Artist 0",)
+
+    album = list(PublicAlbum("4aawyAB9vmqN3uQ7FjRGTy", client=client).paginate_album())
+    assert sum(map(len, album)) == 30
+
+    songs = Song(client=client).query_songs("weezer", limit=10)
+    assert songs["data"]["searchV2"]["tracksV2"]["totalCount"] == 250
+    assert len(songs["data"]["searchV2"]["tracksV2"]["items"]) == 10
+
+    # Every object bootstraps its own session, the hashes come from the chunks
+    assert server.hits["html"] == 3
+    assert server.hits["chunk"] == 6
+    assert server.hits["fetchPlaylist"] == 3
+    assert set(server.statuses) == {200}
+
+
+def test_injected_429_then_recovery(server):
+    album = PublicAlbum("4aawyAB9vmqN3uQ7FjRGTy", client=_client(server))
+    album.get_album_info()
+
+    server.fail(429, route="getAlbum")
+    with pytest.raises(AlbumError) as exc:
+        album.get_album_info()
+    assert "429" in str(exc.value.error)
+
+    assert album.get_album_info()["data"]["albumUnion"]["tracksV2"]["totalCount"] == 30
+    assert server.statuses[429] == 1
+
+
+def test_revoked_tokens_are_refreshed(server):
+    playlist = PublicPlaylist("37i9dQZF1DXcBWIGoYBM5M", client=_client(server))
+    playlist.get_playlist_info()
+    assert server.hits["token"] == 1
+
+    server.revoke_tokens()
+    playlist.get_playlist_info()
+    assert server.statuses[401] == 1
+    assert server.hits["token"] == 2
+
+    server.revoke_client_tokens()
+    playlist.get_playlist_info()
+    assert server.statuses[400] == 1
+    assert server.hits["clienttoken"] == 2
+
+
+def test_random_faults_are_seeded():
+    def statuses(seed):
+        with MockSpotifyServer(error_rate=0.2, rate_limit=0.2, seed=seed) as server:
+            return [
+                requests.get(f"{server.url}/open.spotify.com").status_code
+                for _ in range(40)
+            ]
+
+    first = statuses(7)
+    assert first == statuses(7)
+    assert {200, 429, 500} == set(first)
+
+
+def test_latency():
+    with MockSpotifyServer(latency=(0.05, 0.06)) as server:
+        start = time.perf_counter()
+        requests.get(f"{server.url}/open.spotify.com/api/token")
+        assert time.perf_counter() - start >= 0.05
+
+
+def test_recorded_fixtures(server, tmp_path):
+    recorded = {
+        "data": {"playlistV2": {"content": {"totalCount": 1, "items": [{"uid": "u"}]}}}
+    }
+    (tmp_path / "fetchPlaylist.json").write_text(json.dumps(recorded))
+
+    with MockSpotifyServer(fixtures=str(tmp_path)) as recorded_server:
+        playlist = PublicPlaylist("x", client=_client(recorded_server))
+        assert playlist.get_playlist_info() == recorded
@@ -0,0 +1,178 @@
+# type: ignore
+"""Unit tests for the pipelined and bulk queue commands of Player, against a fake connect-state."""
+
+import copy
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from spotapi.exceptions import PlayerError
+from spotapi.player import Player
+from spotapi.status import ClusterMirror
+
+
+def _cluster(next_tracks, revision="1", timestamp=1000):
+    return {
+        "timestamp": str(timestamp),
+        "active_device_id": "phone",
+        "player_state": {
+            "timestamp": str(timestamp),
+            "track": {"uri": "spotify:track:now"},
+            "next_tracks": next_tracks,
+            "prev_tracks": [],
+            "queue_revision": revision,
+        },
+        "devices": {},
+    }
+
+
+class FakeConnectState:
+    """Answers commands after `latency` and pushes the resulting cluster to the mirror."""
+
+    def __init__(self, mirror, next_tracks, *, latency=0.02, ack=True):
+        self.mirror = mirror
+        self.latency = latency
+        self.ack = ack
+        self.commands = []
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.cluster = _cluster(next_tracks)
+        mirror.reset(copy.deepcopy(self.cluster))
+
+    def post(self, url, json=None, authenticate=False):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        time.sleep(self.latency)
+        command = json["command"]
+
+        with self.lock:
+            self.in_flight -= 1
+            self.commands.append(command)
+            state = self.cluster["player_state"]
+
+            if command["endpoint"] == "add_to_queue":
+                queued = [t for t in state["next_tracks"] if t["provider"] == "queue"]
+                state["next_tracks"].insert(len(queued), command["track"])
+            elif command["endpoint"] == "set_queue":
+                assert command["queue_revision"] == state["queue_revision"]
+                state["next_tracks"] = command["next_tracks"]
+
+            state["queue_revision"] = str(int(state["queue_revision"]) + 1)
+            self.cluster["timestamp"] = str(int(self.cluster["timestamp"]) + 1)
+            pushed = copy.deepcopy(self.cluster)
+
+        if self.ack:
+            # The dealer push arrives after the HTTP response
+            threading.Timer(self.latency, self.mirror.apply, (pushed,)).start()
+
+        return SimpleNamespace(fail=False)
+
+
+@pytest.fixture
+def player():
+    instance = object.__new__(Player)
+    instance.mirror = ClusterMirror()
+    instance.reader_thread = SimpleNamespace(is_alive=lambda: True)
+    instance.device_id = "local"
+    instance.active_id = "phone"
+    return instance
+
+
+def _context(*names):
+    return [{"uri": f"spotify:track:{name}", "provider": "context"} for name in names]
+
+
+def _uris(tracks):
+    return [track["uri"] for track in tracks]
+
+
+def test_add_many_ordered_is_one_set_queue(player):
+    queued = {"uri": "spotify:track:q0", "provider": "queue", "metadata": {}}
+    server = FakeConnectState(player.mirror, [queued] + _context("c1", "c2"))
+    player.client = server
+
+    player.add_many_to_queue(["a", "spotify:track:b", "c"])
+
+    assert [c["endpoint"] for c in server.commands] == ["set_queue"]
+    assert _uris(player.mirror.cluster["player_state"]["next_tracks"]) == [
+        "spotify:track:q0",
+        "spotify:track:a",
+        "spotify:track:b",
+        "spotify:track:c",
+        "spotify:track:c1",
+        "spotify:track:c2",
+    ]
+
+
+def test_set_queue_replaces_queued_tracks(player):
+    queued = {"uri": "spotify:track:old", "provider": "queue", "metadata": {}}
+    server = FakeConnectState(player.mirror, [queued] + _context("c1"))
+    player.client = server
+
+    player.set_queue(["x", "y"])
+
+    assert _uris(player.mirror.cluster["player_state"]["next_tracks"]) == [
+        "spotify:track:x",
+        "spotify:track:y",
+        "spotify:track:c1",
+    ]
+
+
+def test_add_many_unordered_is_pipelined(player):
+    server = FakeConnectState(player.mirror, _context("c1"), latency=0.05)
+    player.client = server
+    tracks = [f"t{i}" for i in range(16)]
+
+    start = time.perf_counter()
+    player.add_many_to_queue(tracks, ordered=False, workers=8)
+    elapsed = time.perf_counter() - start
+
+    assert len(server.commands) == 16
+    assert server.max_in_flight <= 8
+    # Sequential would be 16 round trips
+    assert elapsed < 16 * 0.05
+    queued = _uris(player.mirror.cluster["player_state"]["next_tracks"])[:16]
+    assert sorted(queued) == sorted(f"spotify:track:{t}" for t in tracks)
+
+
+def test_unconfirmed_queue_raises(player):
+    server = FakeConnectState(player.mirror, _context("c1"), ack=False)
+    player.client = server
+
+    with pytest.raises(PlayerError):
+        player.add_many_to_queue(["a"], timeout=0.1)
+
+
+def test_foreign_queue_change_is_not_a_confirmation(player):
+    server = FakeConnectState(player.mirror, _context("c1"), ack=False)
+    player.client = server
+
+    # Another device queues a track, the revision changes but not to our queue
+    foreign = _cluster(
+        [{"uri": "spotify:track:other", "provider": "queue"}] + _context("c1"),
+        revision="2",
+        timestamp=2000,
+    )
+    threading.Timer(0.02, player.mirror.apply, (foreign,)).start()
+
+    with pytest.raises(PlayerError):
+        player.set_queue(["a", "b"], timeout=0.2)
+
+
+def test_pipeline_reports_errors(player):
+    def post(url, json=None, authenticate=False):
+        return SimpleNamespace(fail=True, error=SimpleNamespace(string="rejected"))
+
+    player.client = SimpleNamespace(post=post)
+
+    with player.pipeline(workers=2) as pipeline:
+        for _ in range(3):
+            pipeline.submit({"command": {"endpoint": "pause"}})
+        errors = pipeline.join()
+
+    assert len(errors) == 3
+    assert all(isinstance(error, PlayerError) for error in errors)
@@ -0,0 +1,144 @@
+# type: ignore
+"""Unit tests for the Player start up round trips, against a local dealer stand-in."""
+
+import json
+import queue
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from websockets.sync.server import serve
+
+from spotapi import websocket as websocket_module
+from spotapi.client import BaseClient
+from spotapi.http.request import TLSClient
+from spotapi.player import Player
+from spotapi.status import EventManager
+
+
+def _cluster():
+    return {
+        "timestamp": "1000",
+        "active_device_id": "phone",
+        "player_state": {
+            "timestamp": "1000",
+            "is_paused": True,
+            "play_origin": {"device_identifier": "origin"},
+            "track": {"uri": "spotify:track:now", "metadata": {}},
+            "next_tracks": [{"uri": "spotify:track:next"}],
+        },
+        "devices": {},
+    }
+
+
+@pytest.fixture
+def spotify(monkeypatch):
+    monkeypatch.setattr(
+        BaseClient, "get_session", lambda self: setattr(self, "access_token", "tok")
+    )
+    monkeypatch.setattr(BaseClient, "get_client_token", lambda self: None)
+    monkeypatch.setattr(websocket_module.signal, "signal", lambda *_: None)
+
+    calls = SimpleNamespace(
+        sockets=0, registers=0, fetches=0, transfers=[], outgoing=queue.Queue()
+    )
+    closed = threading.Event()
+
+    def register(*_):
+        calls.registers += 1
+
+    def connect_device(*_):
+        calls.fetches += 1
+        return _cluster()
+
+    def post(self, url, json=None, authenticate=False):
+        calls.transfers.append((url.split("/")[-3], url.split("/")[-1], json))
+        return SimpleNamespace(fail=False)
+
+    monkeypatch.setattr(websocket_module, "_register_device", register)
+    monkeypatch.setattr(websocket_module, "_connect_device", connect_device)
+    monkeypatch.setattr(TLSClient, "post", post)
+
+    def handler(ws):
+        calls.sockets += 1
+        ws.send(json.dumps({"headers": {"Spotify-Connection-Id": "conn"}}))
+        while not closed.is_set():
+            try:
+                ws.send(calls.outgoing.get(timeout=0.05))
+            except queue.Empty:
+                pass
+
+    server = serve(handler, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        websocket_module,
+        "DEALER_URL",
+        f"ws://127.0.0.1:{server.socket.getsockname()[1]}/",
+    )
+    yield calls
+
+    closed.set()
+    server.shutdown()
+    thread.join()
+
+
+def _login():
+    return SimpleNamespace(logged_in=True, client=TLSClient("chrome_120", ""))
+
+
+def test_startup_fetches_the_cluster_once(spotify):
+    player = Player(_login())
+
+    assert (spotify.sockets, spotify.registers, spotify.fetches) == (1, 1, 1)
+    assert spotify.transfers == [
+        ("origin", "phone", spotify.transfers[0][2]),
+    ]
+    assert spotify.transfers[0][2]["transfer_options"]["restore_paused"] == "pause"
+    assert (player.device_id, player.active_id) == ("origin", "phone")
+    player.close()
+
+
+def test_attach_to_an_event_manager(spotify):
+    manager = EventManager(_login())
+    assert (spotify.sockets, spotify.fetches) == (1, 1)
+
+    player = Player(_login(), "desktop", status=manager)
+
+    # Only the transfer, on the manager's connection and mirror
+    assert (spotify.sockets, spotify.registers, spotify.fetches) == (1, 1, 1)
+    assert [transfer[:2] for transfer in spotify.transfers] == [("origin", "desktop")]
+    assert player.mirror is manager.mirror
+    assert player.ws is manager.ws
+    # The manager keeps its own registered device
+    assert manager.device_id != player.device_id
+    manager.close()
+
+
+def test_closing_an_attached_player_keeps_the_manager_streaming(spotify):
+    manager = EventManager(_login())
+    player = Player(_login(), "desktop", status=manager)
+    player.close()
+
+    cluster = _cluster()
+    cluster["timestamp"] = "2000"
+    cluster["player_state"]["track"]["uri"] = "spotify:track:later"
+    spotify.outgoing.put(
+        json.dumps(
+            {
+                "payloads": [
+                    {"cluster": cluster, "update_reason": "PLAYER_STATE_CHANGED"}
+                ]
+            }
+        )
+    )
+
+    deadline = time.monotonic() + 2
+    while manager.mirror.updates == 0:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert manager.reader_thread.is_alive()
+    assert manager.state.track.uri == "spotify:track:later"
+    manager.close()
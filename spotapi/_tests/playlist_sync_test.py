@@ -0,0 +1,122 @@
+# type: ignore
+"""Unit tests for PlaylistSync. spclient is replaced by an in-memory playlist."""
+
+import pytest
+
+from spotapi.http.request import TLSClient
+from spotapi.playlist import PlaylistSync
+
+
+def _item(n):
+    return {"uri": f"spotify:track:{n}", "attributes": {"itemId": f"id{n}"}}
+
+
+class _FakeServer:
+    def __init__(self, count):
+        self.revision = "rev1"
+        self.items = [_item(n) for n in range(count)]
+        self.ops = {}  # from revision -> ops
+        self.downloads = 0
+
+    def contents(self, playlist, limit=100, *, offset=0):
+        if offset == 0:
+            self.downloads += 1
+        return {
+            "revision": self.revision,
+            "length": len(self.items),
+            "contents": {"items": self.items[offset : offset + limit]},
+        }
+
+    def diff(self, playlist, revision):
+        if revision not in self.ops:
+            return None
+        return {"diff": {"toRevision": self.revision, "ops": self.ops[revision]}}
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = _FakeServer(1200)
+    monkeypatch.setattr(PlaylistSync, "get_contents", server.contents)
+    monkeypatch.setattr(PlaylistSync, "get_diff", server.diff)
+    return server
+
+
+def _sync(path=None):
+    return PlaylistSync(client=TLSClient("chrome120", "", auto_retries=1), path=path)
+
+
+def test_first_sync_downloads_everything(server):
+    changes = _sync().sync("spotify:playlist:abc")
+
+    assert changes.full_resync is True
+    assert changes.from_revision is None
+    assert len(changes.added) == 1200
+    assert changes.added[0] == (0, "id0", "spotify:track:0")
+
+
+def test_incremental_sync_applies_diff(server):
+    sync = _sync()
+    sync.sync("abc")
+
+    # Remove entry 1, append a new one, then move entry 10 to the front
+    server.ops["rev1"] = [
+        {"kind": "REM", "rem": {"fromIndex": 1, "length": 1, "items": [_item(1)]}},
+        {"kind": "ADD", "add": {"fromIndex": 1199, "items": [_item(5000)]}},
+        {"kind": "MOV", "mov": {"fromIndex": 9, "length": 1, "toIndex": 0}},
+    ]
+    server.revision = "rev2"
+    changes = sync.sync("abc")
+
+    assert server.downloads == 1
+    assert changes.full_resync is False
+    assert changes.from_revision == "rev1"
+    assert changes.to_revision == "rev2"
+    assert changes.removed == [("id1", "spotify:track:1")]
+    assert changes.added == [(1199, "id5000", "spotify:track:5000")]
+    assert changes.moved == [(10, 0, "id10", "spotify:track:10")]
+
+    items = sync.snapshot("abc").items
+    assert items[:3] == [
+        ("id10", "spotify:track:10"),
+        ("id0", "spotify:track:0"),
+        ("id2", "spotify:track:2"),
+    ]
+    assert len(items) == 1200
+
+
+def test_unknown_revision_falls_back_to_full_download(server):
+    sync = _sync()
+    sync.sync("abc")
+
+    server.items = server.items[5:]
+    server.revision = "rev9"
+    changes = sync.sync("abc")
+
+    assert server.downloads == 2
+    assert changes.full_resync is True
+    assert [uid for uid, _ in changes.removed] == [f"id{n}" for n in range(5)]
+    assert changes.added == []
+
+
+def test_out_of_range_diff_falls_back(server):
+    sync = _sync()
+    sync.sync("abc")
+
+    server.ops["rev1"] = [{"kind": "REM", "rem": {"fromIndex": 5000, "length": 1}}]
+    server.revision = "rev2"
+    changes = sync.sync("abc")
+
+    assert changes.full_resync is True
+    assert server.downloads == 2
+
+
+def test_snapshots_are_persisted(server, tmp_path):
+    path = str(tmp_path / "snapshots.json")
+    _sync(path).sync("abc")
+
+    server.ops["rev1"] = []
+    changes = _sync(path).sync("abc")
+
+    assert server.downloads == 1
+    assert changes.full_resync is False
+    assert not changes.changed
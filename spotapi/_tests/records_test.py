@@ -0,0 +1,134 @@
+# type: ignore
+"""Unit tests for the slotted catalog records in spotapi.types.data."""
+
+import pytest
+
+from spotapi.types.data import AlbumRecord, ArtistRecord, EpisodeRecord, TrackRecord
+
+_ARTISTS = {
+    "items": [
+        {"uri": "spotify:artist:a1", "profile": {"name": "Artist One"}},
+        {"uri": "spotify:artist:a2", "profile": {"name": "Artist Two"}},
+    ]
+}
+
+
+def _track(duration_key="trackDuration"):
+    return {
+        "__typename": "Track",
+        "uri": "spotify:track:t1",
+        "name": "Song",
+        duration_key: {"totalMilliseconds": 201000},
+        "playcount": "12345",
+        "albumOfTrack": {"uri": "spotify:album:al1", "name": "Album"},
+        "artists": _ARTISTS,
+        "contentRating": {"label": "EXPLICIT"},
+        "playability": {"playable": True},
+        "discNumber": 1,
+        "trackNumber": 3,
+    }
+
+
+def test_track_from_playlist_item():
+    item = {
+        "uid": "abc123",
+        "addedAt": {"isoString": "2024-01-01T00:00:00Z"},
+        "itemV2": {"__typename": "TrackResponseWrapper", "data": _track()},
+    }
+    record = TrackRecord.from_item(item)
+
+    assert record.uri == "spotify:track:t1"
+    assert record.duration_ms == 201000
+    assert record.artist_names == ("Artist One", "Artist Two")
+    assert record.artist_uris == ("spotify:artist:a1", "spotify:artist:a2")
+    assert record.album_uri == "spotify:album:al1"
+    assert record.explicit is True
+    assert record.playcount == 12345
+    assert record.track_number == 3
+    assert record.uid == "abc123"
+    assert record.added_at == "2024-01-01T00:00:00Z"
+
+
+def test_track_from_album_item_inherits_album():
+    album = AlbumRecord.from_dict(
+        {
+            "uri": "spotify:album:al9",
+            "name": "Parent",
+            "type": "ALBUM",
+            "artists": _ARTISTS,
+            "date": {"isoString": "2020-05-01T00:00:00Z"},
+            "tracksV2": {"totalCount": 12},
+            "coverArt": {
+                "sources": [
+                    {"url": "small", "width": 64},
+                    {"url": "large", "width": 640},
+                ]
+            },
+        }
+    )
+    track = _track("duration")
+    del track["albumOfTrack"]
+    record = TrackRecord.from_item({"uid": "u1", "track": track}, album=album)
+
+    assert album.total_tracks == 12
+    assert album.cover_url == "large"
+    assert album.release_date == "2020-05-01T00:00:00Z"
+    assert record.duration_ms == 201000
+    assert record.album_uri == "spotify:album:al9"
+    assert record.album_name == "Parent"
+    assert record.uid == "u1"
+
+
+def test_search_items():
+    track = TrackRecord.from_item({"item": {"data": _track("duration")}})
+    album = AlbumRecord.from_item(
+        {"data": {"uri": "spotify:album:al1", "name": "A", "date": {"year": 1999}}}
+    )
+    artist = ArtistRecord.from_item(
+        {
+            "data": {
+                "uri": "spotify:artist:a1",
+                "profile": {"name": "Artist One", "verified": True},
+                "visuals": {"avatarImage": {"sources": [{"url": "img", "width": 1}]}},
+            }
+        }
+    )
+
+    assert track.name == "Song"
+    assert album.release_date == "1999"
+    assert artist.name == "Artist One"
+    assert artist.verified is True
+    assert artist.image_url == "img"
+
+
+def test_episode_from_item():
+    episode = {
+        "uri": "spotify:episode:e1",
+        "name": "Episode",
+        "duration": {"totalMilliseconds": 60000},
+        "podcastV2": {"data": {"uri": "spotify:show:s1", "name": "Show"}},
+        "releaseDate": {"isoString": "2023-03-03T00:00:00Z"},
+    }
+    from_playlist = EpisodeRecord.from_item({"uid": "u2", "itemV2": {"data": episode}})
+    from_show = EpisodeRecord.from_item({"entity": {"data": episode}})
+
+    assert from_playlist.uid == "u2"
+    assert from_playlist.show_uri == "spotify:show:s1"
+    assert from_show.duration_ms == 60000
+    assert from_show.explicit is False
+
+
+def test_records_are_slotted():
+    record = TrackRecord(uri="spotify:track:t1", name="Song")
+
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.unknown = 1
+
+
+def test_missing_fields_are_tolerated():
+    record = TrackRecord.from_item({"itemV2": {"data": {"uri": "spotify:track:t"}}})
+
+    assert record.name == ""
+    assert record.duration_ms is None
+    assert record.artist_names == ()
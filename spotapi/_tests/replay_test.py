@@ -0,0 +1,101 @@
+# type: ignore
+"""Unit tests for recording dealer sessions and replaying them from a local server."""
+
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from spotapi import websocket as websocket_module
+from spotapi.client import BaseClient
+from spotapi.http.request import TLSClient
+from spotapi.utils.replay import DealerRecorder, DealerReplayServer, load_recording
+from spotapi.websocket import WebsocketStreamer
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    monkeypatch.setattr(
+        BaseClient, "get_session", lambda self: setattr(self, "access_token", "tok")
+    )
+    monkeypatch.setattr(BaseClient, "get_client_token", lambda self: None)
+    monkeypatch.setattr(websocket_module.signal, "signal", lambda *_: None)
+
+
+def _frame(i):
+    return json.dumps(
+        {"type": "message", "uri": "hm://test", "payloads": [{"n": i}]},
+        separators=(",", ":"),
+    )
+
+
+def _streamer(url):
+    login = SimpleNamespace(logged_in=True, client=TLSClient("chrome_120", ""))
+    return WebsocketStreamer(login, dealer_url=url)
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+def test_record_then_replay(tmp_path, suffix):
+    path = str(tmp_path / f"session{suffix}")
+    # Leave time to attach the recorder before the first frame
+    frames = [(0.2 + i * 0.01, _frame(i)) for i in range(5)]
+
+    with DealerReplayServer(frames, speed=1.0) as server:
+        streamer = _streamer(server.url)
+        assert streamer.connection_id == "replay-0"
+
+        with DealerRecorder(path) as recorder:
+            recorder.attach(streamer)
+            packets = [streamer.get_packet() for _ in range(5)]
+
+        streamer.close()
+
+    assert [p["payloads"][0]["n"] for p in packets] == [0, 1, 2, 3, 4]
+
+    recording = load_recording(path)
+    assert [frame for _, frame in recording] == [frame for _, frame in frames]
+    # Relative to the first frame, roughly the served spacing
+    assert recording[0][0] == 0
+    assert 0.02 < recording[-1][0] < 0.5
+
+
+def test_speed_and_repeat():
+    frames = [(0.0, _frame(0)), (1.0, _frame(1))]
+
+    # 100x faster, the one second gap takes 10ms
+    with DealerReplayServer(frames, speed=100.0, repeat=True) as server:
+        streamer = _streamer(server.url)
+
+        start = time.monotonic()
+        packets = [streamer.get_packet() for _ in range(6)]
+        elapsed = time.monotonic() - start
+
+        assert [p["payloads"][0]["n"] for p in packets] == [0, 1, 0, 1, 0, 1]
+        assert elapsed < 0.5
+        assert server.connections == 1
+        streamer.close()
+
+
+def test_closed_recorder_detaches(tmp_path):
+    path = str(tmp_path / "session.jsonl")
+    frames = [(0.2, _frame(0)), (0.4, _frame(1))]
+
+    with DealerReplayServer(frames, speed=1.0) as server:
+        streamer = _streamer(server.url)
+
+        recorder = DealerRecorder(path)
+        recorder.attach(streamer)
+        assert streamer.get_packet()["payloads"][0]["n"] == 0
+        recorder.close()
+
+        # The reader thread is not stopped by the closed file
+        assert streamer.frame_hooks == []
+        assert streamer.get_packet()["payloads"][0]["n"] == 1
+        assert streamer.reader_thread.is_alive()
+        streamer.close()
+
+    assert len(load_recording(path)) == 1
+    # A stray call after close is ignored
+    recorder.record(_frame(2))
+    assert recorder.frames == 1
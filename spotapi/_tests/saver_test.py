@@ -0,0 +1,648 @@
+# type: ignore
+"""Unit tests for the file backed savers."""
+
+import fnmatch
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from spotapi.exceptions import SaverError
+from spotapi.http.request import TLSClient
+from spotapi.login import Login
+from spotapi.types import Config, SaverProtocol
+from spotapi.utils import fastjson
+from spotapi.utils.logger import NoopLogger
+from spotapi.utils.saver import (
+    CachedSaver,
+    JSONLogSaver,
+    JSONSaver,
+    LMDBSaver,
+    RedisSaver,
+    ShardedSaver,
+    SqliteSaver,
+)
+
+
+def _session(i, password="pw"):
+    return {
+        "identifier": f"user{i}@example.com",
+        "password": password,
+        "cookies": {"sp_dc": f"cookie{i}"},
+    }
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "sessions.jsonl")
+
+
+def test_log_saver_crud(log_path):
+    saver = JSONLogSaver(log_path)
+    saver.save([_session(i) for i in range(3)])
+    saver.save([_session(1, password="new")])
+
+    assert len(saver) == 3
+    assert saver.load({"identifier": "user1@example.com"})["password"] == "new"
+    assert saver.load({"password": "new"})["identifier"] == "user1@example.com"
+
+    with pytest.raises(SaverError):
+        saver.load({"identifier": "user1@example.com", "password": "pw"})
+
+    with pytest.raises(SaverError):
+        saver.load({"password": "pw"}, allow_collisions=True)
+
+    saver.delete({"identifier": "user0@example.com"})
+    with pytest.raises(SaverError):
+        saver.load({"identifier": "user0@example.com"})
+
+    saver.save([_session(9)], overwrite=True)
+    assert len(saver) == 1
+    saver.close()
+
+
+def test_log_saver_reopens_from_the_log(log_path):
+    saver = JSONLogSaver(log_path)
+    saver.save([_session(i) for i in range(3)])
+    saver.delete({"identifier": "user2@example.com"})
+    saver.save([_session(0, password="new")])
+    saver.close()
+
+    # A write cut off halfway is dropped
+    with open(log_path, "ab") as f:
+        f.write(b'{"identifier": "user7@exa')
+
+    saver = JSONLogSaver(log_path)
+    assert len(saver) == 2
+    assert saver.load({"identifier": "user0@example.com"})["password"] == "new"
+    assert saver.load({"identifier": "user1@example.com"})["cookies"] == {
+        "sp_dc": "cookie1"
+    }
+    saver.save([_session(3)])
+    saver.close()
+
+    assert len(JSONLogSaver(log_path)) == 3
+
+
+def test_log_saver_compacts(log_path):
+    saver = JSONLogSaver(log_path, compact_ratio=1.0, compact_min=10)
+    saver.save([_session(i) for i in range(5)])
+
+    for round in range(6):
+        saver.save([_session(i, password=str(round)) for i in range(5)])
+
+    # Compacted whenever stale lines outgrew the live ones
+    with open(log_path) as f:
+        lines = f.readlines()
+    assert len(lines) < 5 * 7
+
+    saver.compact()
+    with open(log_path) as f:
+        assert len(f.readlines()) == 5
+
+    assert saver.load({"identifier": "user4@example.com"})["password"] == "5"
+    assert not os.path.exists(log_path + ".tmp")
+    saver.close()
+
+
+def test_log_saver_migrates_json_saver_files(tmp_path):
+    path = str(tmp_path / "sessions.json")
+    with open(path, "w") as f:
+        json.dump([_session(i) for i in range(3)], f, indent=4)
+
+    saver = JSONLogSaver(path)
+    assert len(saver) == 3
+    assert saver.load({"identifier": "user2@example.com"})["password"] == "pw"
+    assert os.path.exists(path + ".bak")
+    saver.close()
+
+
+def test_log_saver_failed_migration_keeps_the_original(tmp_path, monkeypatch):
+    path = str(tmp_path / "sessions.json")
+    with open(path, "w") as f:
+        json.dump([_session(i) for i in range(3)], f)
+    with open(path + ".bak", "w") as f:
+        f.write("older backup")
+
+    def fail(item):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(fastjson, "dumps_bytes", fail)
+    with pytest.raises(OSError):
+        JSONLogSaver(path)
+    monkeypatch.undo()
+
+    with open(path) as f:
+        assert json.load(f) == [_session(i) for i in range(3)]
+    with open(path + ".bak") as f:
+        assert f.read() == "older backup"
+    assert not os.path.exists(path + ".tmp")
+
+    saver = JSONLogSaver(path)
+    assert len(saver) == 3
+    saver.close()
+
+
+@pytest.fixture
+def sqlite_saver(tmp_path):
+    saver = SqliteSaver(str(tmp_path / "sessions.db"))
+    yield saver
+    saver.close()
+
+
+def test_sqlite_saver_upserts_and_decodes(sqlite_saver):
+    sqlite_saver.save([_session(i) for i in range(3)])
+    sqlite_saver.save([_session(1, password="new")])
+
+    assert sqlite_saver.load({"identifier": "user1@example.com"}) == _session(
+        1, password="new"
+    )
+    assert sqlite_saver.load({"password": "new"})["cookies"] == {"sp_dc": "cookie1"}
+
+    sqlite_saver.delete({"identifier": "user1@example.com"})
+    with pytest.raises(SaverError):
+        sqlite_saver.load({"identifier": "user1@example.com"})
+
+    with pytest.raises(ValueError):
+        sqlite_saver.load({"1 = 1 OR identifier": "x"})
+
+    mode = sqlite_saver.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_sqlite_saver_load_many(sqlite_saver):
+    sqlite_saver.save([_session(i) for i in range(2000)])
+
+    wanted = [f"user{i}@example.com" for i in (1999, 5, 4000, 0)]
+    loaded = sqlite_saver.load_many(wanted)
+
+    assert [item["identifier"] for item in loaded] == [
+        "user1999@example.com",
+        "user5@example.com",
+        "user0@example.com",
+    ]
+    assert (
+        len(sqlite_saver.load_many([f"user{i}@example.com" for i in range(2000)]))
+        == 2000
+    )
+
+
+def test_sqlite_saver_connection_per_thread(sqlite_saver):
+    sqlite_saver.save([_session(i) for i in range(10)])
+    results, connections = [], set()
+    # Keeps every thread alive until all of them opened their connection
+    barrier = threading.Barrier(10)
+
+    def read(i):
+        results.append(sqlite_saver.load({"identifier": f"user{i}@example.com"}))
+        connections.add(id(sqlite_saver._connection()))
+        barrier.wait()
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 10
+    assert len(connections) == 10
+    # Only the connection of the main thread is left open
+    assert len(sqlite_saver._connections) == 1
+
+
+@pytest.mark.parametrize(
+    "make_saver",
+    [
+        lambda tmp: JSONSaver(str(tmp / "sessions.json")),
+        lambda tmp: JSONLogSaver(str(tmp / "sessions.jsonl")),
+        lambda tmp: SqliteSaver(str(tmp / "sessions.db")),
+    ],
+    ids=["json", "jsonlog", "sqlite"],
+)
+def test_bulk_loads(tmp_path, make_saver):
+    saver = make_saver(tmp_path)
+    saver.save([_session(i) for i in range(50)])
+    saver.save([_session(7, password="new")])
+
+    loaded = saver.load_many([f"user{i}@example.com" for i in (42, 99, 7, 3)])
+    assert [item["identifier"] for item in loaded] == [
+        "user42@example.com",
+        "user7@example.com",
+        "user3@example.com",
+    ]
+    assert loaded[1] == _session(7, password="new")
+
+    every = sorted(saver.iter_all(), key=lambda item: item["identifier"])
+    assert len(every) == 50
+    assert every == sorted(
+        [_session(i) for i in range(50) if i != 7] + [_session(7, password="new")],
+        key=lambda item: item["identifier"],
+    )
+
+
+class _SingleLoadSaver:
+    """A saver written before load_many."""
+
+    def __init__(self, items):
+        self.items = {item["identifier"]: item for item in items}
+
+    def load(self, query, **kwargs):
+        if query["identifier"] not in self.items:
+            raise SaverError("Item not found")
+        return self.items[query["identifier"]]
+
+
+class _CustomSaver(SaverProtocol):
+    """A custom saver implementing only load, save and delete."""
+
+    def __init__(self, items):
+        self.items = {item["identifier"]: item for item in items}
+
+    def save(self, data, **kwargs):
+        self.items.update({item["identifier"]: item for item in data})
+
+    def load(self, query, **kwargs):
+        if query["identifier"] not in self.items:
+            raise SaverError("Item not found")
+        return self.items[query["identifier"]]
+
+    def delete(self, query, **kwargs):
+        self.items.pop(query["identifier"], None)
+
+
+@pytest.mark.parametrize("kind", ["bulk", "custom", "duck"])
+def test_login_from_saver_many(tmp_path, kind):
+    sessions = [_session(i) for i in range(3)]
+    if kind == "bulk":
+        saver = JSONLogSaver(str(tmp_path / "sessions.jsonl"))
+        saver.save(sessions)
+    elif kind == "custom":
+        saver = _CustomSaver(sessions)
+    else:
+        saver = _SingleLoadSaver(sessions)
+
+    logins = Login.from_saver_many(
+        saver,
+        lambda: Config(NoopLogger(), client=TLSClient("chrome_120", "")),
+        ["user2@example.com", "missing@example.com", "user0@example.com"],
+    )
+
+    assert [login.identifier_credentials for login in logins] == [
+        "user2@example.com",
+        "user0@example.com",
+    ]
+    assert all(login.logged_in for login in logins)
+    # Every session keeps its own cookies
+    assert logins[0].client is not logins[1].client
+    assert logins[0].client.cookies.get("sp_dc") == "cookie2"
+    assert logins[1].client.cookies.get("sp_dc") == "cookie0"
+
+
+def test_protocol_defaults():
+    saver = _CustomSaver([_session(i) for i in range(3)])
+
+    assert saver.load_many(["user1@example.com", "missing@example.com"]) == [
+        _session(1)
+    ]
+    with pytest.raises(SaverError, match="_CustomSaver does not implement iter_all"):
+        saver.iter_all()
+
+
+class _FakeRedis:
+    """The few StrictRedis commands RedisSaver sends, over a dict."""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value):
+        self.data[key.encode()] = value
+
+    def get(self, key):
+        return self.data.get(key.encode())
+
+    def mget(self, keys):
+        return [self.data.get(k if isinstance(k, bytes) else k.encode()) for k in keys]
+
+    def delete(self, key):
+        self.data.pop(key.encode(), None)
+
+    def scan_iter(self, match=None, count=None):
+        return [k for k in list(self.data) if fnmatch.fnmatchcase(k.decode(), match)]
+
+
+def test_redis_saver_keys_are_prefixed():
+    saver = RedisSaver(prefix="spotapi:session:")
+    saver.client = _FakeRedis()
+    # Not a session of this saver
+    saver.client.data[b"other:key"] = b"{}"
+
+    saver.save([_session(i) for i in range(3)])
+    assert b"spotapi:session:user1@example.com" in saver.client.data
+    assert saver.load({"identifier": "user1@example.com"}) == _session(1)
+    assert saver.load_many(["user2@example.com", "user0@example.com"]) == [
+        _session(2),
+        _session(0),
+    ]
+
+    saver.delete({"identifier": "user0@example.com"})
+    assert sorted(item["identifier"] for item in saver.iter_all()) == [
+        "user1@example.com",
+        "user2@example.com",
+    ]
+
+
+def test_redis_saver_reads_unprefixed_sessions():
+    saver = RedisSaver()
+    saver.client = _FakeRedis()
+    # Saved by a version without prefixes
+    saver.client.data[b"user0@example.com"] = json.dumps(_session(0)).encode()
+
+    assert saver.load({"identifier": "user0@example.com"}) == _session(0)
+    assert list(saver.iter_all()) == [_session(0)]
+
+
+class _MemorySaver:
+    """Records the calls that reach the wrapped saver."""
+
+    def __init__(self):
+        self.items = {}
+        self.saves = []
+        self.loads = 0
+        self.fail = False
+        self.closed = False
+
+    def save(self, data, **kwargs):
+        if self.fail:
+            raise ConnectionError("down")
+        self.saves.append([item["identifier"] for item in data])
+        self.items.update((item["identifier"], item) for item in data)
+
+    def load(self, query, **kwargs):
+        if self.fail:
+            raise ConnectionError("down")
+        self.loads += 1
+        for item in self.items.values():
+            if all(item[key] == query[key] for key in query):
+                return item
+        raise SaverError("Item not found")
+
+    def load_many(self, identifiers, **kwargs):
+        if self.fail:
+            raise ConnectionError("down")
+        self.loads += 1
+        return [self.items[key] for key in identifiers if key in self.items]
+
+    def iter_all(self, **kwargs):
+        return iter(list(self.items.values()))
+
+    def delete(self, query, **kwargs):
+        self.items.pop(query["identifier"], None)
+
+    def close(self):
+        self.closed = True
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_cached_saver_coalesces_writes():
+    backend = _MemorySaver()
+    saver = CachedSaver(backend, flush_interval=60)
+
+    for password in ("a", "b", "c"):
+        saver.save([_session(1, password=password)])
+    saver.save([_session(2)])
+
+    assert backend.saves == []
+    assert saver.load({"identifier": "user1@example.com"})["password"] == "c"
+    assert backend.loads == 0
+
+    saver.flush()
+    assert backend.saves == [["user1@example.com", "user2@example.com"]]
+    assert backend.items["user1@example.com"]["password"] == "c"
+    saver.close()
+
+
+def test_cached_saver_flushes_in_the_background():
+    backend = _MemorySaver()
+    saver = CachedSaver(backend, flush_interval=0.05)
+    saver.save([_session(1)])
+    _wait_until(lambda: backend.saves)
+
+    # A full queue is written before the interval is up
+    saver.flush_interval = 60
+    time.sleep(0.1)
+    saver.max_pending = 3
+    saver.save([_session(i) for i in range(3)])
+    _wait_until(lambda: len(backend.saves) == 2)
+    saver.close()
+
+
+def test_cached_saver_flushes_on_close():
+    backend = _MemorySaver()
+    saver = CachedSaver(backend, flush_interval=60)
+    saver.save([_session(i) for i in range(5)])
+    saver.close()
+
+    assert len(backend.items) == 5
+    assert backend.closed
+    with pytest.raises(SaverError):
+        saver.save([_session(6)])
+
+
+def test_cached_saver_keeps_saves_when_a_flush_fails():
+    backend = _MemorySaver()
+    saver = CachedSaver(backend, flush_interval=60)
+    saver.save([_session(1)])
+
+    backend.fail = True
+    with pytest.raises(SaverError):
+        saver.flush()
+
+    saver.save([_session(2)])
+    assert saver.load({"identifier": "user1@example.com"}) == _session(1)
+
+    backend.fail = False
+    saver.flush()
+    assert set(backend.items) == {"user1@example.com", "user2@example.com"}
+    saver.close()
+
+
+def test_cached_saver_lru_and_bulk_loads():
+    backend = _MemorySaver()
+    backend.save([_session(i) for i in range(5)])
+    saver = CachedSaver(backend, max_items=2, flush_interval=60)
+
+    loaded = saver.load_many([f"user{i}@example.com" for i in (4, 9, 0, 1)])
+    assert [item["identifier"] for item in loaded] == [
+        "user4@example.com",
+        "user0@example.com",
+        "user1@example.com",
+    ]
+    assert backend.loads == 1
+
+    # user0 and user1 are the two most recent
+    saver.load({"identifier": "user1@example.com"})
+    assert backend.loads == 1
+    saver.load({"identifier": "user4@example.com"})
+    assert backend.loads == 2
+
+    saver.delete({"identifier": "user4@example.com"})
+    with pytest.raises(SaverError):
+        saver.load({"identifier": "user4@example.com"})
+    saver.close()
+
+
+def _sharded(names, **kwargs):
+    backends = {name: _MemorySaver() for name in names}
+    return ShardedSaver(backends, **kwargs), backends
+
+
+def _assert_placed(saver, backends):
+    for name, backend in backends.items():
+        assert all(saver.shard_for(key) == name for key in backend.items)
+
+
+def test_sharded_saver_routes_and_fans_out():
+    saver, backends = _sharded(["a", "b", "c"])
+    saver.save([_session(i) for i in range(900)])
+
+    _assert_placed(saver, backends)
+    assert all(200 < len(backend.items) < 400 for backend in backends.values())
+    # One save per shard
+    assert all(len(backend.saves) == 1 for backend in backends.values())
+
+    assert saver.load({"identifier": "user7@example.com"}) == _session(7)
+    assert saver.load({"password": "pw", "cookies": {"sp_dc": "cookie8"}}) == _session(
+        8
+    )
+
+    wanted = [f"user{i}@example.com" for i in (899, 1000, 3, 450)]
+    assert [item["identifier"] for item in saver.load_many(wanted)] == [
+        "user899@example.com",
+        "user3@example.com",
+        "user450@example.com",
+    ]
+    assert len(list(saver.iter_all())) == 900
+
+    saver.delete({"identifier": "user7@example.com"})
+    with pytest.raises(SaverError):
+        saver.load({"identifier": "user7@example.com"})
+    saver.close()
+
+
+def test_sharded_saver_rebalances():
+    saver, backends = _sharded(["a", "b", "c"])
+    saver.save([_session(i) for i in range(1200)])
+
+    backends["d"] = _MemorySaver()
+    moved = saver.add_shard("d", backends["d"])
+
+    # Only the sessions the new shard owns move
+    assert moved == len(backends["d"].items)
+    assert 150 < moved < 500
+    _assert_placed(saver, backends)
+    assert sum(len(backend.items) for backend in backends.values()) == 1200
+
+    moved = saver.remove_shard("a")
+    assert moved > 0
+    assert backends["a"].items == {}
+    del backends["a"]
+    _assert_placed(saver, backends)
+    assert len(saver.load_many([f"user{i}@example.com" for i in range(1200)])) == 1200
+
+    with pytest.raises(ValueError):
+        saver.add_shard("b", _MemorySaver())
+    saver.close()
+
+
+def test_sharded_saver_skips_failing_shards(monkeypatch):
+    saver, backends = _sharded(["a", "b"], max_failures=2, retry_after=30)
+    saver.save([_session(i) for i in range(100)])
+    on_a = [key for key in backends["a"].items]
+    on_b = [key for key in backends["b"].items]
+
+    backends["a"].fail = True
+    for _ in range(2):
+        with pytest.raises(SaverError):
+            saver.load({"identifier": on_a[0]})
+    assert saver.health() == {"a": False, "b": True}
+
+    # Down shards are not called, reads across shards return what the others have
+    backends["a"].fail = False
+    loads = backends["a"].loads
+    with pytest.raises(SaverError):
+        saver.save([{**_session(0), "identifier": on_a[0]}])
+    assert len(saver.load_many(on_a + on_b)) == len(on_b)
+    assert backends["a"].loads == loads
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+    assert saver.health() == {"a": True, "b": True}
+    assert len(saver.load_many(on_a + on_b)) == 100
+    saver.close()
+
+
+@pytest.fixture
+def lmdb_saver(tmp_path):
+    pytest.importorskip("lmdb")
+    saver = LMDBSaver(str(tmp_path / "sessions.lmdb"), map_size=1 << 24)
+    yield saver
+    saver.close()
+
+
+def test_lmdb_saver_crud(lmdb_saver):
+    lmdb_saver.save([_session(i) for i in range(3)])
+    lmdb_saver.save([_session(1, password="new")])
+
+    assert len(lmdb_saver) == 3
+    assert lmdb_saver.load({"identifier": "user1@example.com"}) == _session(
+        1, password="new"
+    )
+    assert lmdb_saver.load({"password": "new"})["identifier"] == "user1@example.com"
+    with pytest.raises(SaverError):
+        lmdb_saver.load({"password": "pw"}, allow_collisions=True)
+
+    lmdb_saver.delete({"password": "pw"})
+    assert [item["identifier"] for item in lmdb_saver.iter_all()] == [
+        "user1@example.com"
+    ]
+
+    lmdb_saver.save([_session(5)], overwrite=True)
+    assert len(lmdb_saver) == 1
+    lmdb_saver.delete({"identifier": "x"}, clear_all=True)
+    assert len(lmdb_saver) == 0
+
+
+def test_lmdb_saver_bulk_loads(lmdb_saver):
+    lmdb_saver.save([_session(i) for i in range(1000)])
+
+    loaded = lmdb_saver.load_many([f"user{i}@example.com" for i in (999, 1000, 0)])
+    assert loaded == [_session(999), _session(0)]
+    assert len(list(lmdb_saver.iter_all())) == 1000
+
+
+def test_lmdb_saver_concurrent_readers(lmdb_saver):
+    lmdb_saver.save([_session(i) for i in range(100)])
+    results = []
+
+    def read(i):
+        results.append(lmdb_saver.load({"identifier": f"user{i}@example.com"}))
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    # A writer doesn't block the readers
+    lmdb_saver.save([_session(200)])
+    for thread in threads:
+        thread.join()
+
+    assert sorted(item["identifier"] for item in results) == sorted(
+        f"user{i}@example.com" for i in range(20)
+    )
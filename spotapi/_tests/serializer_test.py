@@ -0,0 +1,102 @@
+# type: ignore
+"""Unit tests for the session serializers."""
+
+import json
+
+import pytest
+
+from spotapi.exceptions import SaverError
+from spotapi.utils.serializer import (
+    SCHEMA_VERSION,
+    JSONSerializer,
+    MsgpackSerializer,
+    train_dictionary,
+)
+
+pytest.importorskip("msgpack")
+
+SESSION = {
+    "identifier": "user@example.com",
+    "password": "pw",
+    "cookies": {"sp_dc": "a" * 160, "sp_key": "b" * 36, "sp_t": "c" * 32},
+}
+
+
+def _serializers():
+    serializers = [JSONSerializer(), MsgpackSerializer()]
+    try:
+        serializers.append(MsgpackSerializer(level=3))
+    except ImportError:
+        pass
+    return serializers
+
+
+@pytest.mark.parametrize("serializer", _serializers(), ids=str)
+def test_round_trip(serializer):
+    data = serializer.dumps(SESSION)
+    assert isinstance(data, bytes)
+    assert serializer.loads(data) == SESSION
+    assert serializer.loads(memoryview(data)) == SESSION
+
+    # Keys besides the session fields are kept
+    extra = {**SESSION, "region": "eu"}
+    assert serializer.loads(serializer.dumps(extra)) == extra
+
+
+@pytest.mark.parametrize("reader", _serializers(), ids=str)
+@pytest.mark.parametrize("writer", _serializers(), ids=str)
+def test_every_serializer_reads_every_format(reader, writer):
+    assert reader.loads(writer.dumps(SESSION)) == SESSION
+    # Written by the savers before serializers
+    assert reader.loads(json.dumps(SESSION).encode()) == SESSION
+
+
+def test_msgpack_is_smaller_than_json():
+    json_size = len(JSONSerializer().dumps(SESSION))
+    assert len(MsgpackSerializer().dumps(SESSION)) < json_size
+
+
+def test_newer_schema_versions_are_refused():
+    data = bytearray(MsgpackSerializer().dumps(SESSION))
+    assert data[1] == SCHEMA_VERSION
+
+    data[1] = SCHEMA_VERSION + 1
+    with pytest.raises(SaverError):
+        MsgpackSerializer().loads(bytes(data))
+
+
+def test_zstd_dictionary():
+    pytest.importorskip("zstandard")
+    samples = [
+        {**SESSION, "identifier": f"user{i}@example.com", "password": str(i) * 8}
+        for i in range(2000)
+    ]
+    dictionary = train_dictionary(samples, size=2048)
+    serializer = MsgpackSerializer(dictionary=dictionary)
+
+    data = serializer.dumps(SESSION)
+    assert serializer.loads(data) == SESSION
+    assert len(data) < len(MsgpackSerializer(level=3).dumps(SESSION))
+
+    # Records written with a dictionary can't be read without it
+    with pytest.raises(SaverError):
+        MsgpackSerializer(level=3).loads(data)
+    assert MsgpackSerializer(dictionary=dictionary).loads(data) == SESSION
+
+
+def test_lmdb_saver_with_msgpack(tmp_path):
+    pytest.importorskip("lmdb")
+    from spotapi.utils.saver import LMDBSaver
+
+    path = str(tmp_path / "sessions.lmdb")
+    saver = LMDBSaver(path, map_size=1 << 24)
+    saver.save([{**SESSION, "identifier": "old@example.com"}])
+    saver.serializer = MsgpackSerializer()
+    saver.save([SESSION])
+
+    assert saver.load({"identifier": "user@example.com"}) == SESSION
+    assert [item["identifier"] for item in saver.iter_all()] == [
+        "old@example.com",
+        "user@example.com",
+    ]
+    saver.close()
@@ -0,0 +1,123 @@
+# type: ignore
+"""Unit tests for the chunked playlist mutations in Song. No requests are sent."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from spotapi import song as song_module
+from spotapi.client import BaseClient
+from spotapi.exceptions import RequestError, SongError
+from spotapi.http.data import Response
+from spotapi.song import Song
+
+
+def _response(status_code):
+    return Response(raw=None, status_code=status_code, response=None)
+
+
+@pytest.fixture
+def song(monkeypatch):
+    monkeypatch.setattr(BaseClient, "part_hash", lambda self, name: "hash")
+    monkeypatch.setattr(song_module.time, "sleep", lambda _: None)
+    instance = Song()
+    instance.playlist = SimpleNamespace(playlist_id="abc")
+    return instance
+
+
+def _record_sends(monkeypatch, name, statuses=()):
+    sent, lock = [], threading.Lock()
+    statuses = list(statuses)
+
+    def send(self, chunk):
+        with lock:
+            sent.append(list(chunk))
+            status = statuses.pop(0) if statuses else 200
+        if isinstance(status, Exception):
+            raise status
+        return _response(status)
+
+    monkeypatch.setattr(Song, name, send)
+    return sent
+
+
+def test_add_is_chunked_in_order(song, monkeypatch):
+    sent = _record_sends(monkeypatch, "_stage_add_songs")
+
+    results = song.bulk_add_songs([str(i) for i in range(250)])
+
+    assert [len(chunk) for chunk in sent] == [100, 100, 50]
+    assert sent[0][0] == "spotify:track:0"
+    assert sent[2][-1] == "spotify:track:249"
+    assert all(result.success for result in results)
+
+
+def test_rejected_chunk_is_retried(song, monkeypatch):
+    sent = _record_sends(monkeypatch, "_stage_add_songs", [429, 200])
+
+    results = song.bulk_add_songs(["a", "b"], chunk_size=1)
+
+    assert sent == [["spotify:track:a"], ["spotify:track:a"], ["spotify:track:b"]]
+    assert [result.attempts for result in results] == [2, 1]
+
+
+def test_ambiguous_add_is_not_resent_when_it_landed(song, monkeypatch):
+    sent = _record_sends(
+        monkeypatch, "_stage_add_songs", [RequestError("boom", error="timeout")]
+    )
+    monkeypatch.setattr(Song, "_landed_at_bottom", lambda self, uris: True)
+
+    [result] = song.bulk_add_songs(["a"])
+
+    assert len(sent) == 1
+    assert result.success is True
+
+
+def test_ordered_add_skips_after_failure(song, monkeypatch):
+    _record_sends(monkeypatch, "_stage_add_songs", [500, 500])
+    monkeypatch.setattr(Song, "_landed_at_bottom", lambda self, uris: False)
+
+    results = song.bulk_add_songs(["a", "b"], chunk_size=1, retries=1)
+
+    assert results[0].success is False
+    assert results[0].attempts == 2
+    assert results[1].attempts == 0
+    assert "Skipped" in results[1].error
+
+
+def test_client_errors_are_not_retried(song, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(song_module.time, "sleep", sleeps.append)
+    sent = _record_sends(monkeypatch, "_stage_add_songs", [404])
+
+    [result] = song.bulk_add_songs(["a"], retries=3)
+
+    assert len(sent) == 1
+    assert (result.success, result.attempts, sleeps) == (False, 1, [])
+
+
+def test_unordered_ambiguous_add_is_reported(song, monkeypatch):
+    sent = _record_sends(monkeypatch, "_stage_add_songs", [500])
+
+    results = song.bulk_add_songs(["a", "b"], chunk_size=1, preserve_order=False)
+
+    assert len(sent) == 2
+    assert sorted(result.success for result in results) == [False, True]
+
+
+def test_remove_is_concurrent_and_retried(song, monkeypatch):
+    sent = _record_sends(monkeypatch, "_send_remove_songs", [500])
+
+    results = song.bulk_remove_songs([f"uid{i}" for i in range(450)], workers=3)
+
+    assert len(results) == 5
+    assert all(result.success for result in results)
+    assert len(sent) == 6
+
+
+def test_add_songs_to_playlist_raises_on_failure(song, monkeypatch):
+    _record_sends(monkeypatch, "_stage_add_songs", [400] * 4)
+
+    with pytest.raises(SongError):
+        song.add_songs_to_playlist(["a"])
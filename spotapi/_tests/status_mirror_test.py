@@ -0,0 +1,216 @@
+# type: ignore
+"""Unit tests for the cluster mirror of PlayerStatus, fed by a local dealer stand-in."""
+
+import json
+import queue
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from websockets.sync.server import serve
+
+from spotapi import websocket as websocket_module
+from spotapi.client import BaseClient
+from spotapi.exceptions import WebSocketError
+from spotapi.http.request import TLSClient
+from spotapi.status import ClusterMirror, EventManager, PlayerStatus
+
+
+def _device(name):
+    return {
+        "can_play": True,
+        "volume": 65535,
+        "name": name,
+        "capabilities": {"can_be_player": True},
+        "device_software_version": "1.0",
+        "device_type": "SMARTPHONE",
+        "device_id": name,
+        "client_id": "client",
+        "brand": "spotify",
+        "model": name,
+        "public_ip": "127.0.0.1",
+        "license": "premium",
+    }
+
+
+def _cluster(timestamp, track, *, paused=False, active="phone"):
+    return {
+        "timestamp": str(timestamp),
+        "active_device_id": active,
+        "player_state": {
+            "timestamp": str(timestamp),
+            "is_paused": paused,
+            "track": {"uri": f"spotify:track:{track}", "metadata": {}},
+            "next_tracks": [{"uri": "spotify:track:next"}],
+        },
+        "devices": {name: _device(name) for name in ("phone", "desktop")},
+    }
+
+
+def _update(cluster, reason="PLAYER_STATE_CHANGED"):
+    return json.dumps(
+        {
+            "type": "message",
+            "payloads": [{"cluster": cluster, "update_reason": reason}],
+            "uri": "hm://connect-state/v1/cluster",
+        }
+    )
+
+
+@pytest.fixture
+def dealer(monkeypatch):
+    monkeypatch.setattr(
+        BaseClient, "get_session", lambda self: setattr(self, "access_token", "tok")
+    )
+    monkeypatch.setattr(BaseClient, "get_client_token", lambda self: None)
+    monkeypatch.setattr(websocket_module.signal, "signal", lambda *_: None)
+    monkeypatch.setattr(websocket_module, "_register_device", lambda *_: None)
+
+    state = SimpleNamespace(outgoing=queue.Queue(), fetches=[])
+
+    def connect_device(client, device_id, connection_id):
+        state.fetches.append(connection_id)
+        return _cluster(1000, "http")
+
+    monkeypatch.setattr(websocket_module, "_connect_device", connect_device)
+
+    def handler(ws):
+        ws.send(json.dumps({"headers": {"Spotify-Connection-Id": "conn"}}))
+        while (message := state.outgoing.get()) is not None:
+            ws.send(message)
+
+    server = serve(handler, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    state.url = f"ws://127.0.0.1:{server.socket.getsockname()[1]}/"
+    monkeypatch.setattr(websocket_module, "DEALER_URL", state.url)
+    yield state
+
+    state.outgoing.put(None)
+    server.shutdown()
+    thread.join()
+
+
+def _login():
+    return SimpleNamespace(logged_in=True, client=TLSClient("chrome_120", ""))
+
+
+def _wait(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out")
+        time.sleep(0.01)
+
+
+def test_reads_come_from_the_mirror(dealer):
+    status = PlayerStatus(_login())
+    assert status._state is None
+
+    # First read fetches over HTTP, which subscribes the device to updates
+    assert status.state.track.uri == "spotify:track:http"
+    assert status.active_device_id == "phone"
+    assert dealer.fetches == ["conn"]
+
+    dealer.outgoing.put(_update(_cluster(2000, "event", paused=True, active="desktop")))
+    _wait(lambda: status.mirror.updates == 1)
+
+    state = status.state
+    assert (state.track.uri, state.is_paused) == ("spotify:track:event", True)
+    assert status.device_ids.active_device_id == "desktop"
+    assert status.next_song_in_queue.uri == "spotify:track:next"
+    assert status._state["track"]["uri"] == "spotify:track:event"
+    # No further HTTP round trips, and the parsed state is reused
+    assert dealer.fetches == ["conn"]
+    assert status.state is state
+
+    # A bare PlayerStatus does not keep the frames around
+    assert status._inbox.qsize() == 0
+
+    status.close()
+
+
+def test_out_of_order_updates_are_ignored():
+    mirror = ClusterMirror()
+    assert mirror.stale
+
+    mirror.reset(_cluster(2000, "new"))
+    assert not mirror.apply(_cluster(1000, "old"))
+    assert mirror.state.track.uri == "spotify:track:new"
+    assert mirror.ignored == 1
+
+    mirror.invalidate()
+    assert mirror.stale
+
+
+def test_dropped_connection_falls_back_to_http(dealer):
+    status = PlayerStatus(_login())
+    status.state
+    dealer.outgoing.put(None)  # the stand-in closes the socket
+
+    _wait(lambda: not status.reader_thread.is_alive())
+    assert status.state.track.uri == "spotify:track:http"
+    assert dealer.fetches == ["conn", "conn"]
+
+
+def test_event_manager_only_queues_subscribed_updates():
+    manager = object.__new__(EventManager)
+    manager.mirror = ClusterMirror()
+    manager._subscriptions = {"PLAYER_STATE_CHANGED": [print], "DEVICES_CHANGED": []}
+
+    packet = manager._process_frame(_update(_cluster(1, "a")))
+    assert packet["payloads"][0]["update_reason"] == "PLAYER_STATE_CHANGED"
+
+    # Unsubscribed updates still reach the mirror, they just are not queued
+    assert manager._process_frame(_update(_cluster(2, "b"), "DEVICES_CHANGED")) is None
+    assert manager.mirror.state.track.uri == "spotify:track:b"
+
+    assert manager._process_frame('{"type":"pong"}') is None
+    assert manager._process_frame('{"type":"message","uri":"hm://other"}')
+
+
+def test_partial_clusters_are_not_applied():
+    status = object.__new__(PlayerStatus)
+    status.mirror = ClusterMirror()
+    status.mirror.reset(_cluster(1, "a"))
+    status._set_dump(_cluster(1, "a"))
+
+    partial = _cluster(2, "b")
+    del partial["devices"]
+    assert status._process_frame(_update(partial)) is None
+
+    # The mirror and the dumps still agree on the last complete cluster
+    assert status.mirror.state.track.uri == "spotify:track:a"
+    assert status._state["track"]["uri"] == "spotify:track:a"
+    assert status.mirror.updates == 0
+
+
+def test_listener_skips_payloads_without_a_reason():
+    manager = object.__new__(EventManager)
+    manager._subscriptions = {}
+    emitted = []
+    manager._emit = lambda event, *args: emitted.append(event)
+    packets = iter(
+        [
+            {
+                "payloads": [
+                    {"cluster": {}},
+                    "junk",
+                    {"update_reason": "DEVICES_CHANGED"},
+                ]
+            },
+        ]
+    )
+
+    def get_packet():
+        packet = next(packets, None)
+        if packet is None:
+            raise WebSocketError("closed")
+        return packet
+
+    manager.get_packet = get_packet
+    manager._listen()
+
+    assert emitted == ["DEVICES_CHANGED"]
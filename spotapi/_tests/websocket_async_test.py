@@ -0,0 +1,130 @@
+# type: ignore
+"""Unit tests for AsyncWebsocketStreamer against a local dealer stand-in."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from websockets.server import serve
+
+from spotapi import websocket as websocket_module
+from spotapi.client import BaseClient
+from spotapi.exceptions import WebSocketError
+from spotapi.http.request import TLSClient
+from spotapi.websocket import AsyncWebsocketStreamer
+
+
+def _init_packet(connection_id):
+    return json.dumps({"headers": {"Spotify-Connection-Id": connection_id}})
+
+
+@pytest.fixture
+def streamer(monkeypatch):
+    registered = []
+    refreshes = []
+
+    def refresh(self, *, force=False):
+        refreshes.append(force)
+        self.access_token = f"token{len(refreshes)}"
+
+    monkeypatch.setattr(BaseClient, "refresh_access_token", refresh)
+    monkeypatch.setattr(
+        websocket_module,
+        "_register_device",
+        lambda client, device_id, connection_id: registered.append(connection_id),
+    )
+    monkeypatch.setattr(
+        websocket_module,
+        "_connect_device",
+        lambda client, device_id, connection_id: {},
+    )
+    monkeypatch.setattr(websocket_module, "_backoff", lambda attempt, cap: 0)
+
+    login = SimpleNamespace(logged_in=True, client=TLSClient("chrome_120", ""))
+    instance = AsyncWebsocketStreamer(login, ping_interval=0.05)
+    return instance, registered, refreshes
+
+
+async def _serve(handler, monkeypatch):
+    server = await serve(handler, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    monkeypatch.setattr(websocket_module, "DEALER_URL", f"ws://127.0.0.1:{port}/")
+    return server
+
+
+def test_packets_continue_across_reconnects(streamer, monkeypatch):
+    instance, registered, refreshes = streamer
+    connections = []
+
+    async def handler(ws, *_):
+        connections.append(ws.path)
+        number = len(connections)
+        await ws.send(_init_packet(f"conn{number}"))
+        await ws.send(json.dumps({"type": "message", "n": number}))
+        if number == 1:
+            return  # drop the first connection
+        await asyncio.sleep(1)
+
+    async def run():
+        server = await _serve(handler, monkeypatch)
+        reconnected = []
+        instance.on_reconnect(
+            lambda streamer: reconnected.append(streamer.connection_id)
+        )
+
+        received = []
+        async for packet in instance.packets():
+            received.append(packet["n"])
+            if len(received) == 2:
+                break
+
+        await instance.close()
+        server.close()
+        await server.wait_closed()
+        return received, reconnected
+
+    received, reconnected = asyncio.run(run())
+
+    assert received == [1, 2]
+    assert registered == ["conn1", "conn2"]
+    assert reconnected == ["conn2"]
+    assert instance.reconnects == 1
+    # Every handshake used a freshly checked token
+    assert connections == ["/?access_token=token1", "/?access_token=token2"]
+
+
+def test_pings_are_sent(streamer, monkeypatch):
+    instance, _, _ = streamer
+    pings = []
+
+    async def handler(ws, *_):
+        await ws.send(_init_packet("conn"))
+        async for message in ws:
+            pings.append(json.loads(message))
+            if len(pings) == 2:
+                await ws.send(json.dumps({"type": "done"}))
+
+    async def run():
+        server = await _serve(handler, monkeypatch)
+        packet = await instance.get_packet()
+        await instance.close()
+        server.close()
+        await server.wait_closed()
+        return packet
+
+    assert asyncio.run(run()) == {"type": "done"}
+    assert pings == [{"type": "ping"}, {"type": "ping"}]
+
+
+def test_gives_up_after_max_retries(streamer, monkeypatch):
+    instance, registered, refreshes = streamer
+    monkeypatch.setattr(websocket_module, "DEALER_URL", "ws://127.0.0.1:1/")
+    instance.max_retries = 2
+
+    with pytest.raises(WebSocketError):
+        asyncio.run(instance.connect())
+
+    assert registered == []
+    # The first attempt reuses the token, the retries force a refresh
+    assert refreshes == [False, True, True]
@@ -0,0 +1,159 @@
+# type: ignore
+"""Unit tests for WebsocketStreamer against a local dealer stand-in."""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from websockets.sync.server import serve
+
+from spotapi import websocket as websocket_module
+from spotapi.client import BaseClient
+from spotapi.exceptions import WebSocketError
+from spotapi.http.request import TLSClient
+from spotapi.websocket import WebsocketStreamer
+
+
+@pytest.fixture
+def dealer(monkeypatch):
+    monkeypatch.setattr(
+        BaseClient, "get_session", lambda self: setattr(self, "access_token", "tok")
+    )
+    monkeypatch.setattr(BaseClient, "get_client_token", lambda self: None)
+    monkeypatch.setattr(websocket_module.signal, "signal", lambda *_: None)
+
+    state = SimpleNamespace(pings=[], release=threading.Event(), messages=[])
+
+    def handler(ws):
+        ws.send(json.dumps({"headers": {"Spotify-Connection-Id": "conn"}}))
+        for message in state.messages:
+            ws.send(message)
+
+        # Never send anything else until released, the client recv blocks meanwhile
+        while not state.release.is_set():
+            try:
+                message = ws.recv(timeout=0.05)
+            except TimeoutError:
+                continue
+            if json.loads(message) == {"type": "ping"}:
+                state.pings.append(time.monotonic())
+
+    server = serve(handler, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    state.url = f"ws://127.0.0.1:{server.socket.getsockname()[1]}/"
+    yield state
+
+    state.release.set()
+    server.shutdown()
+    thread.join()
+
+
+def _streamer(dealer, **kwargs):
+    login = SimpleNamespace(logged_in=True, client=TLSClient("chrome_120", ""))
+    return WebsocketStreamer(login, dealer_url=dealer.url, **kwargs)
+
+
+def test_pings_sent_while_recv_blocks(dealer):
+    streamer = _streamer(dealer, ping_interval=0.1)
+    assert streamer.connection_id == "conn"
+
+    packets = []
+
+    def read():
+        try:
+            packets.append(streamer.get_packet())
+        except WebSocketError:
+            pass
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    time.sleep(0.65)
+
+    # get_packet is still waiting, yet the pings went out on schedule
+    assert reader.is_alive() and packets == []
+    assert len(dealer.pings) >= 5
+    gaps = [b - a for a, b in zip(dealer.pings, dealer.pings[1:])]
+    assert all(0.05 < gap < 0.3 for gap in gaps)
+    assert streamer.last_ping is not None
+
+    streamer.close()
+    reader.join(1)
+    assert not reader.is_alive()
+
+
+def test_connection_drop_raises(dealer):
+    streamer = _streamer(dealer, ping_interval=10)
+    dealer.release.set()  # the handler returns, which closes the socket
+
+    with pytest.raises(WebSocketError):
+        streamer.get_packet()
+
+    # Later calls fail too instead of blocking forever
+    with pytest.raises(WebSocketError):
+        streamer.get_packet()
+
+    streamer.keep_alive_thread.join(1)
+    assert not streamer.keep_alive_thread.is_alive()
+
+
+def test_receive_latency_recorded(dealer):
+    dealer.messages = [json.dumps({"type": "message", "n": 1})]
+    streamer = _streamer(dealer, ping_interval=10)
+
+    assert streamer.get_packet() == {"type": "message", "n": 1}
+    assert streamer.recv_latency.count == 2  # init packet + message
+    assert streamer.recv_latency.max >= streamer.recv_latency.last >= 0
+
+    streamer.close()
+
+
+def test_control_frames_skipped_before_decoding(dealer):
+    dealer.messages = ['{"type":"pong"}', json.dumps({"type": "message", "n": 1})]
+    streamer = _streamer(dealer, ping_interval=10)
+
+    assert streamer.get_packet() == {"type": "message", "n": 1}
+    assert streamer.frames_skipped == 1
+
+    streamer.close()
+
+
+class _FailingStreamer(WebsocketStreamer):
+    def _process_frame(self, frame):
+        if "bad" in frame:
+            raise ValueError("malformed frame")
+        return super()._process_frame(frame)
+
+
+def test_frame_that_fails_to_process_is_dropped(dealer):
+    dealer.messages = [
+        json.dumps({"type": "message", "bad": True}),
+        json.dumps({"type": "message", "n": 1}),
+    ]
+    login = SimpleNamespace(logged_in=True, client=TLSClient("chrome_120", ""))
+    streamer = _FailingStreamer(login, dealer_url=dealer.url, ping_interval=10)
+
+    # The reader thread survives the bad frame and queues the next one
+    assert streamer.get_packet() == {"type": "message", "n": 1}
+    assert streamer.frames_skipped == 1
+    assert streamer.reader_thread.is_alive()
+
+    streamer.close()
+
+
+def test_failing_frame_hook_is_isolated(dealer):
+    streamer = _streamer(dealer, ping_interval=10)
+    seen = []
+
+    def broken(frame):
+        raise ValueError("I/O operation on closed file")
+
+    streamer.frame_hooks.extend([broken, seen.append])
+    streamer._run_hooks('{"type":"message"}')
+
+    # The hooks after the failing one still run, and nothing reaches the reader loop
+    assert seen == ['{"type":"message"}']
+    streamer.close()
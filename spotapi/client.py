@@ -15,6 +15,10 @@ from spotapi.http.data import Response
 from spotapi.http.request import TLSClient
 from spotapi.utils.strings import extract_js_links, extract_mappings, combine_chunks
 
+# Published TOTP secrets, by version
+SECRETS_URL: str = (
+    "https://code.thetadev.de/ThetaDev/spotify-secrets/raw/branch/main/secrets/secretDict.json"
+)
 # Default recaptcha site key, will update on startup if necessary
 RECAPTCHA_SITE_KEY: str = "6LfCVLAUAAAAALFwwRnnCJ12DalriUGbj8FW_J39"
 # Fallback hardcoded secret (version 18)
@@ -40,8 +44,7 @@ def get_latest_totp_secret() -> Tuple[int, bytearray]:
         return _secret_cache
 
     try:
-        url = "https://code.thetadev.de/ThetaDev/spotify-secrets/raw/branch/main/secrets/secretDict.json"
-        response = requests.get(url, timeout=5)
+        response = requests.get(SECRETS_URL, timeout=5)
         if not response.ok:
             raise BaseClientError(f"Failed to fetch secrets: {response.status_code}")
 
@@ -110,16 +113,7 @@ class BaseClient:
         if self.client_token is _Undefined:
             self.get_client_token()
 
-        if self.access_token is _Undefined:
-            self.get_session()
-
-        if (
-            self.access_token_expires_at_ms
-            and time.time() * 1000 + self._REFRESH_SKEW_MS
-            >= self.access_token_expires_at_ms
-        ):
-            self.access_token = _Undefined
-            self._get_auth_vars()
+        self.refresh_access_token()
 
         if "headers" not in kwargs:
             kwargs["headers"] = {}
@@ -135,6 +129,19 @@ class BaseClient:
 
         return kwargs
 
+    def refresh_access_token(self, *, force: bool = False) -> None:
+        """Makes sure the access token is set and not about to expire."""
+        if self.access_token is _Undefined:
+            self.get_session()
+
+        if force or (
+            self.access_token_expires_at_ms
+            and time.time() * 1000 + self._REFRESH_SKEW_MS
+            >= self.access_token_expires_at_ms
+        ):
+            self.access_token = _Undefined
+            self._get_auth_vars()
+
     def _handle_auth_failure(self, resp: Response) -> bool:
         if resp.status_code == 401:
             self.access_token = _Undefined
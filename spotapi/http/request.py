@@ -135,6 +135,8 @@ class TLSClient(Session):
         self.authenticate = auth_rule
         self.on_auth_failure: Callable[[Response], bool] | None = None
         self.fail_exception: Type[ParentException] | None = None
+        # Host -> base URL, sends the requests for a host elsewhere (e.g. a mock server)
+        self.redirects: Dict[str, str] = {}
         atexit.register(self.close)
 
     def __call__(self, method: str, url: str, **kwargs) -> TLSResponse | None:
@@ -150,6 +152,9 @@ class TLSClient(Session):
                 else url.decode("utf-8")
             )
 
+        if self.redirects:
+            url = self._redirect(url)
+
         err = "Unknown"
         for _ in range(self.auto_retries):
             try:
@@ -162,6 +167,12 @@ class TLSClient(Session):
 
         raise RequestError("Failed to complete request.", error=err)
 
+    def _redirect(self, url: str) -> str:
+        _, _, rest = url.partition("://")
+        host, slash, path = rest.partition("/")
+        base = self.redirects.get(host)
+        return url if base is None else base + slash + path
+
     def parse_response(
         self, response: TLSResponse, method: str, danger: bool
     ) -> Response:
@@ -236,10 +247,17 @@ class TLSClient(Session):
         return parsed
 
     def get(
-        self, url: str | bytes, *, authenticate: bool = False, **kwargs
+        self,
+        url: str | bytes,
+        *,
+        authenticate: bool = False,
+        danger: bool = True,
+        **kwargs,
     ) -> Response:
         """Routes a GET Request"""
-        return self._send("GET", url, authenticate=authenticate, danger=True, **kwargs)
+        return self._send(
+            "GET", url, authenticate=authenticate, danger=danger, **kwargs
+        )
 
     def post(
         self,
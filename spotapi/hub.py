@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Set
+from spotapi.login import Login
+from spotapi.exceptions import WebSocketError
+from spotapi.types.annotations import enforce
+from spotapi.types.data import DealerMetrics, LatencyStats
+from spotapi.utils.logger import Logger
+from spotapi.websocket import AsyncWebsocketStreamer, _backoff
+
+__all__ = ["DealerHub", "DealerMetrics", "WebSocketError"]
+
+
+class _Account:
+    __slots__ = (
+        "key",
+        "streamer",
+        "subscriptions",
+        "task",
+        "callbacks",
+        "messages",
+        "last_message_at",
+        "error",
+        "callback_errors",
+    )
+
+    def __init__(self, key: str, streamer: AsyncWebsocketStreamer) -> None:
+        self.key = key
+        self.streamer = streamer
+        self.subscriptions: Dict[str, List[Callable[..., Any]]] = {}
+        self.task: asyncio.Task[None] | None = None
+        # Running async subscribers, the loop only keeps weak references to them
+        self.callbacks: Set[asyncio.Task[Any]] = set()
+        self.messages = 0
+        self.last_message_at: float | None = None
+        self.error: str | None = None
+        self.callback_errors = 0
+
+    def __str__(self) -> str:
+        return "_Account()"
+
+
+@enforce
+class DealerHub:
+    """
+    Drives the dealer connections of many accounts from a single event loop thread.
+
+    Every account costs one socket and one task instead of the socket plus two threads
+    of an EventManager. Payloads are routed by `update_reason` to the subscribers of the
+    account that received them.
+
+    Parameters
+    ----------
+    workers : int
+        Threads running the synchronous subscribers, so a slow callback does not stall the loop.
+    ping_interval : float
+        Seconds between the pings sent on every connection.
+    max_backoff : float
+        Upper bound of the reconnect delay, in seconds.
+    """
+
+    __slots__ = (
+        "ping_interval",
+        "max_backoff",
+        "loop_lag",
+        "dispatch_lag",
+        "_accounts",
+        "_lock",
+        "_loop",
+        "_thread",
+        "_executor",
+        "_lag_task",
+        "_rate_mark",
+        "_closed",
+    )
+
+    # How often the loop responsiveness is probed, in seconds
+    _LAG_PROBE_INTERVAL: float = 1.0
+
+    def __init__(
+        self,
+        *,
+        workers: int = 8,
+        ping_interval: float = 30.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self.ping_interval = ping_interval
+        self.max_backoff = max_backoff
+
+        # Overshoot of the loop's own timers, high values mean the loop is overloaded
+        self.loop_lag = LatencyStats()
+        # Time between a frame being read and its subscribers starting
+        self.dispatch_lag = LatencyStats()
+
+        self._accounts: Dict[str, _Account] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="DealerHub")
+        self._rate_mark = (time.monotonic(), 0)
+        self._closed = False
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="DealerHub", daemon=True
+        )
+        self._thread.start()
+        self._lag_task: asyncio.Task[None] = self._call(
+            self._start_lag_probe()
+        ).result()
+
+    def __enter__(self) -> DealerHub:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return "DealerHub()"
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._accounts
+
+    def _call(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def add(self, login: Login, *, key: str | None = None) -> str:
+        """
+        Starts streaming the dealer events of an account.
+
+        Returns the key used to subscribe, `login.identifier_credentials` by default.
+        The connection is opened in the background.
+        """
+        if self._closed:
+            raise WebSocketError("DealerHub is closed")
+
+        key = key or login.identifier_credentials
+        streamer = AsyncWebsocketStreamer(
+            login, ping_interval=self.ping_interval, max_backoff=self.max_backoff
+        )
+
+        with self._lock:
+            if key in self._accounts:
+                raise ValueError(f"Account '{key}' is already streaming")
+
+            account = _Account(key, streamer)
+            self._accounts[key] = account
+
+        self._call(self._start(account)).result()
+        return key
+
+    def remove(self, key: str) -> None:
+        """Stops streaming an account and drops its subscribers."""
+        with self._lock:
+            account = self._accounts.pop(key, None)
+
+        if account is not None:
+            self._call(self._stop(account)).result()
+
+    def streamer(self, key: str) -> AsyncWebsocketStreamer:
+        return self._accounts[key].streamer
+
+    def subscribe(
+        self, key: str, event: str
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Decorator to subscribe a function to an event of one account.
+        Async functions run on the hub loop, the others on the worker threads.
+        """
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            with self._lock:
+                subscriptions = self._accounts[key].subscriptions
+                funcs = subscriptions.setdefault(event, [])
+
+                if func in funcs:
+                    raise ValueError(
+                        f"Function {func.__name__} is already subscribed to event '{event}'"
+                    )
+
+                funcs.append(func)
+
+            return func
+
+        return decorator
+
+    def unsubscribe(self, key: str, event: str, func: Callable[..., Any]) -> None:
+        """Unsubscribe a function from an event of one account."""
+        with self._lock:
+            account = self._accounts.get(key)
+            if account is not None and event in account.subscriptions:
+                account.subscriptions[event].remove(func)
+
+    async def _start(self, account: _Account) -> None:
+        account.task = asyncio.create_task(self._run(account))
+
+    async def _stop(self, account: _Account) -> None:
+        await account.streamer.close()
+        if account.task is not None:
+            account.task.cancel()
+            await asyncio.gather(account.task, return_exceptions=True)
+
+        callbacks = list(account.callbacks)
+        for task in callbacks:
+            task.cancel()
+        await asyncio.gather(*callbacks, return_exceptions=True)
+
+    async def _run(self, account: _Account) -> None:
+        # Failures in a row, without a packet in between
+        failures = 0
+        while True:
+            messages = account.messages
+            try:
+                await self._stream(account)
+                return
+            except WebSocketError as e:
+                # Closed, or out of reconnect attempts
+                account.error = e.error or str(e)
+                return
+            except Exception as e:
+                account.error = repr(e)
+                Logger.error(
+                    f"Stream of account '{account.key}' failed, reconnecting: {e!r}"
+                )
+
+            failures = 1 if account.messages > messages else failures + 1
+            try:
+                await asyncio.sleep(_backoff(failures, account.streamer.max_backoff))
+                await account.streamer.reconnect()
+            except WebSocketError as e:
+                account.error = e.error or str(e)
+                return
+
+    async def _stream(self, account: _Account) -> None:
+        async for packet in account.streamer.packets():
+            received_at = time.monotonic()
+            account.messages += 1
+            account.last_message_at = time.time()
+
+            payloads = packet.get("payloads")
+            if not payloads or not account.subscriptions:
+                continue
+
+            for payload in payloads:
+                if isinstance(payload, dict) and "update_reason" in payload:
+                    self._dispatch(
+                        account, payload["update_reason"], payload, received_at
+                    )
+
+    def _dispatch(
+        self, account: _Account, event: str, payload: Dict[str, Any], received_at: float
+    ) -> None:
+        for func in account.subscriptions.get(event, ()):
+            if asyncio.iscoroutinefunction(func):
+                self.dispatch_lag.record(time.monotonic() - received_at)
+                task = self._loop.create_task(func(payload))
+                account.callbacks.add(task)
+                task.add_done_callback(account.callbacks.discard)
+                future: Future[Any] | asyncio.Task[Any] = task
+            else:
+                future = self._executor.submit(
+                    functools.partial(self._invoke, func, payload, received_at)
+                )
+
+            future.add_done_callback(
+                functools.partial(self._callback_done, account, event, func)
+            )
+
+    def _callback_done(
+        self,
+        account: _Account,
+        event: str,
+        func: Callable[..., Any],
+        future: Future[Any] | asyncio.Task[Any],
+    ) -> None:
+        # Retrieves the exception, so it is neither lost nor reported at garbage collection
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is None:
+            return
+
+        with self._lock:
+            account.callback_errors += 1
+        Logger.error(
+            f"Subscriber {getattr(func, '__name__', func)!r} of '{event}' "
+            f"failed for account '{account.key}': {error!r}"
+        )
+
+    def _invoke(
+        self, func: Callable[..., Any], payload: Dict[str, Any], received_at: float
+    ) -> None:
+        with self._lock:
+            self.dispatch_lag.record(time.monotonic() - received_at)
+
+        func(payload)
+
+    async def _start_lag_probe(self) -> asyncio.Task[None]:
+        return asyncio.create_task(self._probe_lag())
+
+    async def _probe_lag(self) -> None:
+        while True:
+            start = self._loop.time()
+            await asyncio.sleep(self._LAG_PROBE_INTERVAL)
+            self.loop_lag.record(
+                max(0.0, self._loop.time() - start - self._LAG_PROBE_INTERVAL)
+            )
+
+    def metrics(self) -> DealerMetrics:
+        """
+        Connection counts and message totals.
+        `messages_per_second` is the rate since the previous call.
+        """
+        with self._lock:
+            accounts = list(self._accounts.values())
+
+        messages = sum(account.messages for account in accounts)
+        now = time.monotonic()
+        mark, previous = self._rate_mark
+        self._rate_mark = (now, messages)
+
+        return DealerMetrics(
+            accounts=len(accounts),
+            connected=sum(account.streamer.connected for account in accounts),
+            reconnects=sum(account.streamer.reconnects for account in accounts),
+            messages=messages,
+            messages_per_second=(
+                (messages - previous) / (now - mark) if now > mark else 0.0
+            ),
+            loop_lag=self.loop_lag,
+            dispatch_lag=self.dispatch_lag,
+            account_messages={account.key: account.messages for account in accounts},
+            errors={
+                account.key: account.error for account in accounts if account.error
+            },
+            callback_errors=sum(account.callback_errors for account in accounts),
+        )
+
+    def close(self) -> None:
+        """Closes every connection and stops the loop thread."""
+        if self._closed:
+            return
+
+        self._closed = True
+        with self._lock:
+            accounts = list(self._accounts.values())
+            self._accounts.clear()
+
+        self._call(self._shutdown(accounts)).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._executor.shutdown(wait=False)
+
+    async def _shutdown(self, accounts: List[_Account]) -> None:
+        await asyncio.gather(*(self._stop(account) for account in accounts))
+
+        self._lag_task.cancel()
+        await asyncio.gather(self._lag_task, return_exceptions=True)
+        await self._loop.shutdown_default_executor()
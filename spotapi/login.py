@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import Any, Callable, List
 from collections.abc import Mapping
 from spotapi.types.annotations import enforce
 from urllib.parse import urlencode, quote
@@ -141,6 +141,33 @@ class Login:
         dump = saver.load(query={"identifier": identifier}, **kwargs)
         return cls.from_cookies(dump, cfg)
 
+    @classmethod
+    def from_saver_many(
+        cls,
+        saver: SaverProtocol,
+        cfg_factory: Callable[[], Config],
+        identifiers: List[str],
+        **kwargs,
+    ) -> List[Login]:
+        """
+        Loads many sessions from a Saver Class, in as few lookups as the saver allows.
+
+        Args:
+            saver (SaverProtocol): The saver to load the sessions from.
+            cfg_factory (Callable[[], Config]): Called once per session, every session needs its own client.
+            identifiers (List[str]): The identifiers of the sessions.
+
+        Returns:
+            List[Login]: The loaded Login instances, identifiers without a session are skipped.
+        """
+        if hasattr(saver, "load_many"):
+            dumps = saver.load_many(identifiers, **kwargs)
+        else:
+            # Savers that don't subclass SaverProtocol and were written before load_many
+            dumps = SaverProtocol.load_many(saver, identifiers, **kwargs)
+
+        return [cls.from_cookies(dump, cfg_factory()) for dump in dumps]
+
     @property
     def logged_in(self) -> bool:
         return self._authorized
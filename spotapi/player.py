@@ -1,15 +1,109 @@
 import uuid
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from spotapi.utils import random_hex_string
 from spotapi.exceptions import PlayerError
 from spotapi.playlist import PublicPlaylist
 from spotapi.types.annotations import enforce
 from spotapi.status import PlayerStatus
+from spotapi.websocket import WebsocketStreamer
 from spotapi.login import Login
 from spotapi.song import Song
-from typing import List
+from typing import Any, Callable, Dict, List
 
-__all__ = ["Player", "PlayerStatus", "PlayerError"]
+__all__ = ["Player", "PlayerStatus", "PlayerError", "CommandPipeline"]
+
+COMMAND_URL = (
+    "https://gue1-spclient.spotify.com/connect-state/v1/player/command/from/{}/to/{}"
+)
+
+
+def _track_uri(track: str) -> str:
+    if track.startswith("spotify:track:"):
+        return track
+
+    return f"spotify:track:{track}"
+
+
+def _queue_item(track: str) -> Dict[str, Any]:
+    return {
+        "uri": _track_uri(track),
+        "metadata": {"is_queued": "true"},
+        "provider": "queue",
+    }
+
+
+def _add_to_queue_payload(track: str) -> Dict[str, Any]:
+    return {
+        "command": {
+            "track": _queue_item(track),
+            "endpoint": "add_to_queue",
+            "logging_params": {"command_id": random_hex_string(32)},
+        }
+    }
+
+
+def _queued_uris(cluster: Dict[str, Any]) -> List[str]:
+    next_tracks = (cluster.get("player_state") or {}).get("next_tracks") or []
+    return [
+        track.get("uri") for track in next_tracks if track.get("provider") == "queue"
+    ]
+
+
+class CommandPipeline:
+    """
+    Sends player commands concurrently, with at most `workers` requests in flight.
+
+    The HTTP response only means a command was accepted, commands sent concurrently may
+    be applied in any order. Wait for their effect on the cluster (Player.wait_for_cluster)
+    when it matters.
+    """
+
+    __slots__ = ("player", "_executor", "_pending")
+
+    def __init__(self, player: "Player", *, workers: int = 4) -> None:
+        self.player = player
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="command")
+        self._pending: List[Future[None]] = []
+
+    def __enter__(self) -> "CommandPipeline":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return "CommandPipeline()"
+
+    def submit(self, payload: Dict[str, Any]) -> Future[None]:
+        """Queues a command payload from the player's device to the active one."""
+        future = self._executor.submit(
+            self.player._run_command,
+            self.player.device_id,
+            self.player.active_id,
+            payload,
+        )
+        self._pending.append(future)
+        return future
+
+    def join(self, timeout: float | None = None) -> List[BaseException]:
+        """Waits for the submitted commands, returns the errors of the failed ones."""
+        pending, self._pending = self._pending, []
+        done, not_done = wait(pending, timeout)
+
+        errors: List[BaseException] = []
+        for future in done:
+            error = future.exception()
+            if error is not None:
+                errors.append(error)
+
+        if not_done:
+            errors.append(TimeoutError(f"{len(not_done)} commands still in flight"))
+
+        return errors
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
 
 
 @enforce
@@ -23,6 +117,9 @@ class Player(PlayerStatus):
         The login instance used for authentication.
     device_id : str, optional
         The device ID to connect to for the player.
+    status : PlayerStatus, optional
+        An existing PlayerStatus (or EventManager) whose connection, device registration
+        and cluster mirror are reused instead of opening a new websocket.
     """
 
     __slots__ = (
@@ -30,13 +127,25 @@ class Player(PlayerStatus):
         "device_id",
         "r_state",
         "_transfered",
+        "_status",
     )
 
-    def __init__(self, login: Login, device_id: str | None = None) -> None:
-        super().__init__(login, None)
+    def __init__(
+        self,
+        login: Login,
+        device_id: str | None = None,
+        *,
+        status: PlayerStatus | None = None,
+    ) -> None:
+        self._status = status
+        if status is None:
+            super().__init__(login, None)
+        else:
+            self._attach(status)
 
-        _devices = self.device_ids
-        _active_id = _devices.active_device_id
+        # Everything below reads one snapshot of the cluster
+        self._refresh_if_stale()
+        _active_id = self.mirror.active_device_id
 
         if _active_id is None:
             if not device_id:
@@ -47,7 +156,8 @@ class Player(PlayerStatus):
         else:
             self.active_id = device_id if device_id else _active_id
 
-        self.r_state = self.state
+        # Lazy, the queue is not parsed unless it is read
+        self.r_state = self.mirror.lazy_state
         if self.r_state.play_origin is None:
             raise ValueError("Could not get origin device ID.")
 
@@ -58,12 +168,29 @@ class Player(PlayerStatus):
         self.device_id = _origin_device_id
         self.transfer_player(self.device_id, self.active_id)
 
+    def _attach(self, status: PlayerStatus) -> None:
+        # Share the connection and the mirror, the status' reader thread keeps updating it
+        for name in WebsocketStreamer.__slots__:
+            if hasattr(status, name):
+                setattr(self, name, getattr(status, name))
+
+        self.__dict__.update(status.__dict__)
+
+    def close(self) -> None:
+        """Closes the websocket, unless it belongs to the status the player is attached to."""
+        if self._status is None:
+            super().close()
+
     def transfer_player(self, from_device_id: str, to_device_id: str) -> None:
         """Transfers the player streamer from one device to another."""
+        self._refresh_if_stale()
+
         url = f"https://gue1-spclient.spotify.com/connect-state/v1/connect/transfer/from/{from_device_id}/to/{to_device_id}"
         payload = {
             "transfer_options": {
-                "restore_paused": "pause" if self.state.is_paused else "resume"
+                "restore_paused": (
+                    "pause" if self.mirror.lazy_state.is_paused else "resume"
+                )
             },
             "command_id": random_hex_string(32),  # This is random for some reason
         }
@@ -77,7 +204,7 @@ class Player(PlayerStatus):
     def _run_command(
         self, from_device_id: str, to_device_id: str, payload: dict
     ) -> None:
-        url = f"https://gue1-spclient.spotify.com/connect-state/v1/player/command/from/{from_device_id}/to/{to_device_id}"
+        url = COMMAND_URL.format(from_device_id, to_device_id)
         resp = self.client.post(url, json=payload, authenticate=True)
 
         if resp.fail:
@@ -151,21 +278,35 @@ class Player(PlayerStatus):
         self._run_command(from_device_id, to_device_id, payload)
 
     def _add_to_queue(self, from_device_id: str, to_device_id: str, track: str) -> None:
-        if track.startswith("spotify:track:"):
-            track = track.split(":")[-1]
+        self._run_command(from_device_id, to_device_id, _add_to_queue_payload(track))
+
+    def _set_queue(
+        self,
+        from_device_id: str,
+        to_device_id: str,
+        cluster: Dict[str, Any],
+        queued: List[Dict[str, Any]],
+    ) -> str | None:
+        state = cluster.get("player_state") or {}
+        # The context's upcoming tracks stay behind the queued ones
+        context_tracks = [
+            track
+            for track in state.get("next_tracks") or []
+            if track.get("provider") != "queue"
+        ]
+        revision = state.get("queue_revision")
 
         payload = {
             "command": {
-                "track": {
-                    "uri": f"spotify:track:{track}",
-                    "metadata": {"is_queued": "true"},
-                    "provider": "queue",
-                },
-                "endpoint": "add_to_queue",
+                "next_tracks": queued + context_tracks,
+                "prev_tracks": state.get("prev_tracks") or [],
+                "queue_revision": revision,
+                "endpoint": "set_queue",
                 "logging_params": {"command_id": random_hex_string(32)},
             }
         }
         self._run_command(from_device_id, to_device_id, payload)
+        return revision
 
     def _play_song(
         self,
@@ -255,6 +396,121 @@ class Player(PlayerStatus):
         """Adds a track to the player's queue."""
         self._add_to_queue(self.device_id, self.active_id, track)
 
+    def pipeline(self, *, workers: int = 4) -> CommandPipeline:
+        """A pipeline sending this player's commands with bounded concurrency."""
+        return CommandPipeline(self, workers=workers)
+
+    def wait_for_cluster(
+        self, predicate: Callable[[Dict[str, Any]], bool], timeout: float = 10.0
+    ) -> bool:
+        """
+        Waits until the cluster pushed by the dealer satisfies the predicate.
+        This is how a command is confirmed, the HTTP response only acknowledges its receipt.
+        """
+        return self.mirror.wait_for(predicate, timeout)
+
+    def _cluster(self) -> Dict[str, Any]:
+        self._refresh_if_stale()
+        cluster = self.mirror.cluster
+
+        if cluster is None:
+            raise PlayerError("Could not get player state")
+
+        return cluster
+
+    def set_queue(self, tracks: List[str], /, *, timeout: float = 10.0) -> None:
+        """
+        Replaces the queued tracks in a single command.
+        The context's upcoming tracks are kept after them.
+
+        Parameters
+        ----------
+        tracks : List[str]
+            Track ids or uris, in order.
+        timeout : float
+            Seconds to wait for the dealer to confirm the new queue.
+        """
+        self._replace_queue([_queue_item(track) for track in tracks], timeout)
+
+    def add_many_to_queue(
+        self,
+        tracks: List[str],
+        /,
+        *,
+        ordered: bool = True,
+        workers: int = 4,
+        timeout: float = 10.0,
+    ) -> None:
+        """
+        Adds tracks to the end of the queue.
+
+        Ordered, the current queue and the new tracks are sent as one set_queue command.
+        Otherwise one add_to_queue command per track is sent, `workers` at a time, and the
+        tracks may be queued in any order. Either way this returns once the dealer pushed
+        a cluster with the tracks queued.
+        """
+        if not tracks:
+            return
+
+        if ordered:
+            cluster = self._cluster()
+            queued = [
+                track
+                for track in (cluster.get("player_state") or {}).get("next_tracks")
+                or []
+                if track.get("provider") == "queue"
+            ]
+            self._replace_queue(
+                queued + [_queue_item(track) for track in tracks], timeout
+            )
+            return
+
+        # Present before the commands were sent, they must be queued once more
+        before = _queued_uris(self._cluster())
+        uris = [_track_uri(track) for track in tracks]
+
+        with self.pipeline(workers=workers) as pipeline:
+            for track in tracks:
+                pipeline.submit(_add_to_queue_payload(track))
+
+            errors = pipeline.join()
+
+        if errors:
+            raise PlayerError(
+                f"Could not add {len(errors)} of {len(tracks)} tracks to the queue",
+                error=str(errors[0]),
+            )
+
+        def queued(cluster: Dict[str, Any]) -> bool:
+            remaining = _queued_uris(cluster)
+            for uri in before + uris:
+                if uri not in remaining:
+                    return False
+                remaining.remove(uri)
+            return True
+
+        if not self.wait_for_cluster(queued, timeout):
+            raise PlayerError("The dealer did not confirm the queued tracks")
+
+    def _replace_queue(self, queued: List[Dict[str, Any]], timeout: float) -> None:
+        revision = self._set_queue(
+            self.device_id, self.active_id, self._cluster(), queued
+        )
+        uris = [track["uri"] for track in queued]
+
+        def replaced(cluster: Dict[str, Any]) -> bool:
+            state = cluster.get("player_state") or {}
+            # Another device may have changed the queue in the meantime
+            if state.get("queue_revision") == revision:
+                return False
+
+            next_tracks = state.get("next_tracks") or []
+            return [track.get("uri") for track in next_tracks[: len(uris)]] == uris
+
+        confirmed = self.wait_for_cluster(replaced, timeout)
+        if not confirmed:
+            raise PlayerError("The dealer did not confirm the new queue")
+
     def play_track(self, track: str, playlist: str, /) -> None:
         """
         Overrides the player with a new track.
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import time
-from typing import Any
+from typing import Any, Dict, List, Tuple
 from spotapi.login import Login
 from spotapi.user import User
 from spotapi.client import BaseClient
@@ -11,8 +12,16 @@ from collections.abc import Mapping, Generator
 from spotapi.types.annotations import enforce
 from spotapi.exceptions import PlaylistError
 from spotapi.http.request import TLSClient
+from spotapi.types.data import PlaylistChanges, PlaylistSnapshot
 
-__all__ = ["PublicPlaylist", "PrivatePlaylist", "PlaylistError"]
+__all__ = [
+    "PublicPlaylist",
+    "PrivatePlaylist",
+    "PlaylistSync",
+    "PlaylistChanges",
+    "PlaylistSnapshot",
+    "PlaylistError",
+]
 
 
 @enforce
@@ -425,3 +434,285 @@ class PrivatePlaylist:
             )
 
         return resp.response
+
+
+def _playlist_id(playlist: str) -> str:
+    if "playlist:" in playlist:
+        return playlist.split("playlist:")[-1]
+    if "playlist/" in playlist:
+        return playlist.split("playlist/")[-1].split("?")[0]
+    return playlist
+
+
+def _entry(item: Mapping[str, Any]) -> Tuple[str, str]:
+    uri = str(item.get("uri", ""))
+    # Entries added by very old clients may not carry an item id
+    uid = (item.get("attributes") or {}).get("itemId") or uri
+    return str(uid), uri
+
+
+def _apply_ops(items: List[Tuple[str, str]], ops: List[Mapping[str, Any]]) -> List[str]:
+    """Applies diff operations in place, returns the uids touched by a move."""
+    moved: List[str] = []
+
+    for op in ops:
+        kind = op.get("kind")
+
+        if kind in ("ADD", 2):
+            add = op["add"]
+            new = [_entry(item) for item in add.get("items", [])]
+            if "fromIndex" in add:
+                index = int(add["fromIndex"])
+                if index > len(items):
+                    raise IndexError("ADD out of range")
+            elif add.get("addFirst"):
+                index = 0
+            else:
+                index = len(items)
+            items[index:index] = new
+
+        elif kind in ("REM", 3):
+            rem = op["rem"]
+            if "fromIndex" in rem:
+                start = int(rem["fromIndex"])
+                length = int(rem.get("length", len(rem.get("items", []))))
+                if start + length > len(items):
+                    raise IndexError("REM out of range")
+                del items[start : start + length]
+            else:
+                # itemsAsKey removals only list the entries
+                keys = {_entry(item) for item in rem.get("items", [])}
+                items[:] = [item for item in items if item not in keys]
+
+        elif kind in ("MOV", 4):
+            mov = op["mov"]
+            start = int(mov["fromIndex"])
+            length = int(mov.get("length", 1))
+            to_index = int(mov["toIndex"])
+            if start + length > len(items) or to_index > len(items):
+                raise IndexError("MOV out of range")
+
+            block = items[start : start + length]
+            del items[start : start + length]
+            # toIndex points into the list as it was before the block was taken out
+            if to_index > start:
+                to_index -= length
+            items[to_index:to_index] = block
+            moved.extend(uid for uid, _ in block)
+
+        # Attribute updates do not change the entries
+
+    return moved
+
+
+def _compare_snapshots(
+    playlist_id: str,
+    before: PlaylistSnapshot | None,
+    after: PlaylistSnapshot,
+    moved_uids: List[str],
+    full_resync: bool,
+) -> PlaylistChanges:
+    old_index = {uid: i for i, (uid, _) in enumerate(before.items)} if before else {}
+    new_index = {uid: i for i, (uid, _) in enumerate(after.items)}
+    changes = PlaylistChanges(
+        playlist_id=playlist_id,
+        from_revision=before.revision if before else None,
+        to_revision=after.revision,
+        full_resync=full_resync,
+    )
+
+    changes.added = [
+        (index, uid, uri)
+        for index, (uid, uri) in enumerate(after.items)
+        if uid not in old_index
+    ]
+
+    if before:
+        changes.removed = [
+            (uid, uri) for uid, uri in before.items if uid not in new_index
+        ]
+
+    for uid in dict.fromkeys(moved_uids):
+        if uid in old_index and uid in new_index:
+            index = new_index[uid]
+            changes.moved.append((old_index[uid], index, uid, after.items[index][1]))
+
+    return changes
+
+
+@enforce
+class PlaylistSync:
+    """
+    Keeps local snapshots of playlists and only downloads what changed since the last sync.
+
+    The snapshot (revision + item uids) is kept per playlist. On every sync, spclient is asked for
+    the diff since the stored revision. The playlist is only paginated in full when there is no
+    snapshot yet or when Spotify no longer knows the stored revision.
+
+    Parameters
+    ----------
+    client (TLSClient): An instance of TLSClient to use for requests.
+        Use the logged in client (login.client) to sync private playlists.
+    path (Optional[str]): JSON file the snapshots are persisted to. If None, they are only kept in memory.
+    """
+
+    __slots__ = (
+        "base",
+        "path",
+        "snapshots",
+    )
+
+    # Entries per page when a full download is needed
+    UPPER_LIMIT: int = 500
+
+    def __init__(
+        self,
+        *,
+        client: TLSClient = TLSClient("chrome120", "", auto_retries=3),
+        path: str | None = None,
+        language: str = "en",
+    ) -> None:
+        self.base = BaseClient(client=client, language=language)
+        self.path = path
+        self.snapshots: Dict[str, PlaylistSnapshot] = {}
+
+        if path and os.path.exists(path):
+            with open(path, "r") as f:
+                content = f.read()
+
+            for dump in json.loads(content) if content.strip() else []:
+                snapshot = PlaylistSnapshot.from_dict(dump)
+                self.snapshots[snapshot.playlist_id] = snapshot
+
+    def get_contents(
+        self, playlist: str, /, limit: int = 100, *, offset: int = 0
+    ) -> Mapping[str, Any]:
+        """Gets a page of the playlist contents along with its current revision."""
+        url = f"https://spclient.wg.spotify.com/playlist/v2/playlist/{_playlist_id(playlist)}"
+        params = {
+            "decorate": "revision,length,attributes",
+            "from": offset,
+            "length": limit,
+        }
+        headers = {"Accept": "application/json"}
+
+        resp = self.base.client.get(
+            url, params=params, headers=headers, authenticate=True
+        )
+
+        if resp.fail:
+            raise PlaylistError(
+                "Could not get playlist contents", error=resp.error.string
+            )
+
+        if not isinstance(resp.response, Mapping):
+            raise PlaylistError("Invalid JSON")
+
+        return resp.response
+
+    def get_diff(self, playlist: str, revision: str, /) -> Mapping[str, Any] | None:
+        """
+        Gets the operations applied to the playlist since the given revision.
+
+        Returns None if Spotify does not know the revision anymore.
+        """
+        url = f"https://spclient.wg.spotify.com/playlist/v2/playlist/{_playlist_id(playlist)}/diff"
+        params = {"revision": revision, "handlesContent": ""}
+        headers = {"Accept": "application/json"}
+
+        # A 4xx is expected here when the revision is unknown, so do not raise on failure
+        resp = self.base.client.get(
+            url, params=params, headers=headers, authenticate=True, danger=False
+        )
+
+        if resp.fail or not isinstance(resp.response, Mapping):
+            return None
+
+        if not isinstance(resp.response.get("diff"), Mapping):
+            return None
+
+        return resp.response
+
+    def _download(self, playlist_id: str) -> PlaylistSnapshot:
+        # The playlist may be edited while paging through it, start over if the revision moves
+        for _ in range(3):
+            first = self.get_contents(playlist_id, self.UPPER_LIMIT)
+            revision = str(first["revision"])
+            total_count: int = int(first.get("length", 0))
+            items = [
+                _entry(item) for item in first.get("contents", {}).get("items", [])
+            ]
+
+            offset = len(items)
+            while offset < total_count:
+                page = self.get_contents(playlist_id, self.UPPER_LIMIT, offset=offset)
+                if str(page["revision"]) != revision:
+                    break
+
+                page_items = page.get("contents", {}).get("items", [])
+                if not page_items:
+                    break
+
+                items.extend(_entry(item) for item in page_items)
+                offset += len(page_items)
+            else:
+                return PlaylistSnapshot(playlist_id, revision, items)
+
+        raise PlaylistError("Playlist kept changing while it was being downloaded")
+
+    def sync(self, playlist: str, /) -> PlaylistChanges:
+        """
+        Brings the local snapshot of a playlist up to date.
+
+        Returns what was added, removed and moved since the previous sync.
+        The first sync of a playlist reports every entry as added.
+        """
+        playlist_id = _playlist_id(playlist)
+        before = self.snapshots.get(playlist_id)
+
+        after: PlaylistSnapshot | None = None
+        moved_uids: List[str] = []
+
+        if before is not None:
+            diff = self.get_diff(playlist_id, before.revision)
+            if diff is not None:
+                items = list(before.items)
+                try:
+                    moved_uids = _apply_ops(items, diff["diff"].get("ops", []))
+                except (IndexError, KeyError, ValueError):
+                    # The stored snapshot no longer lines up with the server, start over
+                    moved_uids = []
+                else:
+                    revision = diff["diff"].get("toRevision") or diff.get("revision")
+                    after = PlaylistSnapshot(
+                        playlist_id, str(revision or before.revision), items
+                    )
+
+        full_resync = after is None
+        if after is None:
+            after = self._download(playlist_id)
+
+        self.snapshots[playlist_id] = after
+        self._persist()
+
+        return _compare_snapshots(playlist_id, before, after, moved_uids, full_resync)
+
+    def snapshot(self, playlist: str, /) -> PlaylistSnapshot | None:
+        """Gets the stored snapshot of a playlist, if any."""
+        return self.snapshots.get(_playlist_id(playlist))
+
+    def forget(self, playlist: str, /) -> None:
+        """Drops the stored snapshot, the next sync will download the playlist in full."""
+        self.snapshots.pop(_playlist_id(playlist), None)
+        self._persist()
+
+    def _persist(self) -> None:
+        if not self.path:
+            return
+
+        # Write to a temporary file first so a crash never leaves a truncated file behind
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump([snapshot.to_dict() for snapshot in self.snapshots.values()], f)
+
+        os.replace(tmp_path, self.path)
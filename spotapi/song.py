@@ -1,13 +1,133 @@
 import json
-from typing import Any, List, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Tuple
 from spotapi.types.annotations import enforce
-from spotapi.exceptions import SongError
+from spotapi.types.data import ChunkResult
+from spotapi.exceptions import RequestError, SongError
+from spotapi.http.data import Response
 from spotapi.http.request import TLSClient
 from spotapi.client import BaseClient
 from collections.abc import Mapping, Iterable, Generator
 from spotapi.playlist import PrivatePlaylist, PublicPlaylist
 
-__all__ = ["Song", "SongError"]
+__all__ = ["Song", "SongError", "ChunkResult"]
+
+# Largest batch the playlist mutations reliably accept (same limit as the public Web API)
+MUTATION_CHUNK_SIZE: int = 100
+
+
+def _chunked(items: List[str], size: int) -> List[List[str]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _run_chunk(
+    index: int,
+    chunk: List[str],
+    send: Callable[[List[str]], Response],
+    *,
+    retries: int,
+    idempotent: bool,
+    landed: Callable[[List[str]], bool] | None,
+) -> ChunkResult:
+    result = ChunkResult(index=index, items=chunk)
+
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(min(0.5 * 2**attempt, 8.0))
+
+        result.attempts = attempt + 1
+        try:
+            resp = send(chunk)
+        except RequestError as e:
+            result.error = e.error or str(e)
+            ambiguous = True
+        else:
+            if resp.success:
+                result.success = True
+                result.error = None
+                return result
+
+            result.error = resp.error.string
+            # Rejected for good, only a 429 or a 5xx may succeed on a retry
+            if 400 <= resp.status_code < 500 and resp.status_code != 429:
+                return result
+
+            # A 5xx does not tell whether the mutation was applied, a 429 does
+            ambiguous = resp.status_code >= 500
+
+        if ambiguous and not idempotent:
+            # Only retry once we know the chunk did not make it, otherwise items get duplicated
+            if landed is None:
+                return result
+
+            try:
+                if landed(chunk):
+                    result.success = True
+                    result.error = None
+                    return result
+            except Exception:
+                return result
+
+    return result
+
+
+def _mutate(
+    items: List[str],
+    send: Callable[[List[str]], Response],
+    *,
+    chunk_size: int,
+    workers: int,
+    retries: int,
+    ordered: bool,
+    idempotent: bool,
+    landed: Callable[[List[str]], bool] | None = None,
+) -> List[ChunkResult]:
+    if chunk_size <= 0 or workers <= 0 or retries < 0:
+        raise ValueError("chunk_size and workers must be positive, retries >= 0")
+
+    chunks = _chunked(items, chunk_size)
+
+    if ordered:
+        results: List[ChunkResult] = []
+        for index, chunk in enumerate(chunks):
+            if results and not results[-1].success:
+                # Sending later chunks would break the ordering of the playlist
+                results.append(
+                    ChunkResult(
+                        index=index,
+                        items=chunk,
+                        error="Skipped, a previous chunk failed",
+                    )
+                )
+                continue
+
+            results.append(
+                _run_chunk(
+                    index,
+                    chunk,
+                    send,
+                    retries=retries,
+                    idempotent=idempotent,
+                    landed=landed,
+                )
+            )
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks) or 1)) as pool:
+        futures = [
+            pool.submit(
+                _run_chunk,
+                index,
+                chunk,
+                send,
+                retries=retries,
+                idempotent=idempotent,
+                landed=landed,
+            )
+            for index, chunk in enumerate(chunks)
+        ]
+        return [future.result() for future in futures]
 
 
 @enforce
@@ -134,16 +254,14 @@ class Song:
             ]["tracksV2"]["items"]
             offset += UPPER_LIMIT
 
-    def add_songs_to_playlist(self, song_ids: List[str], /) -> None:
-        """Adds multiple songs to the playlist"""
-        # This can be a bit slow when adding 500+ songs, maybe we should add a batch processing
-        if not self.playlist or not hasattr(self.playlist, "playlist_id"):
-            raise ValueError("Playlist not set")
+    def _stage_add_songs(self, uris: List[str]) -> Response:
+        # If None, something internal went wrong
+        assert self.playlist is not None, "Playlist not set"
 
         url = "https://api-partner.spotify.com/pathfinder/v1/query"
         payload = {
             "variables": {
-                "playlistItemUris": [f"spotify:track:{song_id}" for song_id in song_ids],
+                "playlistItemUris": uris,
                 "playlistUri": f"spotify:playlist:{self.playlist.playlist_id}",
                 "newPosition": {"moveType": "BOTTOM_OF_PLAYLIST", "fromUid": None},
             },
@@ -155,10 +273,99 @@ class Song:
                 }
             },
         }
-        resp = self.base.client.post(url, json=payload, authenticate=True)
+        return self.base.client.post(url, json=payload, authenticate=True)
 
-        if resp.fail:
-            raise SongError("Could not add songs to playlist", error=resp.error.string)
+    def _landed_at_bottom(self, uris: List[str]) -> bool:
+        """Checks whether the playlist already ends with the given uris."""
+        assert self.playlist is not None, "Playlist not set"
+
+        playlist = PublicPlaylist(self.playlist.playlist_id, client=self.base.client)
+        content = playlist.get_playlist_info(limit=1)["data"]["playlistV2"]["content"]
+        total_count: int = content["totalCount"]
+
+        if total_count < len(uris):
+            return False
+
+        tail = playlist.get_playlist_info(
+            limit=len(uris), offset=total_count - len(uris)
+        )["data"]["playlistV2"]["content"]["items"]
+        return [item["itemV2"]["data"]["uri"] for item in tail] == uris
+
+    def bulk_add_songs(
+        self,
+        song_ids: List[str],
+        /,
+        *,
+        chunk_size: int = MUTATION_CHUNK_SIZE,
+        workers: int = 4,
+        retries: int = 3,
+        preserve_order: bool = True,
+    ) -> List[ChunkResult]:
+        """
+        Adds songs to the bottom of the playlist in chunks and reports the result of every chunk.
+
+        With preserve_order, chunks are sent one after the other and the remaining chunks are
+        skipped once one fails. Otherwise they are sent concurrently by `workers` threads.
+
+        Failed chunks are retried, but only when the add is known not to have been applied:
+        ambiguous failures (network errors, 5xx) are first checked against the end of the playlist
+        when ordered, and not retried when concurrent.
+        """
+        if not self.playlist or not hasattr(self.playlist, "playlist_id"):
+            raise ValueError("Playlist not set")
+
+        uris = [
+            song_id if song_id.startswith("spotify:") else f"spotify:track:{song_id}"
+            for song_id in song_ids
+        ]
+        # Resolve the operation hash once instead of racing on it from every worker
+        self.base.part_hash("addToPlaylist")
+        return _mutate(
+            uris,
+            self._stage_add_songs,
+            chunk_size=chunk_size,
+            workers=workers,
+            retries=retries,
+            ordered=preserve_order,
+            idempotent=False,
+            landed=self._landed_at_bottom if preserve_order else None,
+        )
+
+    def bulk_remove_songs(
+        self,
+        uids: List[str],
+        /,
+        *,
+        chunk_size: int = MUTATION_CHUNK_SIZE,
+        workers: int = 4,
+        retries: int = 3,
+    ) -> List[ChunkResult]:
+        """
+        Removes playlist entries by uid in concurrent chunks and reports the result of every chunk.
+        Removing by uid is idempotent, so failed chunks are always retried.
+        """
+        if not self.playlist or not hasattr(self.playlist, "playlist_id"):
+            raise ValueError("Playlist not set")
+
+        self.base.part_hash("removeFromPlaylist")
+        return _mutate(
+            uids,
+            self._send_remove_songs,
+            chunk_size=chunk_size,
+            workers=workers,
+            retries=retries,
+            ordered=False,
+            idempotent=True,
+        )
+
+    def add_songs_to_playlist(self, song_ids: List[str], /) -> None:
+        """Adds multiple songs to the playlist"""
+        failed = [
+            result for result in self.bulk_add_songs(song_ids) if not result.success
+        ]
+
+        if failed:
+            raise SongError("Could not add songs to playlist", error=failed[0].error)
 
     def add_song_to_playlist(self, song_id: str, /) -> None:
         """Adds a song to the playlist"""
@@ -167,7 +374,7 @@ class Song:
 
         self.add_songs_to_playlist([song_id])
 
-    def _stage_remove_song(self, uids: List[str]) -> None:
+    def _send_remove_songs(self, uids: List[str]) -> Response:
         # If None, something internal went wrong
         assert self.playlist is not None, "Playlist not set"
 
@@ -185,12 +392,16 @@ class Song:
                 }
             },
         }
+        return self.base.client.post(url, json=payload, authenticate=True)
 
-        resp = self.base.client.post(url, json=payload, authenticate=True)
+    def _stage_remove_song(self, uids: List[str]) -> None:
+        failed = [
+            result for result in self.bulk_remove_songs(uids) if not result.success
+        ]
 
-        if resp.fail:
+        if failed:
             raise SongError(
-                "Could not remove song from playlist", error=resp.error.string
+                "Could not remove song from playlist", error=failed[0].error
             )
 
     @staticmethod
@@ -1,13 +1,26 @@
 import threading
 import functools
+import time
+from spotapi.exceptions import WebSocketError
 from spotapi.login import Login
 from spotapi.types.annotations import enforce
-from spotapi.types.data import PlayerState, Devices, Track
-from spotapi.websocket import WebsocketStreamer
+from spotapi.types.data import (
+    DispatchStats,
+    LazyDevices,
+    LazyPlayerState,
+    PlayerState,
+    Devices,
+    Track,
+)
+from spotapi.types.events import STATE_EVENTS, StateDiffer
+from spotapi.utils import fastjson
+from spotapi.utils.dispatch import CoalesceKey, EventDispatcher, OverflowPolicy
+from spotapi.websocket import WebsocketStreamer, _peek_update_reasons
 from typing import Dict, Any, Callable, List, ParamSpec, TypeVar
 
 __all__ = [
     "PlayerStatus",
+    "ClusterMirror",
     "WebsocketStreamer",
     "EventManager",
     "PlayerState",
@@ -19,6 +32,154 @@ R = TypeVar("R")
 P = ParamSpec("P")
 
 
+def _cluster_timestamp(cluster: Dict[str, Any]) -> int:
+    try:
+        return int(cluster.get("server_timestamp_ms") or cluster.get("timestamp") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _is_complete_cluster(cluster: Any) -> bool:
+    # The state and the devices are swapped together, a partial update would split them
+    return (
+        isinstance(cluster, dict)
+        and isinstance(cluster.get("player_state"), dict)
+        and isinstance(cluster.get("devices"), dict)
+    )
+
+
+class ClusterMirror:
+    """
+    Local copy of the connect-state cluster.
+
+    Every dealer cluster update carries the whole cluster, so applying one is a swap.
+    The parsed PlayerState and Devices are built on first read and reused until the next update.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_changed",
+        "_cluster",
+        "_timestamp",
+        "_state",
+        "_devices",
+        "stale",
+        "updates",
+        "ignored",
+        "updated_at",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Notified on every new cluster, see wait_for
+        self._changed = threading.Condition(self._lock)
+        self._cluster: Dict[str, Any] | None = None
+        self._timestamp = 0
+        self._state: PlayerState | None = None
+        self._devices: Devices | None = None
+        # Nothing received yet, or a gap (reconnect) since the last update
+        self.stale = True
+        self.updates = 0
+        self.ignored = 0
+        self.updated_at: float | None = None
+
+    def __str__(self) -> str:
+        return "ClusterMirror()"
+
+    def reset(self, cluster: Dict[str, Any]) -> None:
+        """Replaces the mirror with a cluster fetched over HTTP."""
+        with self._lock:
+            self._set(cluster)
+
+    def apply(self, cluster: Dict[str, Any]) -> bool:
+        """Applies a dealer cluster update, updates older than the mirror are ignored."""
+        with self._lock:
+            if _cluster_timestamp(cluster) < self._timestamp:
+                self.ignored += 1
+                return False
+
+            self._set(cluster)
+            self.updates += 1
+            return True
+
+    def _set(self, cluster: Dict[str, Any]) -> None:
+        self._cluster = cluster
+        self._timestamp = _cluster_timestamp(cluster)
+        self._state = None
+        self._devices = None
+        self.stale = False
+        self.updated_at = time.time()
+        self._changed.notify_all()
+
+    def invalidate(self) -> None:
+        """Marks the mirror as stale, the next read refreshes it over HTTP."""
+        self.stale = True
+
+    def wait_for(
+        self, predicate: Callable[[Dict[str, Any]], bool], timeout: float | None = None
+    ) -> bool:
+        """
+        Waits until the mirrored cluster satisfies the predicate, returns False on timeout.
+        The predicate gets the raw cluster and runs under the mirror lock, it must not read
+        the parsed properties.
+        """
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: self._cluster is not None and predicate(self._cluster), timeout
+            )
+
+    @property
+    def cluster(self) -> Dict[str, Any] | None:
+        return self._cluster
+
+    @property
+    def state(self) -> PlayerState:
+        with self._lock:
+            if self._state is None:
+                if self._cluster is None or self._cluster.get("player_state") is None:
+                    raise ValueError("Could not get player state")
+
+                self._state = PlayerState.from_dict(self._cluster["player_state"])
+
+            return self._state
+
+    @property
+    def devices(self) -> Devices:
+        with self._lock:
+            if self._devices is None:
+                if self._cluster is None or self._cluster.get("devices") is None:
+                    raise ValueError("Could not get devices")
+
+                self._devices = Devices.from_dict(
+                    self._cluster["devices"], self._cluster.get("active_device_id")
+                )
+
+            return self._devices
+
+    @property
+    def active_device_id(self) -> str | None:
+        return self._cluster.get("active_device_id") if self._cluster else None
+
+    @property
+    def lazy_state(self) -> LazyPlayerState:
+        """The player state without parsing the queue and nested objects up front."""
+        cluster = self._cluster
+        if cluster is None or cluster.get("player_state") is None:
+            raise ValueError("Could not get player state")
+
+        return LazyPlayerState.from_dict(cluster["player_state"])
+
+    @property
+    def lazy_devices(self) -> LazyDevices:
+        cluster = self._cluster
+        if cluster is None or cluster.get("devices") is None:
+            raise ValueError("Could not get devices")
+
+        return LazyDevices.from_dict(
+            cluster["devices"], cluster.get("active_device_id")
+        )
+
+
 @enforce
 class PlayerStatus(WebsocketStreamer):
     """
@@ -36,7 +197,12 @@ class PlayerStatus(WebsocketStreamer):
     _state: Dict[str, Any] | None = None
     _devices: Dict[str, Any] | None = None
 
+    # Nothing reads the inbox of a bare PlayerStatus, cluster updates only feed the mirror
+    _queue_packets: bool = False
+
     def __init__(self, login: Login, s_device_id: str | None = None) -> None:
+        # Set before connecting, the reader thread applies cluster updates to it
+        self.mirror = ClusterMirror()
         super().__init__(login)
 
         if s_device_id:
@@ -46,9 +212,43 @@ class PlayerStatus(WebsocketStreamer):
         self.register_device()
 
     def renew_state(self) -> None:
-        self._device_dump = self.connect_device()
-        self._state = self._device_dump["player_state"]
-        self._devices = self._device_dump["devices"]
+        """Fetches the cluster over HTTP, which also subscribes to its updates."""
+        dump = self.connect_device()
+        self.mirror.reset(dump)
+        self._set_dump(dump)
+
+    def _set_dump(self, dump: Dict[str, Any]) -> None:
+        self._device_dump = dump
+        self._state = dump["player_state"]
+        self._devices = dump["devices"]
+
+    def _refresh_if_stale(self) -> None:
+        # A dead reader means updates may have been missed
+        if not self.reader_thread.is_alive():
+            self.mirror.invalidate()
+
+        if self.mirror.stale:
+            self.renew_state()
+
+    def _process_frame(self, frame: str) -> str | Dict[str, Any] | None:
+        reasons = _peek_update_reasons(frame)
+        if not reasons:
+            return super()._process_frame(frame) if self._queue_packets else None
+
+        packet = dict(fastjson.loads(frame))
+        for payload in packet.get("payloads") or ():
+            cluster = payload.get("cluster") if isinstance(payload, dict) else None
+            if _is_complete_cluster(cluster) and self.mirror.apply(cluster):
+                self._set_dump(cluster)
+
+        if self._queue_packets and self._wants_update(reasons):
+            return packet
+
+        return None
+
+    def _wants_update(self, reasons: List[str]) -> bool:
+        """Whether a decoded cluster update is queued for get_packet."""
+        return True
 
     @functools.cached_property
     def saved_state(self) -> PlayerState:
@@ -63,13 +263,12 @@ class PlayerStatus(WebsocketStreamer):
 
     @property
     def state(self) -> PlayerState:
-        """Gets the current state of the player."""
-        self.renew_state()
-
-        if self._state is None:
-            raise ValueError("Could not get player state")
-
-        return PlayerState.from_dict(self._state)
+        """
+        Gets the current state of the player.
+        Read from the mirror, only fetched over HTTP when it is stale.
+        """
+        self._refresh_if_stale()
+        return self.mirror.state
 
     @functools.cached_property
     def saved_device_ids(self) -> Devices:
@@ -91,32 +290,19 @@ class PlayerStatus(WebsocketStreamer):
     @property
     def device_ids(self) -> Devices:
         """Gets the current device IDs of the player."""
-        self.renew_state()
-
-        if self._devices is None:
-            raise ValueError("Could not get devices")
-
-        active_device_id = (
-            self._device_dump.get("active_device_id") if self._device_dump else None
-        )
-
-        return Devices.from_dict(
-            self._devices,
-            str(active_device_id) if hasattr(active_device_id, "__str__") else None,  # type: ignore
-        )
+        self._refresh_if_stale()
+        return self.mirror.devices
 
     @property
     def active_device_id(self) -> str:
         """Gets the active device ID of the player."""
-        self.renew_state()
+        self._refresh_if_stale()
+        active_device_id = self.mirror.active_device_id
 
-        if (
-            self._device_dump is None
-            or self._device_dump.get("active_device_id") is None
-        ):
+        if active_device_id is None:
             raise ValueError("Could not get active device ID")
 
-        return self._device_dump["active_device_id"]
+        return active_device_id
 
     @property
     def next_song_in_queue(self) -> Track | None:
@@ -162,73 +348,177 @@ class EventManager(PlayerStatus):
         The login instance used for authentication.
     s_device_id : Optional[str], optional
         The device ID to use for the player. If None, a new device ID will be generated.
+    dispatcher : Optional[EventDispatcher], optional
+        Runs the subscribers off the listener thread. Pass one to pick the worker count,
+        mailbox size and overflow policy. It is closed with the manager.
+
+    Besides the raw update reasons (e.g. "PLAYER_STATE_CHANGED"), the typed events of
+    spotapi.types.events (TrackChanged, Seeked, QueueChanged, ...) can be subscribed to.
     """
 
+    _queue_packets = True
+
     __slots__ = (
         "_current_state",
         "wlock",
         "_subscriptions",
+        "dispatcher",
+        "differ",
         "listener",
     )
 
-    def __init__(self, login: Login, s_device_id: str | None = None) -> None:
-        super().__init__(login, s_device_id)
-        self._current_state = self.state  # Need this to activate websocket
-
+    def __init__(
+        self,
+        login: Login,
+        s_device_id: str | None = None,
+        *,
+        dispatcher: EventDispatcher | None = None,
+    ) -> None:
+        # Set before connecting, the reader thread filters frames with the subscriptions
         self.wlock = threading.Lock()
         self._subscriptions: Dict[str, List[Callable[..., Any]]] = {}
+        self.dispatcher = dispatcher or EventDispatcher()
+        self.differ = StateDiffer()
+
+        super().__init__(login, s_device_id)
+        self._current_state = self.state  # Need this to activate websocket
 
         self.listener = threading.Thread(target=self._listen, daemon=True)
         self.listener.start()
 
-    def _subscribe_callable(self, event: str, func: Callable[..., Any]) -> None:
+    def _subscribe_callable(
+        self,
+        event: str,
+        func: Callable[..., Any],
+        *,
+        policy: OverflowPolicy | None = None,
+        maxsize: int | None = None,
+        coalesce_key: CoalesceKey | None = None,
+    ) -> None:
         with self.wlock:
             if event not in self._subscriptions:
                 self._subscriptions[event] = []
 
             if func not in self._subscriptions[event]:
+                if event in STATE_EVENTS and not self._has_state_subscribers():
+                    # Diff against the current state, not the one of the last subscriber
+                    self._refresh_if_stale()
+                    self.differ.update(self.mirror.lazy_state, self.mirror.lazy_devices)
+
                 self._subscriptions[event].append(func)
+                self.dispatcher.add(
+                    event,
+                    func,
+                    policy=policy,
+                    maxsize=maxsize,
+                    coalesce_key=coalesce_key,
+                )
             else:
                 raise ValueError(
                     f"Function {func.__name__} is already subscribed to event '{event}'"
                 )
 
-    def subscribe(self, event: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    def subscribe(
+        self,
+        event: str | type,
+        *,
+        policy: OverflowPolicy | None = None,
+        maxsize: int | None = None,
+        coalesce_key: CoalesceKey | None = None,
+    ) -> Callable[[Callable[P, R]], Callable[P, R]]:
         """
-        Decorator to subscribe a function to a Spotify websocket event.
+        Decorator to subscribe a function (or coroutine function) to a Spotify websocket event,
+        or to a StateEvent class. The policy and mailbox size default to the dispatcher's,
+        `coalesce_key` picks the events a "coalesce" mailbox replaces.
         """
+        if isinstance(event, type):
+            event = event.__name__
 
         def decorator(func: Callable[P, R]) -> Callable[P, R]:
-            @functools.wraps(func)
-            def wrapped(*args: P.args, **kwargs: P.kwargs) -> R:
-                result = func(*args, **kwargs)
-                return result
-
-            self._subscribe_callable(event, wrapped)
-            return wrapped
+            self._subscribe_callable(
+                event,
+                func,
+                policy=policy,
+                maxsize=maxsize,
+                coalesce_key=coalesce_key,
+            )
+            return func
 
         return decorator
 
+    def _has_state_subscribers(self) -> bool:
+        return any(self._subscriptions.get(name) for name in STATE_EVENTS)
+
+    def _wants_update(self, reasons: List[str]) -> bool:
+        # Updates nobody subscribed to only feed the mirror
+        return self._has_state_subscribers() or any(
+            self._subscriptions.get(reason) for reason in reasons
+        )
+
     def _emit(self, event: str, *args: Any, **kwargs: Any) -> None:
         """
-        Emit an event, triggering all subscribed functions.
-        Should only be called from the WebsocketStreamer thread.
+        Emit an event to all subscribed functions.
+        The functions run on the dispatcher workers, so this only blocks for full "block" mailboxes.
         """
-        if event in self._subscriptions:
-            for func in self._subscriptions[event]:
-                func(*args, **kwargs)
+        self.dispatcher.dispatch(event, *args, **kwargs)
 
-    def unsubscribe(self, event: str, func: Callable[..., Any]) -> None:
+    def unsubscribe(self, event: str | type, func: Callable[..., Any]) -> None:
         """Unsubscribe a function from an event."""
+        if isinstance(event, type):
+            event = event.__name__
+
         with self.wlock:
             if event in self._subscriptions:
                 self._subscriptions[event].remove(func)
+                self.dispatcher.remove(event, func)
+
+    def close(self) -> None:
+        """Closes the websocket, then the dispatcher once the pending events are delivered."""
+        super().close()
+        self.dispatcher.close()
+
+    def dispatch_stats(self) -> List[DispatchStats]:
+        """Delivered, dropped and coalesced counts and dispatch latency of every subscriber."""
+        return self.dispatcher.stats()
 
     def _listen(self) -> None:
         while True:
-            event = self.get_packet()
+            try:
+                event = self.get_packet()
+            except WebSocketError:
+                # Closed, the mirror falls back to HTTP on the next read
+                return
+
             if event is None or event.get("payloads") is None:
                 continue
 
             for payload in event["payloads"]:
-                self._emit(payload["update_reason"], payload)
+                reason = (
+                    payload.get("update_reason") if isinstance(payload, dict) else None
+                )
+                if not reason:
+                    continue
+
+                self._emit(reason, payload)
+
+                if (
+                    _is_complete_cluster(payload.get("cluster"))
+                    and self._has_state_subscribers()
+                ):
+                    self._emit_changes(payload["cluster"])
+
+    def _emit_changes(self, cluster: Dict[str, Any]) -> None:
+        # Lazy views, the differ only parses what it compares
+        state = (
+            LazyPlayerState.from_dict(cluster["player_state"])
+            if cluster.get("player_state")
+            else None
+        )
+        devices = (
+            LazyDevices.from_dict(cluster["devices"], cluster.get("active_device_id"))
+            if cluster.get("devices") is not None
+            else None
+        )
+
+        for change in self.differ.update(state, devices):
+            self._emit(type(change).__name__, change)
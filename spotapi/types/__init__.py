@@ -1,2 +1,3 @@
 from spotapi.types.data import *
 from spotapi.types.interfaces import *
+from spotapi.types.events import *
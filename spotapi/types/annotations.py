@@ -1,10 +1,12 @@
 import inspect
 import functools
 from collections.abc import Iterable, Sequence, Mapping, Generator
+from collections.abc import Callable as ABCCallable
 from typing import (
     Any,
     Callable,
     Dict,
+    Literal,
     Optional,
     TypeVar,
     ParamSpec,
@@ -75,6 +77,9 @@ def is_instance_of(value: Any, expected_type: Any) -> bool:
         case _ if origin is Union:
             return any(is_instance_of(value, t) for t in args)
 
+        case _ if origin is Literal:
+            return value in args
+
         case _ if origin is list:
             return isinstance(value, list) and all(
                 is_instance_of(item, args[0]) for item in value
@@ -105,6 +110,9 @@ def is_instance_of(value: Any, expected_type: Any) -> bool:
         case _ if origin is Generator:
             return isinstance(value, Generator)
 
+        case _ if origin is ABCCallable:
+            return callable(value)
+
         case _:
             return isinstance(value, expected_type)
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from spotapi.http.request import TLSClient
-from typing import List, Dict, Any, Union
+from collections.abc import Sequence
+from typing import List, Dict, Any, Mapping, Tuple, Union
 from spotapi.types.interfaces import CaptchaProtocol, LoggerProtocol
 
 __all__ = [
@@ -23,6 +25,19 @@ __all__ = [
     "MetadataMap",
     "Device",
     "Devices",
+    "TrackRecord",
+    "AlbumRecord",
+    "ArtistRecord",
+    "EpisodeRecord",
+    "PlaylistSnapshot",
+    "PlaylistChanges",
+    "ChunkResult",
+    "LatencyStats",
+    "DealerMetrics",
+    "DispatchStats",
+    "LazyTracks",
+    "LazyPlayerState",
+    "LazyDevices",
 ]
 
 
@@ -86,12 +101,13 @@ class Track:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Track":
-        metadata = data.get("metadata", {})
-        if isinstance(metadata, dict):
-            data["metadata"] = Metadata.from_dict(metadata)
+        # `data` is left as is, it can be the live cluster other subscribers hold
         valid_keys = {
             key: data[key] for key in cls.__annotations__.keys() if key in data
         }
+        metadata = data.get("metadata", {})
+        if isinstance(metadata, dict):
+            valid_keys["metadata"] = Metadata.from_dict(metadata)
         return cls(**valid_keys)
 
     def __str__(self) -> str:
@@ -445,3 +461,559 @@ class Devices:
 
     def __str__(self) -> str:
         return "Devices()"
+
+
+# Lazy player state
+#
+# Slotted views over the raw connect-state dicts. Scalars are read straight from the
+# dict and nested objects are only parsed on first access, so reading `is_paused` or
+# the current track does not pay for a queue of hundreds of tracks.
+
+
+class _Lazy:
+    """Reads a key of the raw dict, parsing nested values once on first access."""
+
+    __slots__ = ("key", "parse", "factory")
+
+    def __init__(self, parse: Any = None, factory: Any = None) -> None:
+        self.parse = parse
+        self.factory = factory
+        self.key = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.key = name
+
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        if obj is None:
+            return self
+
+        if self.parse is None:
+            value = obj._data.get(self.key)
+            if value is None and self.factory is not None:
+                return self.factory()
+            return value
+
+        parsed = obj._parsed
+        try:
+            return parsed[self.key]
+        except KeyError:
+            pass
+
+        value = obj._data.get(self.key)
+        if value is not None:
+            value = self.parse(value)
+        elif self.factory is not None:
+            value = self.factory()
+
+        parsed[self.key] = value
+        return value
+
+
+class LazyTracks(Sequence):
+    """A list of raw tracks, parsed one by one as they are accessed."""
+
+    __slots__ = ("_raw", "_tracks")
+
+    def __init__(self, raw: List[Dict[str, Any]]) -> None:
+        self._raw = raw
+        self._tracks: List[Track | None] = [None] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+
+        track = self._tracks[index]
+        if track is None:
+            track = self._tracks[index] = Track.from_dict(self._raw[index])
+        return track
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyTracks):
+            return self._raw == other._raw
+        return list(self) == other
+
+    def uris(self) -> List[str | None]:
+        """The track uris, without parsing the tracks."""
+        return [track.get("uri") for track in self._raw]
+
+    def __str__(self) -> str:
+        return "LazyTracks()"
+
+
+class LazyPlayerState:
+    """
+    Lazily parsed, slotted equivalent of PlayerState.
+    Use `to_player_state()` when a real PlayerState is needed.
+    """
+
+    __slots__ = ("_data", "_parsed")
+
+    timestamp = _Lazy()
+    context_uri = _Lazy()
+    context_url = _Lazy()
+    context_restrictions = _Lazy(factory=dict)
+    play_origin = _Lazy(lambda data: PlayOrigin.from_dict(data))
+    index = _Lazy(lambda data: Index.from_dict(data))
+    track = _Lazy(lambda data: Track.from_dict(data))
+    playback_id = _Lazy()
+    playback_speed = _Lazy()
+    position_as_of_timestamp = _Lazy()
+    duration = _Lazy()
+    is_playing = _Lazy()
+    is_paused = _Lazy()
+    is_system_initiated = _Lazy()
+    options = _Lazy(lambda data: Options.from_dict(data))
+    restrictions = _Lazy(lambda data: Restrictions.from_dict(data))
+    suppressions = _Lazy(factory=dict)
+    prev_tracks = _Lazy(LazyTracks, lambda: LazyTracks([]))
+    next_tracks = _Lazy(LazyTracks, lambda: LazyTracks([]))
+    context_metadata = _Lazy(lambda data: ContextMetadata.from_dict(data))
+    page_metadata = _Lazy(factory=dict)
+    session_id = _Lazy()
+    queue_revision = _Lazy()
+    playback_quality = _Lazy(lambda data: PlaybackQuality.from_dict(data))
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = data
+        self._parsed: Dict[str, Any] = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LazyPlayerState":
+        return cls(data)
+
+    def to_player_state(self) -> PlayerState:
+        return PlayerState.from_dict(self._data)
+
+    def __str__(self) -> str:
+        return "LazyPlayerState()"
+
+
+class LazyDevices(Mapping):
+    """
+    Lazily parsed, slotted equivalent of Devices.
+    It also is a mapping of device id to Device, the devices are parsed on first access.
+    """
+
+    __slots__ = ("_raw", "_devices", "active_device_id")
+
+    def __init__(self, data: Dict[str, Any], active_device_id: str | None) -> None:
+        self._raw = data
+        self._devices: Dict[str, Device] = {}
+        self.active_device_id = active_device_id
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], active_device_id: str | None
+    ) -> "LazyDevices":
+        return cls(data, active_device_id)
+
+    @property
+    def devices(self) -> "LazyDevices":
+        # Same access pattern as Devices.devices[device_id]
+        return self
+
+    def __getitem__(self, device_id: str) -> Device:
+        device = self._devices.get(device_id)
+        if device is None:
+            device = self._devices[device_id] = Device.from_dict(self._raw[device_id])
+        return device
+
+    def __contains__(self, device_id: object) -> bool:
+        return device_id in self._raw
+
+    def __iter__(self) -> Any:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def volume(self, device_id: str) -> int | None:
+        """A device's volume, without parsing it."""
+        return self._raw[device_id].get("volume")
+
+    def to_devices(self) -> Devices:
+        return Devices.from_dict(self._raw, self.active_device_id)
+
+    def __str__(self) -> str:
+        return "LazyDevices()"
+
+
+# Catalog records
+#
+# Compact, slotted views over the pathfinder payloads (fetchPlaylist, getAlbum,
+# searchDesktop, ...). They only keep the fields people actually use, so
+# holding millions of them costs a fraction of the raw nested dicts.
+
+
+def _intern(value: Any) -> str | None:
+    # Artist and album names/uris repeat a lot across a catalog, share them
+    return sys.intern(value) if isinstance(value, str) else None
+
+
+def _to_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _artists(node: Mapping[str, Any] | None) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    items = (node or {}).get("items") or ()
+    names = tuple(
+        sys.intern(str((artist.get("profile") or {}).get("name", "")))
+        for artist in items
+    )
+    uris = tuple(sys.intern(str(artist.get("uri", ""))) for artist in items)
+    return names, uris
+
+
+def _cover(node: Mapping[str, Any] | None) -> str | None:
+    sources = (node or {}).get("sources") or ()
+    if not sources:
+        return None
+    # Spotify does not order the sources consistently, pick the largest one
+    best = max(sources, key=lambda source: source.get("width") or 0)
+    return best.get("url")
+
+
+def _unwrap(
+    item: Mapping[str, Any],
+) -> Tuple[Mapping[str, Any], str | None, str | None]:
+    """
+    Strips the wrappers the different endpoints put around an entity.
+
+    Returns the entity itself, its playlist/album uid and the date it was added.
+    """
+    uid = item.get("uid")
+    added_at = (item.get("addedAt") or {}).get("isoString")
+
+    if "itemV2" in item:  # fetchPlaylist / fetchLibraryTracks
+        item = item["itemV2"]
+    elif "item" in item:  # searchDesktop tracks
+        item = item["item"]
+    elif "entity" in item:  # queryPodcastEpisodes
+        item = item["entity"]
+    elif "track" in item:  # getAlbum
+        return item["track"], uid, added_at
+    elif "releases" in item:  # queryArtistDiscography*
+        releases = item["releases"].get("items") or [{}]
+        return releases[0], uid, added_at
+
+    return item.get("data", item), uid, added_at
+
+
+@dataclass(slots=True)
+class TrackRecord:
+    uri: str
+    name: str
+    duration_ms: int | None = None
+    artist_names: Tuple[str, ...] = ()
+    artist_uris: Tuple[str, ...] = ()
+    album_uri: str | None = None
+    album_name: str | None = None
+    explicit: bool = False
+    playable: bool = True
+    track_number: int | None = None
+    disc_number: int | None = None
+    playcount: int | None = None
+    uid: str | None = None
+    added_at: str | None = None
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Mapping[str, Any],
+        *,
+        uid: str | None = None,
+        added_at: str | None = None,
+        album: "AlbumRecord | None" = None,
+    ) -> "TrackRecord":
+        """Builds a record from a raw pathfinder track entity."""
+        duration = data.get("trackDuration") or data.get("duration") or {}
+        album_of_track = data.get("albumOfTrack") or {}
+        artist_names, artist_uris = _artists(data.get("artists"))
+
+        return cls(
+            uri=data.get("uri", ""),
+            name=data.get("name", ""),
+            duration_ms=_to_int(duration.get("totalMilliseconds")),
+            artist_names=artist_names,
+            artist_uris=artist_uris,
+            album_uri=_intern(album_of_track.get("uri"))
+            or (album.uri if album else None),
+            album_name=_intern(album_of_track.get("name"))
+            or (album.name if album else None),
+            explicit=(data.get("contentRating") or {}).get("label") == "EXPLICIT",
+            playable=bool((data.get("playability") or {}).get("playable", True)),
+            track_number=_to_int(data.get("trackNumber")),
+            disc_number=_to_int(data.get("discNumber")),
+            playcount=_to_int(data.get("playcount")),
+            uid=uid,
+            added_at=added_at,
+        )
+
+    @classmethod
+    def from_item(
+        cls, item: Mapping[str, Any], *, album: "AlbumRecord | None" = None
+    ) -> "TrackRecord":
+        """
+        Builds a record from an item of a paginated response.
+
+        Accepts fetchPlaylist, getAlbum and searchDesktop item shapes.
+        """
+        data, uid, added_at = _unwrap(item)
+        return cls.from_dict(data, uid=uid, added_at=added_at, album=album)
+
+    def __str__(self) -> str:
+        return "TrackRecord()"
+
+
+@dataclass(slots=True)
+class AlbumRecord:
+    uri: str
+    name: str
+    album_type: str | None = None
+    artist_names: Tuple[str, ...] = ()
+    artist_uris: Tuple[str, ...] = ()
+    release_date: str | None = None
+    total_tracks: int | None = None
+    label: str | None = None
+    cover_url: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "AlbumRecord":
+        """Builds a record from a raw pathfinder album entity (e.g. albumUnion)."""
+        date = data.get("date") or {}
+        tracks = data.get("tracksV2") or data.get("tracks") or {}
+        artist_names, artist_uris = _artists(data.get("artists"))
+        release_date = date.get("isoString") or date.get("year")
+
+        return cls(
+            uri=data.get("uri", ""),
+            name=data.get("name", ""),
+            album_type=_intern(data.get("type")),
+            artist_names=artist_names,
+            artist_uris=artist_uris,
+            release_date=str(release_date) if release_date is not None else None,
+            total_tracks=_to_int(tracks.get("totalCount")),
+            label=data.get("label"),
+            cover_url=_cover(data.get("coverArt")),
+        )
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> "AlbumRecord":
+        """
+        Builds a record from an item of a paginated response.
+
+        Accepts searchDesktop album items and artist discography items.
+        """
+        data, _, _ = _unwrap(item)
+        return cls.from_dict(data)
+
+    def __str__(self) -> str:
+        return "AlbumRecord()"
+
+
+@dataclass(slots=True)
+class ArtistRecord:
+    uri: str
+    name: str
+    verified: bool | None = None
+    image_url: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ArtistRecord":
+        """Builds a record from a raw pathfinder artist entity."""
+        profile = data.get("profile") or {}
+        visuals = data.get("visuals") or {}
+
+        return cls(
+            uri=data.get("uri", ""),
+            name=profile.get("name", ""),
+            verified=profile.get("verified"),
+            image_url=_cover(visuals.get("avatarImage")),
+        )
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> "ArtistRecord":
+        """Builds a record from a searchDesktop/searchArtists artist item."""
+        data, _, _ = _unwrap(item)
+        return cls.from_dict(data)
+
+    def __str__(self) -> str:
+        return "ArtistRecord()"
+
+
+@dataclass(slots=True)
+class EpisodeRecord:
+    uri: str
+    name: str
+    duration_ms: int | None = None
+    show_uri: str | None = None
+    show_name: str | None = None
+    release_date: str | None = None
+    explicit: bool = False
+    uid: str | None = None
+    added_at: str | None = None
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Mapping[str, Any],
+        *,
+        uid: str | None = None,
+        added_at: str | None = None,
+    ) -> "EpisodeRecord":
+        """Builds a record from a raw pathfinder episode entity."""
+        duration = data.get("duration") or data.get("episodeDuration") or {}
+        show = (data.get("podcastV2") or {}).get("data") or {}
+
+        return cls(
+            uri=data.get("uri", ""),
+            name=data.get("name", ""),
+            duration_ms=_to_int(duration.get("totalMilliseconds")),
+            show_uri=_intern(show.get("uri")),
+            show_name=_intern(show.get("name")),
+            release_date=(data.get("releaseDate") or {}).get("isoString"),
+            explicit=(data.get("contentRating") or {}).get("label") == "EXPLICIT",
+            uid=uid,
+            added_at=added_at,
+        )
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> "EpisodeRecord":
+        """
+        Builds a record from an item of a paginated response.
+
+        Accepts fetchPlaylist, searchDesktop and queryPodcastEpisodes item shapes.
+        """
+        data, uid, added_at = _unwrap(item)
+        return cls.from_dict(data, uid=uid, added_at=added_at)
+
+    def __str__(self) -> str:
+        return "EpisodeRecord()"
+
+
+# Playlist sync
+
+
+@dataclass
+class PlaylistSnapshot:
+    playlist_id: str
+    revision: str
+    # (uid, uri) of every entry, in playlist order
+    items: List[Tuple[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PlaylistSnapshot":
+        return cls(
+            playlist_id=data["playlist_id"],
+            revision=data["revision"],
+            items=[(uid, uri) for uid, uri in data.get("items", [])],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "playlist_id": self.playlist_id,
+            "revision": self.revision,
+            "items": [list(item) for item in self.items],
+        }
+
+    def __str__(self) -> str:
+        return "PlaylistSnapshot()"
+
+
+@dataclass
+class PlaylistChanges:
+    playlist_id: str
+    from_revision: str | None
+    to_revision: str
+    # True when the diff was not available and the playlist was fetched in full
+    full_resync: bool = False
+    # (index, uid, uri), index is the position in the new revision
+    added: List[Tuple[int, str, str]] = field(default_factory=list)
+    # (uid, uri)
+    removed: List[Tuple[str, str]] = field(default_factory=list)
+    # (from_index, to_index, uid, uri)
+    moved: List[Tuple[int, int, str, str]] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.moved)
+
+    def __str__(self) -> str:
+        return "PlaylistChanges()"
+
+
+@dataclass
+class ChunkResult:
+    index: int
+    items: List[str]
+    success: bool = False
+    attempts: int = 0
+    error: str | None = None
+
+    def __str__(self) -> str:
+        return "ChunkResult()"
+
+
+@dataclass
+class LatencyStats:
+    """Running latency statistics, in seconds."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    last: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def __str__(self) -> str:
+        return "LatencyStats()"
+
+
+@dataclass
+class DealerMetrics:
+    accounts: int
+    connected: int
+    reconnects: int
+    messages: int
+    messages_per_second: float
+    loop_lag: LatencyStats
+    dispatch_lag: LatencyStats
+    account_messages: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    # Exceptions raised by subscribers
+    callback_errors: int = 0
+
+    def __str__(self) -> str:
+        return "DealerMetrics()"
+
+
+@dataclass
+class DispatchStats:
+    event: str
+    subscriber: str
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    queued: int = 0
+    last_error: str | None = None
+    # Time events wait in the mailbox before the subscriber runs
+    latency: LatencyStats = field(default_factory=LatencyStats)
+
+    def __str__(self) -> str:
+        return "DispatchStats()"
@@ -0,0 +1,326 @@
+"""
+Typed player events, computed by diffing successive PlayerState / Devices snapshots.
+
+Subscribers get the one field that changed (the new track, the seek target, the queue
+additions, ...) instead of the whole cluster on every update.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+from spotapi.types.data import (
+    Devices,
+    LazyDevices,
+    LazyPlayerState,
+    LazyTracks,
+    PlayerState,
+    Track,
+)
+
+__all__ = [
+    "StateEvent",
+    "TrackChanged",
+    "PlaybackPaused",
+    "PlaybackResumed",
+    "PlaybackStarted",
+    "PlaybackStopped",
+    "Seeked",
+    "ContextChanged",
+    "QueueChanged",
+    "OptionsChanged",
+    "DeviceSwitched",
+    "DevicesChanged",
+    "VolumeChanged",
+    "STATE_EVENTS",
+    "StateDiffer",
+    "diff_player_state",
+    "diff_devices",
+]
+
+# A position this far from where playback should be is a seek and not drift, in ms
+SEEK_TOLERANCE_MS = 2000
+
+
+@dataclass
+class StateEvent:
+    timestamp: str | None
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+@dataclass
+class TrackChanged(StateEvent):
+    previous: Track | None
+    current: Track | None
+
+
+@dataclass
+class PlaybackPaused(StateEvent):
+    position_ms: int
+
+
+@dataclass
+class PlaybackResumed(StateEvent):
+    position_ms: int
+
+
+@dataclass
+class PlaybackStarted(StateEvent):
+    track: Track | None
+
+
+@dataclass
+class PlaybackStopped(StateEvent):
+    pass
+
+
+@dataclass
+class Seeked(StateEvent):
+    from_ms: int
+    to_ms: int
+
+
+@dataclass
+class ContextChanged(StateEvent):
+    previous_uri: str | None
+    current_uri: str | None
+
+
+@dataclass
+class QueueChanged(StateEvent):
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    # Same tracks, different order
+    reordered: bool = False
+
+
+@dataclass
+class OptionsChanged(StateEvent):
+    # Only the options that changed, name -> (previous, current)
+    changes: Dict[str, Tuple[bool | None, bool | None]] = field(default_factory=dict)
+
+
+@dataclass
+class DeviceSwitched(StateEvent):
+    previous_device_id: str | None
+    current_device_id: str | None
+
+
+@dataclass
+class DevicesChanged(StateEvent):
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+
+@dataclass
+class VolumeChanged(StateEvent):
+    device_id: str
+    previous: int
+    current: int
+
+
+STATE_EVENTS: Dict[str, Type[StateEvent]] = {
+    cls.__name__: cls
+    for cls in (
+        TrackChanged,
+        PlaybackPaused,
+        PlaybackResumed,
+        PlaybackStarted,
+        PlaybackStopped,
+        Seeked,
+        ContextChanged,
+        QueueChanged,
+        OptionsChanged,
+        DeviceSwitched,
+        DevicesChanged,
+        VolumeChanged,
+    )
+}
+
+
+def _int(value: str | int | None) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _uri(track: Track | None) -> str | None:
+    return track.uri if track is not None else None
+
+
+def _uris(tracks: Sequence[Track]) -> List[str | None]:
+    if isinstance(tracks, LazyTracks):
+        return tracks.uris()
+    return [track.uri for track in tracks]
+
+
+def _volume(devices: Devices | LazyDevices, device_id: str) -> Any:
+    if isinstance(devices, LazyDevices):
+        return devices.volume(device_id)
+    return devices.devices[device_id].volume
+
+
+def _expected_position(state: PlayerState | LazyPlayerState, at_ms: int) -> int:
+    position = _int(state.position_as_of_timestamp)
+    if state.is_playing and not state.is_paused:
+        elapsed = at_ms - _int(state.timestamp)
+        position += int(elapsed * (state.playback_speed or 1))
+    return position
+
+
+def diff_player_state(
+    previous: PlayerState | LazyPlayerState,
+    current: PlayerState | LazyPlayerState,
+    *,
+    seek_tolerance_ms: int = SEEK_TOLERANCE_MS,
+) -> List[StateEvent]:
+    """
+    The changes between two player states, in the order they should be handled.
+    With LazyPlayerStates, the queues are compared without parsing their tracks.
+    """
+    events: List[StateEvent] = []
+    timestamp = current.timestamp
+    position = _int(current.position_as_of_timestamp)
+
+    if previous.context_uri != current.context_uri:
+        events.append(
+            ContextChanged(timestamp, previous.context_uri, current.context_uri)
+        )
+
+    track_changed = _uri(previous.track) != _uri(current.track)
+    if track_changed:
+        events.append(TrackChanged(timestamp, previous.track, current.track))
+
+    if previous.is_playing != current.is_playing:
+        if current.is_playing:
+            events.append(PlaybackStarted(timestamp, current.track))
+        else:
+            events.append(PlaybackStopped(timestamp))
+    elif current.is_playing and previous.is_paused != current.is_paused:
+        if current.is_paused:
+            events.append(PlaybackPaused(timestamp, position))
+        else:
+            events.append(PlaybackResumed(timestamp, position))
+
+    if not track_changed and current.is_playing:
+        expected = _expected_position(previous, _int(current.timestamp))
+        if abs(position - expected) > seek_tolerance_ms:
+            events.append(Seeked(timestamp, expected, position))
+
+    # The queue revision changes whenever the queue does, skip comparing the lists otherwise
+    if previous.queue_revision != current.queue_revision or (
+        current.queue_revision is None
+        and len(previous.next_tracks) != len(current.next_tracks)
+    ):
+        before = _uris(previous.next_tracks)
+        after = _uris(current.next_tracks)
+        if track_changed and before[:1] == [_uri(current.track)]:
+            # Playing the next track is not a queue edit
+            before = before[1:]
+
+        if before != after:
+            before_set, after_set = set(before), set(after)
+            added = [uri for uri in after if uri not in before_set]
+            removed = [uri for uri in before if uri not in after_set]
+            events.append(
+                QueueChanged(
+                    timestamp, added, removed, reordered=not added and not removed
+                )
+            )
+
+    if previous.options != current.options:
+        before_options, after_options = previous.options, current.options
+        changes = {}
+        for name in ("shuffling_context", "repeating_context", "repeating_track"):
+            old = getattr(before_options, name, None)
+            new = getattr(after_options, name, None)
+            if old != new:
+                changes[name] = (old, new)
+
+        if changes:
+            events.append(OptionsChanged(timestamp, changes))
+
+    return events
+
+
+def diff_devices(
+    previous: Devices | LazyDevices,
+    current: Devices | LazyDevices,
+    *,
+    timestamp: str | None = None,
+) -> List[StateEvent]:
+    """The device changes between two snapshots."""
+    events: List[StateEvent] = []
+
+    if previous.active_device_id != current.active_device_id:
+        events.append(
+            DeviceSwitched(
+                timestamp, previous.active_device_id, current.active_device_id
+            )
+        )
+
+    before, after = previous.devices, current.devices
+    if before.keys() != after.keys():
+        events.append(
+            DevicesChanged(
+                timestamp,
+                [key for key in after if key not in before],
+                [key for key in before if key not in after],
+            )
+        )
+
+    for key in after:
+        if key not in before:
+            continue
+
+        old, new = _volume(previous, key), _volume(current, key)
+        if old != new:
+            events.append(VolumeChanged(timestamp, key, old, new))
+
+    return events
+
+
+class StateDiffer:
+    """
+    Remembers the last snapshot and turns every new one into StateEvents.
+    The first snapshot is the baseline and produces no events.
+    """
+
+    __slots__ = ("state", "devices", "seek_tolerance_ms")
+
+    def __init__(self, *, seek_tolerance_ms: int = SEEK_TOLERANCE_MS) -> None:
+        self.state: PlayerState | LazyPlayerState | None = None
+        self.devices: Devices | LazyDevices | None = None
+        self.seek_tolerance_ms = seek_tolerance_ms
+
+    def __str__(self) -> str:
+        return "StateDiffer()"
+
+    def update(
+        self,
+        state: PlayerState | LazyPlayerState | None = None,
+        devices: Devices | LazyDevices | None = None,
+    ) -> List[StateEvent]:
+        events: List[StateEvent] = []
+
+        if state is not None:
+            if self.state is not None:
+                events += diff_player_state(
+                    self.state, state, seek_tolerance_ms=self.seek_tolerance_ms
+                )
+            self.state = state
+
+        if devices is not None:
+            if self.devices is not None:
+                events += diff_devices(
+                    self.devices,
+                    devices,
+                    timestamp=state.timestamp if state is not None else None,
+                )
+            self.devices = devices
+
+        return events
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, List, Literal, Mapping, Protocol
+from typing import Any, AsyncIterator, Iterator, List, Literal, Mapping, Protocol
 from typing_extensions import runtime_checkable
+from spotapi.exceptions import SaverError
 from spotapi.http.request import StdClient
 
-__all__ = ["CaptchaProtocol", "LoggerProtocol", "SaverProtocol"]
+__all__ = [
+    "CaptchaProtocol",
+    "LoggerProtocol",
+    "SaverProtocol",
+    "AsyncSaverProtocol",
+    "SerializerProtocol",
+]
 
 
 @runtime_checkable
@@ -66,5 +73,54 @@ class SaverProtocol(Protocol):
     ) -> Mapping[str, Any]:
         ...
 
+    def load_many(
+        self: "SaverProtocol", identifiers: List[str], **kwargs: Any
+    ) -> List[Mapping[str, Any]]:
+        # One load per identifier, savers that can batch the lookups override this
+        items = []
+        for identifier in identifiers:
+            try:
+                items.append(self.load({"identifier": identifier}, **kwargs))
+            except SaverError:
+                continue
+        return items
+
+    def iter_all(self: "SaverProtocol", **kwargs: Any) -> Iterator[Mapping[str, Any]]:
+        raise SaverError(f"{type(self).__name__} does not implement iter_all")
+
     def delete(self: "SaverProtocol", query: Mapping[str, Any], **kwargs: Any) -> None:
         ...
+
+
+@runtime_checkable
+class AsyncSaverProtocol(Protocol):
+    def __init__(self: "AsyncSaverProtocol", *args: Any, **kwargs: Any) -> None: ...
+
+    async def save(
+        self: "AsyncSaverProtocol", data: List[Mapping[str, Any]], **kwargs: Any
+    ) -> None: ...
+
+    async def load(
+        self: "AsyncSaverProtocol", query: Mapping[str, Any], **kwargs: Any
+    ) -> Mapping[str, Any]: ...
+
+    async def load_many(
+        self: "AsyncSaverProtocol", identifiers: List[str], **kwargs: Any
+    ) -> List[Mapping[str, Any]]: ...
+
+    def iter_all(
+        self: "AsyncSaverProtocol", **kwargs: Any
+    ) -> AsyncIterator[Mapping[str, Any]]: ...
+
+    async def delete(
+        self: "AsyncSaverProtocol", query: Mapping[str, Any], **kwargs: Any
+    ) -> None: ...
+
+    async def close(self: "AsyncSaverProtocol") -> None: ...
+
+
+@runtime_checkable
+class SerializerProtocol(Protocol):
+    def dumps(self: "SerializerProtocol", item: Mapping[str, Any]) -> bytes: ...
+
+    def loads(self: "SerializerProtocol", data: Any) -> Mapping[str, Any]: ...
@@ -1,3 +1,7 @@
 from spotapi.utils.logger import *
+from spotapi.utils.serializer import *
 from spotapi.utils.saver import *
+from spotapi.utils.async_saver import *
 from spotapi.utils.strings import *
+from spotapi.utils.export import *
+from spotapi.utils.dispatch import *
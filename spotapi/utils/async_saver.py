@@ -0,0 +1,384 @@
+"""
+Async_saver.py contains asyncio counterparts of the savers, using the AsyncSaverProtocol
+interface, so loading and saving sessions never blocks the event loop.
+
+Redis and MongoDB are used through their asyncio drivers and pooled connections. Files
+have no asyncio API, the JSON and SQLite savers run the sync savers on a pool of threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping
+
+import redis.asyncio as aioredis
+from pymongo import ReplaceOne
+
+from spotapi.exceptions import SaverError
+from spotapi.types.interfaces import AsyncSaverProtocol, SerializerProtocol
+from spotapi.utils.saver import JSONSaver, SqliteSaver, _redis_pattern
+from spotapi.utils.serializer import JSONSerializer
+
+__all__ = [
+    "AsyncJSONSaver",
+    "AsyncSqliteSaver",
+    "AsyncRedisSaver",
+    "AsyncMongoSaver",
+    "AsyncSaverProtocol",
+]
+
+
+class _ThreadedSaver(AsyncSaverProtocol):
+    """Runs a sync saver on its own thread pool."""
+
+    __slots__ = ("saver", "_executor")
+
+    def __init__(self, saver: Any, workers: int) -> None:
+        self.saver = saver
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=type(self).__name__
+        )
+
+    async def __aenter__(self) -> Any:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+
+    async def save(self, data: List[Mapping[str, Any]], **kwargs) -> None:
+        await self._run(self.saver.save, data, **kwargs)
+
+    async def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
+        return await self._run(self.saver.load, query, **kwargs)
+
+    async def load_many(
+        self, identifiers: List[str], **kwargs
+    ) -> List[Mapping[str, Any]]:
+        return await self._run(self.saver.load_many, identifiers, **kwargs)
+
+    async def iter_all(self, **kwargs) -> AsyncIterator[Mapping[str, Any]]:
+        # Read in one hop, the sync iterators are tied to the thread they started on
+        items = await self._run(lambda: list(self.saver.iter_all(**kwargs)))
+        for item in items:
+            yield item
+
+    async def delete(self, query: Mapping[str, Any], **kwargs) -> None:
+        await self._run(self.saver.delete, query, **kwargs)
+
+    async def close(self) -> None:
+        close = getattr(self.saver, "close", None)
+        if close is not None:
+            await self._run(close)
+
+        self._executor.shutdown(wait=False)
+
+
+class AsyncJSONSaver(_ThreadedSaver):
+    """
+    Async CRUD methods for JSON files, backed by JSONSaver
+    """
+
+    __slots__ = ()
+
+    def __init__(self, path: str = "sessions.json") -> None:
+        # JSONSaver rereads the whole file per call, more threads only queue on its lock
+        super().__init__(JSONSaver(path), workers=1)
+
+    def __str__(self) -> str:
+        return "AsyncJSONSaver()"
+
+
+class AsyncSqliteSaver(_ThreadedSaver):
+    """
+    Async CRUD methods for SQLite3 files, backed by SqliteSaver
+
+    Every pool thread keeps its own connection, so up to `pool_size` loads run at once.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, path: str = "sessions.db", *, pool_size: int = 4, wal: bool = True
+    ) -> None:
+        super().__init__(SqliteSaver(path, wal=wal), workers=pool_size)
+
+    def __str__(self) -> str:
+        return "AsyncSqliteSaver()"
+
+
+class AsyncRedisSaver(AsyncSaverProtocol):
+    """
+    Async CRUD methods for Redis, with a pool of at most `max_connections` connections
+
+    As with RedisSaver, sessions are stored under `prefix` followed by their identifier.
+    """
+
+    __slots__ = ("pool", "client", "prefix", "serializer")
+
+    _BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        *,
+        max_connections: int = 16,
+        prefix: str = "",
+        serializer: SerializerProtocol | None = None,
+    ) -> None:
+        # Waits for a free connection instead of failing when all are in use
+        self.pool = aioredis.BlockingConnectionPool(
+            host=host, port=port, db=db, max_connections=max_connections
+        )
+        self.client = aioredis.Redis(connection_pool=self.pool)
+        self.prefix = prefix
+        self.serializer = serializer or JSONSerializer()
+
+    async def __aenter__(self) -> AsyncRedisSaver:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    def __str__(self) -> str:
+        return "AsyncRedisSaver()"
+
+    def _key(self, identifier: str) -> str:
+        return self.prefix + identifier
+
+    async def save(self, data: List[Mapping[str, Any]], **kwargs) -> None:
+        """
+        Saves the data with one MSET per batch
+        """
+        if len(data) == 0:
+            raise ValueError("No data to save")
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for i in range(0, len(data), self._BATCH_SIZE):
+                pipe.mset(
+                    {
+                        self._key(item["identifier"]): self.serializer.dumps(item)
+                        for item in data[i : i + self._BATCH_SIZE]
+                    }
+                )
+            await pipe.execute()
+
+    async def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
+        """
+        Loads data from a Redis database given a query.
+
+        Due to the nature of Redis, the query must be a singular identifier.
+        """
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        identifier = query.get("identifier")
+        if not identifier:
+            raise ValueError("Identifier is required for Redis lookup")
+
+        result = await self.client.get(self._key(identifier))
+        if not result:
+            raise SaverError("Item not found")
+
+        return self.serializer.loads(result)
+
+    async def load_many(
+        self, identifiers: List[str], **kwargs
+    ) -> List[Mapping[str, Any]]:
+        """
+        Loads the sessions of many identifiers, one MGET per batch in a single pipeline.
+        Identifiers without a session are skipped, the others keep their order.
+        """
+        if not identifiers:
+            return []
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for i in range(0, len(identifiers), self._BATCH_SIZE):
+                pipe.mget(
+                    [
+                        self._key(identifier)
+                        for identifier in identifiers[i : i + self._BATCH_SIZE]
+                    ]
+                )
+            batches = await pipe.execute()
+
+        return [
+            self.serializer.loads(result)
+            for batch in batches
+            for result in batch
+            if result
+        ]
+
+    async def iter_all(self, **kwargs) -> AsyncIterator[Mapping[str, Any]]:
+        """
+        Iterates over every session, scanning the keys under the prefix and fetching them
+        with one MGET per batch.
+        """
+        batch: List[bytes] = []
+
+        async for key in self.client.scan_iter(
+            match=_redis_pattern(self.prefix), count=self._BATCH_SIZE
+        ):
+            batch.append(key)
+            if len(batch) == self._BATCH_SIZE:
+                for item in await self._fetch(batch):
+                    yield item
+                batch = []
+
+        if batch:
+            for item in await self._fetch(batch):
+                yield item
+
+    async def _fetch(self, keys: List[bytes]) -> List[Mapping[str, Any]]:
+        # Keys deleted since the scan come back as None
+        return [
+            self.serializer.loads(result)
+            for result in await self.client.mget(keys)
+            if result
+        ]
+
+    async def delete(self, query: Mapping[str, Any], **kwargs) -> None:
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        identifier = query.get("identifier")
+        if not identifier:
+            raise ValueError("Identifier is required for Redis lookup")
+
+        await self.client.delete(self._key(identifier))
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        await self.pool.disconnect()
+
+
+def _async_mongo_client() -> Callable[..., Any]:
+    # pymongo ships an asyncio client since 4.9, older versions need motor
+    try:
+        return importlib.import_module("pymongo").AsyncMongoClient
+    except AttributeError:
+        pass
+
+    try:
+        return importlib.import_module("motor.motor_asyncio").AsyncIOMotorClient
+    except ImportError:
+        raise ImportError(
+            "AsyncMongoSaver requires pymongo>=4.9 or motor, install spotapi[pymongo]"
+        ) from None
+
+
+class AsyncMongoSaver(AsyncSaverProtocol):
+    """
+    Async CRUD methods for MongoDB, with a pool of at most `max_pool_size` connections
+
+    Unlike MongoSaver, a save replaces the sessions with the same identifier.
+    """
+
+    __slots__ = ("conn", "database", "collection")
+
+    _BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        host: str = "mongodb://localhost:27017/",
+        database_name: str = "spotify",
+        collection: str = "sessions",
+        *,
+        max_pool_size: int = 100,
+    ) -> None:
+        self.conn = _async_mongo_client()(host, maxPoolSize=max_pool_size)
+        self.database = self.conn[database_name]
+        self.collection = self.database[collection]
+
+    async def __aenter__(self) -> AsyncMongoSaver:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    def __str__(self) -> str:
+        return "AsyncMongoSaver()"
+
+    async def save(self, data: List[Mapping[str, Any]], **kwargs) -> None:
+        """
+        Upserts the data by identifier with one unordered bulk write
+        """
+        if len(data) == 0:
+            raise ValueError("No data to save")
+
+        await self.collection.bulk_write(
+            [
+                ReplaceOne({"identifier": item["identifier"]}, item, upsert=True)
+                for item in data
+            ],
+            ordered=False,
+        )
+
+    async def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        result = await self.collection.find_one(query, {"_id": False})
+
+        if result is None:
+            raise SaverError("Item not found")
+
+        return result
+
+    async def load_many(
+        self, identifiers: List[str], **kwargs
+    ) -> List[Mapping[str, Any]]:
+        """
+        Loads the sessions of many identifiers, in batched $in queries run concurrently.
+        Identifiers without a session are skipped, the others keep their order.
+        """
+
+        async def fetch(batch: List[str]) -> List[Mapping[str, Any]]:
+            cursor = self.collection.find(
+                {"identifier": {"$in": batch}}, {"_id": False}
+            )
+            return [item async for item in cursor]
+
+        batches = await asyncio.gather(
+            *(
+                fetch(identifiers[i : i + self._BATCH_SIZE])
+                for i in range(0, len(identifiers), self._BATCH_SIZE)
+            )
+        )
+
+        found: Dict[str, Mapping[str, Any]] = {
+            item["identifier"]: item for batch in batches for item in batch
+        }
+        return [found[key] for key in identifiers if key in found]
+
+    async def iter_all(self, **kwargs) -> AsyncIterator[Mapping[str, Any]]:
+        """
+        Iterates over every session, fetched by the cursor in batches
+        """
+        async for item in self.collection.find(
+            {}, {"_id": False}, batch_size=self._BATCH_SIZE
+        ):
+            yield item
+
+    async def delete(self, query: Mapping[str, Any], **kwargs) -> None:
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        await self.collection.delete_one(query)
+
+    async def close(self) -> None:
+        # Awaitable with pymongo, plain with motor
+        result = self.conn.close()
+        if inspect.isawaitable(result):
+            await result
@@ -0,0 +1,294 @@
+"""
+Dispatch.py delivers events to subscribers without blocking the thread that emits them.
+
+Every subscriber gets its own bounded mailbox, drained in order by a shared worker pool,
+so a slow subscriber only delays itself. What happens when a mailbox is full depends on
+its overflow policy:
+
+- "drop_oldest": the oldest pending event is discarded.
+- "block": the emitting thread waits for room (backpressure).
+- "coalesce": a pending event with the same key is replaced by the new one, by default
+  only the latest event is kept. Suited to state updates where only the newest matters.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, List, Literal, Tuple
+
+from spotapi.types.data import DispatchStats
+
+__all__ = ["OverflowPolicy", "CoalesceKey", "EventDispatcher", "DispatchStats"]
+
+OverflowPolicy = Literal["drop_oldest", "block", "coalesce"]
+CoalesceKey = Callable[..., Hashable]
+
+# (args, kwargs, enqueued at)
+_Item = Tuple[Tuple[Any, ...], Dict[str, Any], float]
+
+# The dispatcher whose subscriber the current thread is running, if any
+_running = threading.local()
+
+
+class _Mailbox:
+    __slots__ = (
+        "func",
+        "maxsize",
+        "policy",
+        "key",
+        "stats",
+        "items",
+        "cond",
+        "scheduled",
+        "is_async",
+    )
+
+    def __init__(
+        self,
+        event: str,
+        func: Callable[..., Any],
+        maxsize: int,
+        policy: OverflowPolicy,
+        key: CoalesceKey | None,
+    ) -> None:
+        self.func = func
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+        self.stats = DispatchStats(event, getattr(func, "__qualname__", repr(func)))
+        self.items: Deque[_Item] = deque()
+        self.cond = threading.Condition()
+        self.scheduled = False
+        self.is_async = asyncio.iscoroutinefunction(func)
+
+    def __str__(self) -> str:
+        return "_Mailbox()"
+
+    def _coalesce_key(self, item: _Item) -> Hashable:
+        return None if self.key is None else self.key(*item[0], **item[1])
+
+    def put(self, item: _Item) -> bool:
+        """Queues an item, returns whether the mailbox must be scheduled."""
+        with self.cond:
+            if self.policy == "coalesce":
+                key = self._coalesce_key(item)
+                for i, pending in enumerate(self.items):
+                    if self._coalesce_key(pending) == key:
+                        self.items[i] = item
+                        self.stats.coalesced += 1
+                        return False
+
+            if len(self.items) >= self.maxsize:
+                if self.policy == "block":
+                    while len(self.items) >= self.maxsize:
+                        self.cond.wait()
+                else:
+                    self.items.popleft()
+                    self.stats.dropped += 1
+
+            self.items.append(item)
+            if self.scheduled:
+                return False
+
+            self.scheduled = True
+            return True
+
+    def take(self) -> _Item | None:
+        with self.cond:
+            if not self.items:
+                self.scheduled = False
+                self.cond.notify_all()
+                return None
+
+            item = self.items.popleft()
+            self.cond.notify_all()
+            return item
+
+
+class EventDispatcher:
+    """
+    Runs subscribers on a worker pool, each from its own bounded mailbox.
+
+    Events reach a subscriber in the order they were dispatched. Coroutine functions
+    are run on an event loop thread started on first use.
+
+    Parameters
+    ----------
+    workers : int
+        Size of the worker pool shared by all subscribers.
+    maxsize : int
+        Default mailbox size.
+    policy : OverflowPolicy
+        Default overflow policy.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "policy",
+        "_mailboxes",
+        "_lock",
+        "_executor",
+        "_loop",
+        "_loop_thread",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        *,
+        workers: int = 4,
+        maxsize: int = 256,
+        policy: OverflowPolicy = "drop_oldest",
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.policy = policy
+
+        self._mailboxes: Dict[str, List[_Mailbox]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="dispatch")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._closed = False
+
+    def __str__(self) -> str:
+        return "EventDispatcher()"
+
+    def add(
+        self,
+        event: str,
+        func: Callable[..., Any],
+        *,
+        maxsize: int | None = None,
+        policy: OverflowPolicy | None = None,
+        coalesce_key: CoalesceKey | None = None,
+    ) -> None:
+        """
+        Subscribes a function to an event.
+
+        `coalesce_key` maps the event arguments to the key used by the "coalesce" policy,
+        by default every pending event is replaced.
+        """
+        policy = policy or self.policy
+        if policy not in ("drop_oldest", "block", "coalesce"):
+            raise ValueError(f"Unknown overflow policy: {policy}")
+
+        mailbox = _Mailbox(event, func, maxsize or self.maxsize, policy, coalesce_key)
+        with self._lock:
+            mailboxes = self._mailboxes.setdefault(event, [])
+            # Copy on write, dispatch iterates without holding the lock
+            self._mailboxes[event] = mailboxes + [mailbox]
+
+        if mailbox.is_async:
+            self._ensure_loop()
+
+    def remove(self, event: str, func: Callable[..., Any]) -> None:
+        with self._lock:
+            mailboxes = self._mailboxes.get(event, [])
+            self._mailboxes[event] = [m for m in mailboxes if m.func != func]
+
+    def has_subscribers(self, event: str) -> bool:
+        return bool(self._mailboxes.get(event))
+
+    def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
+        """Queues an event for its subscribers. Only blocks for full "block" mailboxes."""
+        if self._closed:
+            return
+
+        item = (args, kwargs, time.monotonic())
+        for mailbox in self._mailboxes.get(event, ()):
+            if mailbox.put(item):
+                self._executor.submit(self._drain, mailbox)
+
+    def _drain(self, mailbox: _Mailbox) -> None:
+        _running.dispatcher = self
+        try:
+            self._drain_mailbox(mailbox)
+        finally:
+            _running.dispatcher = None
+
+    def _drain_mailbox(self, mailbox: _Mailbox) -> None:
+        while (item := mailbox.take()) is not None:
+            args, kwargs, enqueued_at = item
+            mailbox.stats.latency.record(time.monotonic() - enqueued_at)
+
+            try:
+                if mailbox.is_async:
+                    asyncio.run_coroutine_threadsafe(
+                        mailbox.func(*args, **kwargs), self._ensure_loop()
+                    ).result()
+                else:
+                    mailbox.func(*args, **kwargs)
+            except Exception as e:
+                mailbox.stats.errors += 1
+                mailbox.stats.last_error = repr(e)
+            else:
+                mailbox.stats.delivered += 1
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="dispatch-loop", daemon=True
+                )
+                self._loop_thread.start()
+
+            return self._loop
+
+    def stats(self) -> List[DispatchStats]:
+        """Delivery counters and dispatch latency of every subscriber."""
+        with self._lock:
+            mailboxes = [m for ms in self._mailboxes.values() for m in ms]
+
+        for mailbox in mailboxes:
+            mailbox.stats.queued = len(mailbox.items)
+
+        return [mailbox.stats for mailbox in mailboxes]
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Waits until every mailbox is drained, returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            mailboxes = [m for ms in self._mailboxes.values() for m in ms]
+
+        for mailbox in mailboxes:
+            with mailbox.cond:
+                while mailbox.items or mailbox.scheduled:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    mailbox.cond.wait(remaining)
+
+        return True
+
+    def close(self, *, wait: bool = True) -> None:
+        """
+        Stops accepting events, by default after the pending ones are delivered.
+        From a subscriber, it returns at once and the pending events are still delivered.
+        """
+        self._closed = True
+        if (
+            getattr(_running, "dispatcher", None) is self
+            or threading.current_thread() is self._loop_thread
+        ):
+            # A worker or the loop thread cannot wait for itself, another thread does
+            threading.Thread(
+                target=self._shutdown, args=(True,), name="dispatch-close", daemon=True
+            ).start()
+        else:
+            self._shutdown(wait)
+
+    def _shutdown(self, wait: bool) -> None:
+        self._executor.shutdown(wait=wait)
+
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
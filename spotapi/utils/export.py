@@ -0,0 +1,322 @@
+"""
+Export.py streams paginated results (paginate_playlist, paginate_album, paginate_songs, ...)
+to NDJSON, Arrow IPC or Parquet files.
+
+Pages are converted to the compact records from spotapi.types.data and written in batches,
+so memory use depends on the batch size and not on the number of exported rows.
+"""
+
+from __future__ import annotations
+
+import importlib
+from abc import ABC, abstractmethod
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Literal, Mapping, Tuple, Type
+
+from spotapi.types.data import AlbumRecord, ArtistRecord, EpisodeRecord, TrackRecord
+from spotapi.utils import fastjson
+
+__all__ = [
+    "ExportKind",
+    "SCHEMAS",
+    "NDJSONExporter",
+    "ArrowExporter",
+    "ParquetExporter",
+    "export_pages",
+]
+
+ExportKind = Literal["track", "album", "artist", "episode"]
+Record = TrackRecord | AlbumRecord | ArtistRecord | EpisodeRecord
+
+# Fixed column layout for every kind, in output order.
+# The types are Arrow type names, NDJSON just follows the same field order.
+SCHEMAS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "track": (
+        ("uri", "string"),
+        ("name", "string"),
+        ("duration_ms", "int64"),
+        ("artist_names", "list<string>"),
+        ("artist_uris", "list<string>"),
+        ("album_uri", "string"),
+        ("album_name", "string"),
+        ("explicit", "bool"),
+        ("playable", "bool"),
+        ("track_number", "int64"),
+        ("disc_number", "int64"),
+        ("playcount", "int64"),
+        ("uid", "string"),
+        ("added_at", "string"),
+    ),
+    "album": (
+        ("uri", "string"),
+        ("name", "string"),
+        ("album_type", "string"),
+        ("artist_names", "list<string>"),
+        ("artist_uris", "list<string>"),
+        ("release_date", "string"),
+        ("total_tracks", "int64"),
+        ("label", "string"),
+        ("cover_url", "string"),
+    ),
+    "artist": (
+        ("uri", "string"),
+        ("name", "string"),
+        ("verified", "bool"),
+        ("image_url", "string"),
+    ),
+    "episode": (
+        ("uri", "string"),
+        ("name", "string"),
+        ("duration_ms", "int64"),
+        ("show_uri", "string"),
+        ("show_name", "string"),
+        ("release_date", "string"),
+        ("explicit", "bool"),
+        ("uid", "string"),
+        ("added_at", "string"),
+    ),
+}
+
+_RECORDS: Dict[str, Type[Record]] = {
+    "track": TrackRecord,
+    "album": AlbumRecord,
+    "artist": ArtistRecord,
+    "episode": EpisodeRecord,
+}
+
+
+def _page_items(page: Iterable[Mapping[str, Any]] | Mapping[str, Any]) -> Iterable[Any]:
+    # paginate_playlist and paginate_saved_tracks yield the container, the rest yield the items
+    if isinstance(page, Mapping):
+        return page.get("items") or ()
+    return page
+
+
+class _Exporter(ABC):
+    """Shared batching logic, subclasses only implement _write_batch and _close."""
+
+    __slots__ = (
+        "path",
+        "kind",
+        "batch_size",
+        "rows",
+        "skipped",
+        "_names",
+        "_prefix",
+        "_from_item",
+        "_batch",
+        "_closed",
+    )
+
+    def __init__(self, path: str, kind: ExportKind, *, batch_size: int = 5000) -> None:
+        if kind not in SCHEMAS:
+            raise ValueError(f"Unknown export kind: {kind}")
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        self.path = path
+        self.kind = kind
+        self.batch_size = batch_size
+        self.rows = 0
+        self.skipped = 0
+
+        self._names = tuple(name for name, _ in SCHEMAS[kind])
+        self._prefix = f"spotify:{kind}:"
+        self._from_item: Callable[[Mapping[str, Any]], Record] = _RECORDS[
+            kind
+        ].from_item
+        self._batch: List[Record] = []
+        self._closed = False
+
+    def __enter__(self) -> "_Exporter":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def write_records(self, records: Iterable[Record]) -> None:
+        """Writes already extracted records."""
+        batch = self._batch
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                self.flush()
+
+    def write_items(self, items: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Extracts and writes raw items of a paginated response.
+
+        Items of another kind (e.g. episodes in a playlist when exporting tracks)
+        and unavailable items are skipped and counted in `skipped`.
+        """
+        prefix = self._prefix
+        from_item = self._from_item
+        batch = self._batch
+        for item in items:
+            record = from_item(item)
+            if not record.uri.startswith(prefix):
+                self.skipped += 1
+                continue
+
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                self.flush()
+
+    def write_pages(
+        self, pages: Iterable[Iterable[Mapping[str, Any]] | Mapping[str, Any]]
+    ) -> None:
+        """Consumes a paginate_* generator page by page."""
+        for page in pages:
+            self.write_items(_page_items(page))
+
+    def flush(self) -> None:
+        if not self._batch:
+            return
+
+        self._write_batch(self._batch)
+        self.rows += len(self._batch)
+        self._batch.clear()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self.flush()
+        self._close()
+        self._closed = True
+
+    @abstractmethod
+    def _write_batch(self, batch: List[Record]) -> None: ...
+
+    @abstractmethod
+    def _close(self) -> None: ...
+
+
+class NDJSONExporter(_Exporter):
+    """
+    Writes one JSON object per line.
+
+    Uses orjson when it is installed, which serializes the records natively.
+    """
+
+    __slots__ = ("_file", "_getter")
+
+    def __init__(self, path: str, kind: ExportKind, *, batch_size: int = 5000) -> None:
+        super().__init__(path, kind, batch_size=batch_size)
+        self._getter = attrgetter(*self._names)
+        self._file = open(path, "wb")
+
+    def _write_batch(self, batch: List[Record]) -> None:
+        if fastjson.HAS_ORJSON:
+            lines = [fastjson.dumps_bytes(record) for record in batch]
+        else:
+            names, getter = self._names, self._getter
+            lines = [
+                fastjson.dumps_bytes(dict(zip(names, getter(record))))
+                for record in batch
+            ]
+
+        lines.append(b"")
+        self._file.write(b"\n".join(lines))
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+def _pyarrow(submodule: str) -> Any:
+    # pyarrow is heavy to import, only load it when a columnar export is requested
+    try:
+        return importlib.import_module(f"pyarrow.{submodule}")
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Arrow/Parquet exports, install spotapi[arrow]"
+        ) from None
+
+
+def _arrow_schema(kind: str) -> Any:
+    pyarrow = _pyarrow("lib")
+    types = {
+        "string": pyarrow.string(),
+        "int64": pyarrow.int64(),
+        "bool": pyarrow.bool_(),
+        "list<string>": pyarrow.list_(pyarrow.string()),
+    }
+    return pyarrow.schema([(name, types[t]) for name, t in SCHEMAS[kind]])
+
+
+class _ColumnarExporter(_Exporter):
+    __slots__ = ("_pa", "_schema", "_writer")
+
+    def __init__(self, path: str, kind: ExportKind, *, batch_size: int = 5000) -> None:
+        self._pa = _pyarrow("lib")
+        super().__init__(path, kind, batch_size=batch_size)
+        self._schema = _arrow_schema(kind)
+        self._writer = self._open_writer()
+
+    @abstractmethod
+    def _open_writer(self) -> Any: ...
+
+    def _write_batch(self, batch: List[Record]) -> None:
+        pa = self._pa
+        columns = [
+            pa.array([getattr(record, field.name) for record in batch], field.type)
+            for field in self._schema
+        ]
+        self._writer.write_batch(
+            pa.RecordBatch.from_arrays(columns, schema=self._schema)
+        )
+
+    def _close(self) -> None:
+        self._writer.close()
+
+
+class ArrowExporter(_ColumnarExporter):
+    """Writes an Arrow IPC file, one record batch per flushed batch."""
+
+    __slots__ = ()
+
+    def _open_writer(self) -> Any:
+        return _pyarrow("ipc").new_file(self.path, self._schema)
+
+
+class ParquetExporter(_ColumnarExporter):
+    """Writes a Parquet file, one row group per flushed batch."""
+
+    __slots__ = ()
+
+    def _open_writer(self) -> Any:
+        return _pyarrow("parquet").ParquetWriter(self.path, self._schema)
+
+
+_EXPORTERS: Dict[str, Type[_Exporter]] = {
+    "ndjson": NDJSONExporter,
+    "arrow": ArrowExporter,
+    "parquet": ParquetExporter,
+}
+
+
+def export_pages(
+    pages: Iterable[Iterable[Mapping[str, Any]] | Mapping[str, Any]],
+    path: str,
+    kind: ExportKind,
+    *,
+    format: Literal["ndjson", "arrow", "parquet"] = "ndjson",
+    batch_size: int = 5000,
+) -> int:
+    """
+    Exports a paginate_* generator to a file and returns the number of rows written.
+
+    Example:
+        export_pages(PublicPlaylist(uri).paginate_playlist(), "tracks.ndjson", "track")
+    """
+    if format not in _EXPORTERS:
+        raise ValueError(f"Unknown export format: {format}")
+
+    with _EXPORTERS[format](path, kind, batch_size=batch_size) as exporter:
+        exporter.write_pages(pages)
+
+    return exporter.rows
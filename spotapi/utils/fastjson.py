@@ -0,0 +1,33 @@
+"""
+Uses orjson when it is installed and falls back to the standard json module otherwise.
+Output is always compact (no whitespace between separators).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+__all__ = ["loads", "dumps", "dumps_bytes", "HAS_ORJSON"]
+
+HAS_ORJSON: bool = orjson is not None
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serializes to UTF-8 encoded JSON. Dataclasses are supported with orjson only."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    return dumps_bytes(obj).decode("utf-8")
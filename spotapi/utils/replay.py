@@ -0,0 +1,244 @@
+"""
+Replay.py records dealer websocket sessions and serves them back from a local websocket
+server, so the consumers of the dealer (WebsocketStreamer, EventManager, DealerHub) can be
+measured offline.
+
+A recording is one JSON array per line, `[seconds since the first frame, frame]`,
+gzipped when the path ends in ".gz".
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import itertools
+import json
+import threading
+import time
+from typing import IO, Any, Iterable, List, Tuple
+
+from spotapi.websocket import WebsocketStreamer, _is_control_frame
+
+try:
+    from websockets.asyncio.server import serve
+except ImportError:
+    # websockets < 13
+    from websockets.server import serve  # type: ignore
+
+__all__ = ["DealerRecorder", "DealerReplayServer", "load_recording"]
+
+# (seconds since the first frame, frame text)
+Frame = Tuple[float, str]
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+
+    return open(path, mode, encoding="utf-8")
+
+
+def load_recording(path: str) -> List[Frame]:
+    """Reads the frames of a recording, in order."""
+    with _open(path, "r") as f:
+        return [(float(at), frame) for at, frame in map(json.loads, filter(None, f))]
+
+
+class DealerRecorder:
+    """
+    Writes the frames a WebsocketStreamer receives, with their arrival time.
+
+    Parameters
+    ----------
+    path : str
+        File to append the frames to, gzipped when it ends in ".gz".
+    control_frames : bool
+        Whether pongs and other control frames are recorded too.
+    """
+
+    __slots__ = (
+        "path",
+        "control_frames",
+        "frames",
+        "_file",
+        "_lock",
+        "_start",
+        "_streamers",
+    )
+
+    def __init__(self, path: str, *, control_frames: bool = False) -> None:
+        self.path = path
+        self.control_frames = control_frames
+        self.frames = 0
+        self._file = _open(path, "a")
+        self._lock = threading.Lock()
+        self._start: float | None = None
+        self._streamers: List[WebsocketStreamer] = []
+
+    def __enter__(self) -> DealerRecorder:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return "DealerRecorder()"
+
+    def attach(self, streamer: WebsocketStreamer) -> None:
+        """Records every frame the streamer receives from now on, until `close`."""
+        streamer.frame_hooks.append(self.record)
+        self._streamers.append(streamer)
+
+    def detach(self, streamer: WebsocketStreamer) -> None:
+        streamer.frame_hooks.remove(self.record)
+        self._streamers.remove(streamer)
+
+    def record(self, frame: str) -> None:
+        if not self.control_frames and _is_control_frame(frame):
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            # A frame read while close() detaches
+            if self._file.closed:
+                return
+
+            if self._start is None:
+                self._start = now
+
+            line = json.dumps([round(now - self._start, 6), frame])
+            self._file.write(line + "\n")
+            self.frames += 1
+
+    def close(self) -> None:
+        """Detaches from every streamer, then closes the file."""
+        for streamer in list(self._streamers):
+            self.detach(streamer)
+
+        with self._lock:
+            self._file.close()
+
+
+class DealerReplayServer:
+    """
+    A local stand-in for the dealer that plays a recording to every client.
+
+    Each connection gets its own init packet (and connection id), then the recorded frames
+    with their recorded spacing divided by `speed`. Pings are answered like the dealer does.
+
+    Parameters
+    ----------
+    frames : Iterable[Frame] | str
+        The frames, or the path of a recording.
+    speed : float
+        Playback speed, 1.0 is real time. 0 sends the frames as fast as possible.
+    repeat : bool
+        Starts the recording over when it ends, for sustained load.
+    host : str
+    port : int
+        0 picks a free port, see `url`.
+    """
+
+    __slots__ = (
+        "frames",
+        "speed",
+        "repeat",
+        "url",
+        "connections",
+        "frames_sent",
+        "_ids",
+        "_loop",
+        "_thread",
+        "_server",
+    )
+
+    def __init__(
+        self,
+        frames: Iterable[Frame] | str,
+        *,
+        speed: float = 1.0,
+        repeat: bool = False,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.frames = (
+            load_recording(frames) if isinstance(frames, str) else list(frames)
+        )
+        self.speed = speed
+        self.repeat = repeat
+        self.connections = 0
+        self.frames_sent = 0
+        self._ids = itertools.count()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="DealerReplayServer", daemon=True
+        )
+        self._thread.start()
+
+        self._server = asyncio.run_coroutine_threadsafe(
+            self._start(host, port), self._loop
+        ).result()
+        bound_port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://{host}:{bound_port}/"
+
+    def __enter__(self) -> DealerReplayServer:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return "DealerReplayServer()"
+
+    async def _start(self, host: str, port: int) -> Any:
+        return await serve(self._handle, host, port, max_size=None)
+
+    async def _handle(self, ws: Any, *_: Any) -> None:
+        self.connections += 1
+        connection_id = f"replay-{next(self._ids)}"
+        await ws.send(json.dumps({"headers": {"Spotify-Connection-Id": connection_id}}))
+
+        pings = asyncio.create_task(self._answer_pings(ws))
+        try:
+            await self._play(ws)
+            # Keep the connection open like the dealer would, until the client leaves
+            await pings
+        except Exception:
+            pass
+        finally:
+            pings.cancel()
+
+    async def _answer_pings(self, ws: Any) -> None:
+        async for message in ws:
+            if message == '{"type":"ping"}':
+                await ws.send('{"type":"pong"}')
+
+    async def _play(self, ws: Any) -> None:
+        while True:
+            started = time.monotonic()
+            for at, frame in self.frames:
+                if self.speed > 0:
+                    delay = started + at / self.speed - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                await ws.send(frame)
+                self.frames_sent += 1
+
+            if not self.repeat or not self.frames:
+                return
+
+            # Yield between repeats, an instant replay would otherwise starve the loop
+            await asyncio.sleep(0)
+
+    def close(self) -> None:
+        """Stops the server and drops every connection."""
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
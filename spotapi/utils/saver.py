@@ -4,33 +4,59 @@ These are popular savers that are used for session storing, but if you need a di
 """
 
 import atexit
+import bisect
+import hashlib
+import importlib
 import json
 import os
 import pymongo
+import re
 import redis
+import shutil
 import sqlite3
-from typing import Any, List, Mapping
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
 from readerwriterlock import rwlock
-from spotapi.types.interfaces import SaverProtocol
+from spotapi.types.interfaces import SaverProtocol, SerializerProtocol
 from spotapi.exceptions import SaverError
-
-__all__ = ["JSONSaver", "MongoSaver", "RedisSaver", "SqliteSaver", "SaverProtocol"]
+from spotapi.utils import fastjson
+from spotapi.utils.serializer import JSONSerializer
+
+__all__ = [
+    "CachedSaver",
+    "JSONSaver",
+    "JSONLogSaver",
+    "LMDBSaver",
+    "MongoSaver",
+    "RedisSaver",
+    "ShardedSaver",
+    "SqliteSaver",
+    "SaverProtocol",
+]
 
 
 class JSONSaver(SaverProtocol):
     """
     CRUD methods for JSON files
+
+    The file is indented with `indent` spaces, None writes it compact.
     """
 
     __slots__ = (
         "path",
+        "indent",
         "rwlock",
         "rlock",
         "wlock",
     )
 
-    def __init__(self, path: str = "sessions.json") -> None:
+    def __init__(self, path: str = "sessions.json", *, indent: int | None = 4) -> None:
         self.path = path
+        self.indent = indent
 
         self.rwlock = rwlock.RWLockFairD()
         self.rlock = self.rwlock.gen_rlock()
@@ -74,7 +100,7 @@ class JSONSaver(SaverProtocol):
             current.extend(data)
 
             with open(self.path, "w") as f:
-                json.dump(current, f, indent=4)
+                json.dump(current, f, indent=self.indent)
 
     def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
         """
@@ -107,6 +133,32 @@ class JSONSaver(SaverProtocol):
 
             raise SaverError("Item not found")
 
+    def _read_all(self) -> List[Mapping[str, Any]]:
+        with open(self.path, "rb") as f:
+            file_content = f.read()
+
+        return fastjson.loads(file_content) if file_content.strip() else []
+
+    def load_many(self, identifiers: List[str], **kwargs) -> List[Mapping[str, Any]]:
+        """
+        Loads the items of many identifiers with a single read of the file.
+        Identifiers without an item are skipped, the others keep their order.
+        """
+        with self.rlock:
+            data = self._read_all()
+
+        found = {item["identifier"]: item for item in data}
+        return [found[key] for key in identifiers if key in found]
+
+    def iter_all(self, **kwargs) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterates over every item, read from the file at once
+        """
+        with self.rlock:
+            data = self._read_all()
+
+        return iter(data)
+
     def delete(self, query: Mapping[str, Any], **kwargs) -> None:
         """
         Delete data from a JSON file given a query
@@ -143,31 +195,396 @@ class JSONSaver(SaverProtocol):
                         break
 
             with open(self.path, "w") as f:
-                json.dump(data, f, indent=4)
+                json.dump(data, f, indent=self.indent)
+
+
+class JSONLogSaver(SaverProtocol):
+    """
+    CRUD methods for an append-only JSON lines file
+
+    Saves append one line per item and deletes append a tombstone, so a write costs the
+    size of the batch and not of the file. An in-memory index maps every identifier to
+    its latest line, loading by identifier reads that line only.
+
+    Once stale lines (overwritten or deleted items) outnumber `compact_ratio` times the
+    live ones, the log is rewritten to a temporary file which atomically replaces it.
+
+    A file in the JSONSaver format is converted on open, the original is kept as `<path>.bak`
+    (`<path>.bak.1`, ... when earlier backups exist).
+    """
+
+    __slots__ = (
+        "path",
+        "compact_ratio",
+        "compact_min",
+        "fsync",
+        "rwlock",
+        "rlock",
+        "wlock",
+        "_index",
+        "_stale",
+        "_size",
+        "_file",
+    )
+
+    # Marks a deleted identifier in the log
+    _TOMBSTONE = "__deleted__"
+
+    def __init__(
+        self,
+        path: str = "sessions.jsonl",
+        *,
+        compact_ratio: float = 1.0,
+        compact_min: int = 1024,
+        fsync: bool = False,
+    ) -> None:
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self.compact_min = compact_min
+        self.fsync = fsync
+
+        self.rwlock = rwlock.RWLockFairD()
+        self.rlock = self.rwlock.gen_rlock()
+        self.wlock = self.rwlock.gen_wlock()
+
+        # identifier -> (offset, length) of its latest line
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._stale = 0
+        self._size = 0
+
+        self._open_log()
+        self._file = open(self.path, "ab")
+        atexit.register(self.close)
+
+    def __str__(self) -> str:
+        return f"JSONLogSaver()"
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _open_log(self) -> None:
+        if not os.path.exists(self.path):
+            open(self.path, "wb").close()
+
+        with open(self.path, "rb") as f:
+            head = f.read(64).lstrip()
+
+        if head.startswith(b"["):
+            self._migrate()
+
+        offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                length = len(line)
+                try:
+                    record = fastjson.loads(line)
+                except ValueError:
+                    if line.endswith(b"\n"):
+                        raise SaverError(
+                            f"Corrupt line at offset {offset} in {self.path}"
+                        )
+
+                    # A write interrupted halfway, truncated below
+                    break
+
+                self._apply(record, offset, length)
+                offset += length
+
+        if offset != os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+
+        self._size = offset
+
+    def _migrate(self) -> None:
+        with open(self.path, "r") as f:
+            items = json.load(f)
+
+        # Never overwrites an earlier backup
+        backup, n = self.path + ".bak", 1
+        while os.path.exists(backup):
+            backup, n = f"{self.path}.bak.{n}", n + 1
+
+        # The original stays at path until the converted log replaces it
+        shutil.copy2(self.path, backup)
+        self._write_atomic(fastjson.dumps_bytes(item) + b"\n" for item in items)
+
+    def _apply(self, record: Mapping[str, Any], offset: int, length: int) -> None:
+        identifier = record["identifier"]
+        if record.get(self._TOMBSTONE):
+            # The tombstone and the line it deletes are both stale
+            self._stale += 2 if self._index.pop(identifier, None) else 1
+        else:
+            if identifier in self._index:
+                self._stale += 1
+            self._index[identifier] = (offset, length)
+
+    def _write_atomic(self, lines: Any) -> None:
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                for line in lines:
+                    f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+        os.replace(tmp, self.path)
+
+    def _append(self, records: List[Mapping[str, Any]]) -> None:
+        lines = [fastjson.dumps_bytes(record) + b"\n" for record in records]
+
+        self._file.write(b"".join(lines))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+        for record, line in zip(records, lines):
+            self._apply(record, self._size, len(line))
+            self._size += len(line)
+
+        if self._stale >= self.compact_min and self._stale > self.compact_ratio * len(
+            self._index
+        ):
+            self._compact()
+
+    def _read(self, f: Any, location: Tuple[int, int]) -> Mapping[str, Any]:
+        offset, length = location
+        f.seek(offset)
+        return fastjson.loads(f.read(length))
+
+    def _scan(self) -> Iterator[Mapping[str, Any]]:
+        """The live items, in log order."""
+        live = set(offset for offset, _ in self._index.values())
+        offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if offset in live:
+                    yield fastjson.loads(line)
+                offset += len(line)
+
+    def _matches(self, query: Mapping[str, Any]) -> Iterator[Mapping[str, Any]]:
+        identifier = query.get("identifier")
+        if identifier is None:
+            for item in self._scan():
+                if all(item.get(key) == query[key] for key in query):
+                    yield item
+            return
+
+        location = self._index.get(identifier)
+        if location is not None:
+            with open(self.path, "rb") as f:
+                item = self._read(f, location)
+
+            if all(item.get(key) == query[key] for key in query):
+                yield item
+
+    def save(self, data: List[Mapping[str, Any]], **kwargs) -> None:
+        """
+        Appends data to the log, replacing items with the same identifier
+
+        Kwargs
+        -------
+        overwrite (bool, optional): Defaults to False.
+            Replaces the entire file with the data.
+        """
+        with self.wlock:
+            if len(data) == 0:
+                raise ValueError("No data to save")
+
+            if kwargs.get("overwrite", False):
+                self._reset()
+
+            self._append(data)
+
+    def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
+        """
+        Load data given a query, a query with an identifier reads a single line
+
+        Kwargs
+        -------
+        allow_collisions (bool, optional): Defaults to False.
+            Raises an error if the query returns more than one result.
+        """
+        with self.rlock:
+            if not query:
+                raise ValueError("Query dictionary cannot be empty")
+
+            allow_collisions = kwargs.get("allow_collisions", False)
+            matches: List[Mapping[str, Any]] = []
+
+            for item in self._matches(query):
+                matches.append(item)
+                if not allow_collisions or len(matches) > 1:
+                    break
+
+            if allow_collisions and len(matches) > 1:
+                raise SaverError("Collision found")
+
+            if matches:
+                return matches[0]
+
+            raise SaverError("Item not found")
+
+    def load_many(self, identifiers: List[str], **kwargs) -> List[Mapping[str, Any]]:
+        """
+        Loads the items of many identifiers, reading their lines in file order.
+        Identifiers without an item are skipped, the others keep their order.
+        """
+        with self.rlock:
+            locations = sorted(
+                (self._index[key], key)
+                for key in set(identifiers)
+                if key in self._index
+            )
+
+            found: Dict[str, Mapping[str, Any]] = {}
+            with open(self.path, "rb") as f:
+                if len(locations) * 8 < len(self._index):
+                    for location, key in locations:
+                        found[key] = self._read(f, location)
+                else:
+                    # Most of the log, one read beats a seek per line
+                    content = f.read()
+                    for (offset, length), key in locations:
+                        found[key] = fastjson.loads(content[offset : offset + length])
+
+        return [found[key] for key in identifiers if key in found]
+
+    def iter_all(self, **kwargs) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterates over every live item, read in one pass over the log
+        """
+        with self.rlock:
+            data = list(self._scan())
+
+        return iter(data)
+
+    def delete(self, query: Mapping[str, Any], **kwargs) -> None:
+        """
+        Delete data given a query, by appending tombstones
+
+        Kwargs
+        -------
+        all_instances (bool, optional): Defaults to True.
+            Deletes all instances of the query.
+
+        clear_all (bool, optional): Defaults to False.
+            Deletes all data in the file.
+        """
+        with self.wlock:
+            if not query:
+                raise ValueError("Query dictionary cannot be empty")
+
+            if kwargs.get("clear_all", False):
+                return self._reset()
+
+            identifiers = [item["identifier"] for item in self._matches(query)]
+            if not kwargs.get("all_instances", True):
+                identifiers = identifiers[:1]
+
+            if identifiers:
+                self._append(
+                    [
+                        {"identifier": identifier, self._TOMBSTONE: True}
+                        for identifier in identifiers
+                    ]
+                )
+
+    def compact(self) -> None:
+        """Rewrites the log with the live items only."""
+        with self.wlock:
+            self._compact()
+
+    def _compact(self) -> None:
+        locations = sorted(self._index.items(), key=lambda item: item[1][0])
+        index: Dict[str, Tuple[int, int]] = {}
+
+        def lines() -> Iterator[bytes]:
+            offset = 0
+            with open(self.path, "rb") as f:
+                for identifier, (old_offset, length) in locations:
+                    f.seek(old_offset)
+                    line = f.read(length)
+                    index[identifier] = (offset, length)
+                    offset += length
+                    yield line
+
+        self._file.close()
+        self._write_atomic(lines())
+        self._file = open(self.path, "ab")
+
+        self._index = index
+        self._size = sum(length for _, length in index.values())
+        self._stale = 0
+
+    def _reset(self) -> None:
+        self._file.close()
+        open(self.path, "wb").close()
+        self._file = open(self.path, "ab")
+        self._index.clear()
+        self._stale = 0
+        self._size = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ThreadConnection:
+    """Held by the thread-local of a single thread, freed when that thread ends."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+def _close_connection(connections: Dict[int, sqlite3.Connection], key: int) -> None:
+    conn = connections.pop(key, None)
+    if conn is not None:
+        conn.close()
 
 
 class SqliteSaver(SaverProtocol):
     """
     CRUD methods for SQLite3 files
+
+    The database runs in WAL mode and every thread gets its own connection, so reads
+    run concurrently with each other and with a write. Writes are serialized. A thread's
+    connection is closed when the thread ends.
     """
 
     __slots__ = (
         "path",
         "conn",
         "cursor",
-        "rwlock",
-        "rlock",
         "wlock",
+        "_local",
+        "_connections",
     )
 
-    def __init__(self, path: str = "sessions.db") -> None:
+    _COLUMNS = ("identifier", "password", "cookies")
+    # Stays under SQLITE_MAX_VARIABLE_NUMBER of older SQLite builds (999)
+    _BATCH_SIZE = 900
+
+    def __init__(self, path: str = "sessions.db", *, wal: bool = True) -> None:
         self.path = path
-        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.wlock = threading.Lock()
+        self._local = threading.local()
+        # Open connections of the live threads
+        self._connections: Dict[int, sqlite3.Connection] = {}
+
+        self.conn = self._connection()
         self.cursor = self.conn.cursor()
 
+        if wal:
+            # Persistent, readers no longer block on the writer
+            self.conn.execute("PRAGMA journal_mode=WAL")
+
         # Create table
-        self.cursor.execute(
-            """
+        self.conn.execute("""
             CREATE TABLE IF NOT EXISTS sessions (
                 identifier TEXT PRIMARY KEY NOT NULL,
                 password TEXT NOT NULL, 
@@ -175,95 +592,147 @@ class SqliteSaver(SaverProtocol):
             )
         """
         )
+        self.conn.commit()
 
         # Cleanup
-        atexit.register(self.cursor.close)
-        atexit.register(self.conn.close)
-
-        # Sqlite may not behave as intended under multi-threaded environments
-        self.rwlock = rwlock.RWLockFairD()
-        self.rlock = self.rwlock.gen_rlock()
-        self.wlock = self.rwlock.gen_wlock()
+        atexit.register(self.close)
 
     def __str__(self) -> str:
         return f"SqliteSaver()"
 
+    def _connection(self) -> sqlite3.Connection:
+        owner = getattr(self._local, "owner", None)
+        if owner is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            # Safe with WAL, a commit only waits for the log write
+            conn.execute("PRAGMA synchronous=NORMAL")
+            owner = self._local.owner = _ThreadConnection(conn)
+            self._connections[id(owner)] = conn
+            # The thread-local drops the owner when the thread ends
+            weakref.finalize(owner, _close_connection, self._connections, id(owner))
+
+        return owner.conn
+
+    def _where(self, query: Mapping[str, Any]) -> Tuple[str, Tuple[Any, ...]]:
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        unknown = set(query) - set(self._COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+
+        # Turn dictionary into sql query
+        sql = " AND ".join(f"{key} = ?" for key in query)
+        params = tuple(
+            json.dumps(value) if key == "cookies" else value
+            for key, value in query.items()
+        )
+        return sql, params
+
+    @staticmethod
+    def _to_item(row: Tuple[Any, ...]) -> Mapping[str, Any]:
+        identifier, password, cookies = row
+        return {
+            "identifier": identifier,
+            "password": password,
+            "cookies": fastjson.loads(cookies) if cookies is not None else None,
+        }
+
     def save(self, data: List[Mapping[str, Any]], **kwargs) -> None:
         """
-        Saves data to a SQLite3 database
+        Saves data to a SQLite3 database, in one transaction.
+        Existing sessions with the same identifier are replaced.
 
         Kwargs
         -------
         overwrite (bool, optional): Defaults to False.
             Overwrites the entire database instead of appending.
         """
+        if len(data) == 0:
+            raise ValueError("No data to save")
+
+        conn = self._connection()
         with self.wlock:
             try:
-                if len(data) == 0:
-                    raise ValueError("No data to save")
-
-                if kwargs.get("overwrite", False):
-                    self.cursor.execute("DELETE FROM sessions")
-                    self.conn.commit()
-
-                for item in data:
-                    self.cursor.execute(
-                        "INSERT INTO sessions VALUES (?, ?, ?)",
+                with conn:
+                    if kwargs.get("overwrite", False):
+                        conn.execute("DELETE FROM sessions")
+
+                    conn.executemany(
+                        """
+                        INSERT INTO sessions VALUES (?, ?, ?)
+                        ON CONFLICT(identifier) DO UPDATE SET
+                            password = excluded.password,
+                            cookies = excluded.cookies
+                        """,
                         (
-                            item["identifier"],
-                            item["password"],
-                            json.dumps(item["cookies"]),
+                            (
+                                item["identifier"],
+                                item["password"],
+                                json.dumps(item["cookies"]),
+                            )
+                            for item in data
                         ),
                     )
-
-                self.conn.commit()
             except Exception as e:
-                self.conn.rollback()
                 raise SaverError(str(e))
 
     def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
         """
         Loads data from a SQLite3 database given a query
         """
+        sql, params = self._where(query)
+        row = (
+            self._connection()
+            .execute(f"SELECT * FROM sessions WHERE {sql} LIMIT 1", params)
+            .fetchone()
+        )
 
-        with self.rlock:
-            if not query:
-                raise ValueError("Query dictionary cannot be empty")
-
-            # Turn dictionary into sql query
-            sql = "SELECT * FROM sessions WHERE "
-            params = []
+        if row is None:
+            raise SaverError("Item not found")
 
-            for key, value in query.items():
-                sql += f"{key} = ? AND "
-                params.append(value)
+        return self._to_item(row)
 
-            self.cursor.execute(sql[:-5], tuple(params))
-            result = self.cursor.fetchall()
+    def load_many(self, identifiers: List[str], **kwargs) -> List[Mapping[str, Any]]:
+        """
+        Loads the sessions of many identifiers, in batched IN queries.
+        Identifiers without a session are skipped, the others keep their order.
+        """
+        conn = self._connection()
+        found: Dict[str, Mapping[str, Any]] = {}
+
+        for i in range(0, len(identifiers), self._BATCH_SIZE):
+            batch = identifiers[i : i + self._BATCH_SIZE]
+            rows = conn.execute(
+                "SELECT * FROM sessions WHERE identifier IN "
+                f"({', '.join('?' * len(batch))})",
+                batch,
+            )
+            for row in rows:
+                found[row[0]] = self._to_item(row)
 
-            if len(result) == 0:
-                raise SaverError("Item not found")
+        return [found[key] for key in identifiers if key in found]
 
-            return result[0]
+    def iter_all(self, **kwargs) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterates over every session, streamed from a single query
+        """
+        for row in self._connection().execute("SELECT * FROM sessions"):
+            yield self._to_item(row)
 
     def delete(self, query: Mapping[str, Any], **kwargs) -> None:
         """
         Deletes data from a SQLite3 database given a query
         """
-        with self.wlock:
-            if not query:
-                raise ValueError("Query dictionary cannot be empty")
+        sql, params = self._where(query)
 
-            # Turn dictionary into sql query
-            sql = "DELETE FROM sessions WHERE "
-            params = []
+        conn = self._connection()
+        with self.wlock, conn:
+            conn.execute(f"DELETE FROM sessions WHERE {sql}", params)
 
-            for key, value in query.items():
-                sql += f"{key} = ? AND "
-                params.append(value)
-
-            self.cursor.execute(sql[:-5], tuple(params))
-            self.conn.commit()
+    def close(self) -> None:
+        for conn in list(self._connections.values()):
+            conn.close()
 
 
 class MongoSaver(SaverProtocol):
@@ -277,6 +746,8 @@ class MongoSaver(SaverProtocol):
         "collection",
     )
 
+    _BATCH_SIZE = 1000
+
     def __init__(
         self,
         host: str = "mongodb://localhost:27017/",
@@ -309,6 +780,30 @@ class MongoSaver(SaverProtocol):
 
         return result
 
+    def load_many(self, identifiers: List[str], **kwargs) -> List[Mapping[str, Any]]:
+        """
+        Loads the sessions of many identifiers, in batched $in queries.
+        Identifiers without a session are skipped, the others keep their order.
+        """
+        found: Dict[str, Mapping[str, Any]] = {}
+
+        for i in range(0, len(identifiers), self._BATCH_SIZE):
+            batch = identifiers[i : i + self._BATCH_SIZE]
+            for item in self.collection.find(
+                {"identifier": {"$in": batch}}, {"_id": False}
+            ):
+                found[item["identifier"]] = item
+
+        return [found[key] for key in identifiers if key in found]
+
+    def iter_all(self, **kwargs) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterates over every session, fetched by the cursor in batches
+        """
+        return iter(
+            self.collection.find({}, {"_id": False}, batch_size=self._BATCH_SIZE)
+        )
+
     def delete(self, query: Mapping[str, Any], **kwargs) -> None:
         if not query:
             raise ValueError("Query dictionary cannot be empty")
@@ -316,20 +811,48 @@ class MongoSaver(SaverProtocol):
         self.collection.delete_one(query)
 
 
+def _redis_pattern(prefix: str) -> str:
+    # Glob characters in the prefix match themselves
+    return re.sub(r"([*?\[\]\\])", r"\\\1", prefix) + "*"
+
+
 class RedisSaver(SaverProtocol):
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0) -> None:
+    """
+    CRUD methods for Redis
+
+    Sessions are stored under `prefix` followed by their identifier. By default there is
+    no prefix, as in earlier versions, and iter_all scans every key of the database. Pass
+    one, e.g. "spotapi:session:", to share the database and only scan this saver's keys.
+    """
+
+    _BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        *,
+        prefix: str = "",
+        serializer: SerializerProtocol | None = None,
+    ) -> None:
         self.client = redis.StrictRedis(host=host, port=port, db=db)
+        self.prefix = prefix
+        self.serializer = serializer or JSONSerializer()
         atexit.register(self.client.close)
 
     def __str__(self) -> str:
         return f"RedisSaver()"
 
+    def _key(self, identifier: str) -> str:
+        return self.prefix + identifier
+
     def save(self, data: List[Mapping[str, Any]], **kwargs) -> None:
         if len(data) == 0:
             raise ValueError("No data to save")
 
         for item in data:
-            self.client.set(item["identifier"], json.dumps(item))
+            self.client.set(self._key(item["identifier"]), self.serializer.dumps(item))
 
     def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
         """
@@ -344,11 +867,55 @@ class RedisSaver(SaverProtocol):
         if not identifier:
             raise ValueError("Identifier is required for Redis lookup")
 
-        result = self.client.get(identifier)
+        result = self.client.get(self._key(identifier))
         if not result:
             raise SaverError("Item not found")
 
-        return json.loads(str(result))
+        return self.serializer.loads(result)
+
+    def load_many(self, identifiers: List[str], **kwargs) -> List[Mapping[str, Any]]:
+        """
+        Loads the sessions of many identifiers, one MGET per batch.
+        Identifiers without a session are skipped, the others keep their order.
+        """
+        items: List[Mapping[str, Any]] = []
+
+        for i in range(0, len(identifiers), self._BATCH_SIZE):
+            batch = [
+                self._key(identifier)
+                for identifier in identifiers[i : i + self._BATCH_SIZE]
+            ]
+            items.extend(
+                self.serializer.loads(result)
+                for result in self.client.mget(batch)
+                if result
+            )
+
+        return items
+
+    def iter_all(self, **kwargs) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterates over every session, scanning the keys under the prefix and fetching them
+        with one MGET per batch.
+        """
+        batch: List[bytes] = []
+
+        for key in self.client.scan_iter(
+            match=_redis_pattern(self.prefix), count=self._BATCH_SIZE
+        ):
+            batch.append(key)
+            if len(batch) == self._BATCH_SIZE:
+                yield from self._fetch(batch)
+                batch = []
+
+        if batch:
+            yield from self._fetch(batch)
+
+    def _fetch(self, keys: List[bytes]) -> Iterator[Mapping[str, Any]]:
+        # Keys deleted since the scan come back as None
+        for result in self.client.mget(keys):
+            if result:
+                yield self.serializer.loads(result)
 
     def delete(self, query: Mapping[str, Any], **kwargs) -> None:
         if not query:
@@ -358,4 +925,744 @@ class RedisSaver(SaverProtocol):
         if not identifier:
             raise ValueError("Identifier is required for Redis lookup")
 
-        self.client.delete(identifier)
+        self.client.delete(self._key(identifier))
+
+
+class CachedSaver(SaverProtocol):
+    """
+    Wraps any saver with an LRU cache of sessions and write-behind saves
+
+    A save only updates memory and returns, a background thread writes the pending
+    sessions to the wrapped saver in one `save` every `flush_interval` seconds, or as
+    soon as `max_pending` are waiting. Saves of the same identifier in between are
+    written once. Loads by identifier are served from memory when possible.
+
+    Pending saves are written by `flush()`, `close()` and at interpreter exit. A failed
+    background flush keeps them pending and retries on the next interval.
+    """
+
+    __slots__ = (
+        "saver",
+        "max_items",
+        "flush_interval",
+        "max_pending",
+        "_cache",
+        "_pending",
+        "_flushing",
+        "_lock",
+        "_wake",
+        "_flush_lock",
+        "_closed",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        saver: SaverProtocol,
+        *,
+        max_items: int = 10000,
+        flush_interval: float = 1.0,
+        max_pending: int = 1000,
+    ) -> None:
+        self.saver = saver
+        self.max_items = max_items
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        # identifier -> session, least recently used first
+        self._cache: OrderedDict[str, Mapping[str, Any]] = OrderedDict()
+        # Saved but not yet written, and being written
+        self._pending: Dict[str, Mapping[str, Any]] = {}
+        self._flushing: Dict[str, Mapping[str, Any]] = {}
+
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        # Keeps flushes, and the writes that must follow them, in order
+        self._flush_lock = threading.RLock()
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run, name="CachedSaver", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __str__(self) -> str:
+        return f"CachedSaver()"
+
+    def _remember(self, item: Mapping[str, Any]) -> None:
+        key = item["identifier"]
+        self._cache[key] = item
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_items:
+            self._cache.popitem(last=False)
+
+    def _lookup(self, identifier: str) -> Mapping[str, Any] | None:
+        # Pending sessions are newer than the wrapped saver, even once evicted
+        item = self._pending.get(identifier) or self._flushing.get(identifier)
+        if item is None:
+            item = self._cache.get(identifier)
+            if item is not None:
+                self._cache.move_to_end(identifier)
+
+        return item
+
+    def _run(self) -> None:
+        failed = False
+        while True:
+            with self._wake:
+                self._wake.wait_for(
+                    lambda: self._closed
+                    or (not failed and len(self._pending) >= self.max_pending),
+                    timeout=self.flush_interval,
+                )
+                if self._closed:
+                    return
+
+            try:
+                self.flush()
+                failed = False
+            except SaverError:
+                failed = True
+
+    def flush(self) -> None:
+        """
+        Writes the pending saves to the wrapped saver, in one save
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                self._flushing, self._pending = self._pending, {}
+
+            try:
+                self.saver.save(list(self._flushing.values()))
+            except Exception as e:
+                with self._lock:
+                    # Saves made during the flush are newer
+                    self._pending = {**self._flushing, **self._pending}
+                    self._flushing = {}
+                raise SaverError("Could not flush pending saves", error=str(e)) from e
+
+            with self._lock:
+                self._flushing = {}
+
+    def save(self, data: List[Mapping[str, Any]], **kwargs) -> None:
+        """
+        Queues the data to be written. Kwargs (e.g. overwrite) are only understood by
+        the wrapped saver, a save with kwargs is written at once.
+        """
+        if len(data) == 0:
+            raise ValueError("No data to save")
+
+        if kwargs:
+            with self._flush_lock:
+                self.flush()
+                self.saver.save(data, **kwargs)
+                with self._lock:
+                    self._cache.clear()
+            return
+
+        with self._wake:
+            if self._closed:
+                raise SaverError("Saver is closed")
+
+            for item in data:
+                self._pending[item["identifier"]] = item
+                self._remember(item)
+
+            if len(self._pending) >= self.max_pending:
+                self._wake.notify()
+
+    def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
+        """
+        Loads by identifier from memory when possible. Other queries are answered by
+        the wrapped saver, after a flush.
+        """
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        identifier = query.get("identifier")
+        if identifier is None or len(query) > 1:
+            self.flush()
+            return self.saver.load(query, **kwargs)
+
+        with self._lock:
+            item = self._lookup(identifier)
+        if item is not None:
+            return item
+
+        item = self.saver.load(query, **kwargs)
+        with self._lock:
+            # A save during the load is newer
+            if self._lookup(identifier) is None:
+                self._remember(item)
+
+        return item
+
+    def load_many(self, identifiers: List[str], **kwargs) -> List[Mapping[str, Any]]:
+        """
+        Loads the sessions in memory, and the others with one load_many of the
+        wrapped saver.
+        """
+        found: Dict[str, Mapping[str, Any]] = {}
+        with self._lock:
+            for key in identifiers:
+                item = self._lookup(key)
+                if item is not None:
+                    found[key] = item
+
+        missing = [key for key in dict.fromkeys(identifiers) if key not in found]
+        if missing:
+            loaded = self.saver.load_many(missing, **kwargs)
+            with self._lock:
+                for item in loaded:
+                    key = item["identifier"]
+                    newer = self._lookup(key)
+                    if newer is None:
+                        self._remember(item)
+                    found[key] = newer or item
+
+        return [found[key] for key in identifiers if key in found]
+
+    def iter_all(self, **kwargs) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterates over the sessions of the wrapped saver, after a flush
+        """
+        self.flush()
+        return self.saver.iter_all(**kwargs)
+
+    def delete(self, query: Mapping[str, Any], **kwargs) -> None:
+        """
+        Flushes, then deletes from the wrapped saver and the cache
+        """
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        with self._flush_lock:
+            self.flush()
+            self.saver.delete(query, **kwargs)
+
+            with self._lock:
+                if kwargs.get("clear_all", False):
+                    self._cache.clear()
+                    return
+
+                for key, item in list(self._cache.items()):
+                    if all(item.get(field) == query[field] for field in query):
+                        del self._cache[key]
+
+    def close(self) -> None:
+        """
+        Stops the background thread, writes the pending saves and closes the wrapped
+        saver.
+        """
+        with self._wake:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake.notify()
+
+        self._thread.join()
+        try:
+            self.flush()
+        finally:
+            close = getattr(self.saver, "close", None)
+            if close is not None:
+                close()
+
+
+def _ring_hash(key: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class _Shard:
+    __slots__ = ("name", "saver", "failures", "down_until")
+
+    def __init__(self, name: str, saver: SaverProtocol) -> None:
+        self.name = name
+        self.saver = saver
+        self.failures = 0
+        self.down_until = 0.0
+
+
+class ShardedSaver(SaverProtocol):
+    """
+    Spreads sessions over several savers with consistent hashing
+
+    Every shard owns `replicas` points on a hash ring, an identifier belongs to the shard
+    of the next point. Adding or removing a shard only moves the sessions between it and
+    its neighbours, see `add_shard` and `remove_shard`. Shard names place the points, they
+    must stay the same across restarts.
+
+    Bulk operations are split per shard and run on all of them at once. A shard failing
+    `max_failures` times in a row is skipped for `retry_after` seconds: writes to it raise
+    SaverError at once, reads that span several shards return what the others have.
+    """
+
+    __slots__ = (
+        "replicas",
+        "max_failures",
+        "retry_after",
+        "rwlock",
+        "rlock",
+        "wlock",
+        "_shards",
+        "_ring",
+        "_points",
+        "_executor",
+    )
+
+    def __init__(
+        self,
+        shards: Mapping[str, SaverProtocol],
+        *,
+        replicas: int = 128,
+        max_failures: int = 3,
+        retry_after: float = 30.0,
+        workers: int = 8,
+    ) -> None:
+        if not shards:
+            raise ValueError("At least one shard is required")
+
+        self.replicas = replicas
+        self.max_failures = max_failures
+        self.retry_after = retry_after
+
+        self.rwlock = rwlock.RWLockFairD()
+        self.rlock = self.rwlock.gen_rlock()
+        self.wlock = self.rwlock.gen_wlock()
+
+        self._shards = {name: _Shard(name, saver) for name, saver in shards.items()}
+        self._ring, self._points = self._build_ring(self._shards)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ShardedSaver"
+        )
+
+    def __str__(self) -> str:
+        return f"ShardedSaver()"
+
+    def _build_ring(self, shards: Mapping[str, _Shard]) -> Tuple[List[int], List[str]]:
+        points = sorted(
+            (_ring_hash(f"{name}#{i}"), name)
+            for name in shards
+            for i in range(self.replicas)
+        )
+        return [point for point, _ in points], [name for _, name in points]
+
+    @staticmethod
+    def _owner(ring: Tuple[List[int], List[str]], identifier: str) -> str:
+        hashes, names = ring
+        i = bisect.bisect(hashes, _ring_hash(identifier))
+        return names[i % len(names)]
+
+    def shard_for(self, identifier: str) -> str:
+        """The name of the shard owning the identifier."""
+        return self._owner((self._ring, self._points), identifier)
+
+    def health(self) -> Dict[str, bool]:
+        """Whether each shard is currently used."""
+        now = time.monotonic()
+        return {name: shard.down_until <= now for name, shard in self._shards.items()}
+
+    def _call(self, shard: _Shard, method: str, *args: Any, **kwargs: Any) -> Any:
+        if shard.down_until > time.monotonic():
+            raise SaverError(f"Shard {shard.name} is down")
+
+        try:
+            result = getattr(shard.saver, method)(*args, **kwargs)
+            if method == "iter_all":
+                result = list(result)
+        except (SaverError, ValueError):
+            # Answers, not failures of the shard
+            shard.failures = 0
+            raise
+        except Exception as e:
+            shard.failures += 1
+            if shard.failures >= self.max_failures:
+                shard.down_until = time.monotonic() + self.retry_after
+                shard.failures = 0
+            raise SaverError(f"Shard {shard.name} failed", error=str(e)) from e
+
+        shard.failures = 0
+        return result
+
+    def _fan_out(
+        self, calls: Mapping[str, Tuple[str, Tuple[Any, ...]]], **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Runs one call per shard concurrently, returns the results or the errors."""
+        futures = {
+            name: self._executor.submit(
+                self._call, self._shards[name], method, *args, **kwargs
+            )
+            for name, (method, args) in calls.items()
+        }
+
+        results: Dict[str, Any] = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
+
+        return results
+
+    def _group(self, identifiers: List[str]) -> Dict[str, List[str]]:
+        groups: Dict[str, List[str]] = {}
+        for identifier in identifiers:
+            groups.setdefault(self.shard_for(identifier), []).append(identifier)
+        return groups
+
+    def save(self, data: List[Mapping[str, Any]], **kwargs) -> None:
+        """
+        Saves every item on its shard, with one save per shard
+        """
+        if len(data) == 0:
+            raise ValueError("No data to save")
+
+        with self.rlock:
+            groups: Dict[str, List[Mapping[str, Any]]] = {}
+            for item in data:
+                groups.setdefault(self.shard_for(item["identifier"]), []).append(item)
+
+            results = self._fan_out(
+                {name: ("save", (items,)) for name, items in groups.items()}, **kwargs
+            )
+
+        failed = {
+            name: str(result)
+            for name, result in results.items()
+            if isinstance(result, Exception)
+        }
+        if failed:
+            raise SaverError(
+                f"Could not save to shards {', '.join(sorted(failed))}",
+                error=str(failed),
+            )
+
+    def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
+        """
+        Loads from the owning shard when the query has an identifier, otherwise from the
+        first shard with a match
+        """
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        with self.rlock:
+            identifier = query.get("identifier")
+            if identifier is not None:
+                shard = self._shards[self.shard_for(identifier)]
+                return self._call(shard, "load", query, **kwargs)
+
+            results = self._fan_out(
+                {name: ("load", (query,)) for name in self._shards}, **kwargs
+            )
+
+        for result in results.values():
+            if not isinstance(result, Exception):
+                return result
+
+        raise SaverError("Item not found")
+
+    def load_many(self, identifiers: List[str], **kwargs) -> List[Mapping[str, Any]]:
+        """
+        Loads with one load_many per shard, run concurrently.
+        Identifiers without a session, or on a failing shard, are skipped.
+        """
+        with self.rlock:
+            results = self._fan_out(
+                {
+                    name: ("load_many", (batch,))
+                    for name, batch in self._group(identifiers).items()
+                },
+                **kwargs,
+            )
+
+        found: Dict[str, Mapping[str, Any]] = {}
+        for result in results.values():
+            if not isinstance(result, Exception):
+                found.update((item["identifier"], item) for item in result)
+
+        return [found[key] for key in identifiers if key in found]
+
+    def iter_all(self, **kwargs) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterates over the sessions of every shard, read concurrently.
+        Failing shards are skipped.
+        """
+        with self.rlock:
+            results = self._fan_out(
+                {name: ("iter_all", ()) for name in self._shards}, **kwargs
+            )
+
+        for result in results.values():
+            if not isinstance(result, Exception):
+                yield from result
+
+    def delete(self, query: Mapping[str, Any], **kwargs) -> None:
+        """
+        Deletes from the owning shard when the query has an identifier, otherwise from
+        every shard
+        """
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        with self.rlock:
+            identifier = query.get("identifier")
+            if identifier is not None:
+                shard = self._shards[self.shard_for(identifier)]
+                self._call(shard, "delete", query, **kwargs)
+                return
+
+            results = self._fan_out(
+                {name: ("delete", (query,)) for name in self._shards}, **kwargs
+            )
+
+        failed = [
+            name for name, result in results.items() if isinstance(result, Exception)
+        ]
+        if failed:
+            raise SaverError(
+                f"Could not delete from shards {', '.join(sorted(failed))}"
+            )
+
+    def _move(self, shards: Dict[str, _Shard], sources: List[str]) -> int:
+        """
+        Moves the sessions of `sources` that the ring of `shards` places on other shards,
+        and makes that ring the current one.
+        """
+        ring = self._build_ring(shards)
+        moves: List[Tuple[_Shard, str, List[Mapping[str, Any]]]] = []
+
+        for source in sources:
+            groups: Dict[str, List[Mapping[str, Any]]] = {}
+            for item in self._call(self._shards[source], "iter_all"):
+                owner = self._owner(ring, item["identifier"])
+                if owner != source:
+                    groups.setdefault(owner, []).append(item)
+
+            moves.extend(
+                (self._shards[source], owner, items) for owner, items in groups.items()
+            )
+
+        # Copy before switching rings, a failure leaves every session where it was
+        for _, owner, items in moves:
+            self._call(shards[owner], "save", items)
+
+        self._shards = shards
+        self._ring, self._points = ring
+
+        # A failed delete only leaves a copy that is no longer read
+        for shard, _, items in moves:
+            for item in items:
+                try:
+                    self._call(shard, "delete", {"identifier": item["identifier"]})
+                except SaverError:
+                    continue
+
+        return sum(len(items) for _, _, items in moves)
+
+    def add_shard(self, name: str, saver: SaverProtocol) -> int:
+        """
+        Adds a shard and moves over the sessions it now owns.
+        Operations wait until the move is done. Returns the number of moved sessions.
+        """
+        with self.wlock:
+            if name in self._shards:
+                raise ValueError(f"Shard {name} already exists")
+
+            shards = {**self._shards, name: _Shard(name, saver)}
+            return self._move(shards, list(self._shards))
+
+    def remove_shard(self, name: str) -> int:
+        """
+        Moves the sessions of a shard to the others, then removes it.
+        Operations wait until the move is done. Returns the number of moved sessions.
+        """
+        with self.wlock:
+            if name not in self._shards:
+                raise ValueError(f"Unknown shard {name}")
+            if len(self._shards) == 1:
+                raise ValueError("Cannot remove the last shard")
+
+            shards = {key: shard for key, shard in self._shards.items() if key != name}
+            return self._move(shards, [name])
+
+    def close(self) -> None:
+        """
+        Closes every shard
+        """
+        self._executor.shutdown(wait=True)
+        for shard in self._shards.values():
+            close = getattr(shard.saver, "close", None)
+            if close is not None:
+                close()
+
+
+def _lmdb() -> Any:
+    # Optional, only needed by LMDBSaver
+    try:
+        return importlib.import_module("lmdb")
+    except ImportError:
+        raise ImportError(
+            "lmdb is required for LMDBSaver, install spotapi[lmdb]"
+        ) from None
+
+
+class LMDBSaver(SaverProtocol):
+    """
+    CRUD methods for an LMDB database, a memory-mapped key-value file
+
+    Sessions are stored under their identifier. Reads come straight from the memory map
+    without a server, and any number of threads and processes can read while one
+    writes. A database can only be opened once per process, share the saver instead.
+    """
+
+    __slots__ = ("path", "env", "serializer")
+
+    def __init__(
+        self,
+        path: str = "sessions.lmdb",
+        *,
+        map_size: int = 1 << 30,
+        max_readers: int = 126,
+        sync: bool = True,
+        serializer: SerializerProtocol | None = None,
+    ) -> None:
+        self.path = path
+        self.env = _lmdb().open(
+            path,
+            map_size=map_size,
+            max_readers=max_readers,
+            sync=sync,
+        )
+        self.serializer = serializer or JSONSerializer()
+
+        atexit.register(self.close)
+
+    def __str__(self) -> str:
+        return f"LMDBSaver()"
+
+    def __len__(self) -> int:
+        return self.env.stat()["entries"]
+
+    def _matches(
+        self, txn: Any, query: Mapping[str, Any]
+    ) -> Iterator[Tuple[bytes, Mapping[str, Any]]]:
+        identifier = query.get("identifier")
+        if identifier is not None:
+            value = txn.get(identifier.encode("utf-8"))
+            candidates = [] if value is None else [(identifier.encode("utf-8"), value)]
+        else:
+            candidates = txn.cursor()
+
+        for key, value in candidates:
+            item = self.serializer.loads(value)
+            if all(item.get(field) == query[field] for field in query):
+                yield bytes(key), item
+
+    def save(self, data: List[Mapping[str, Any]], **kwargs) -> None:
+        """
+        Saves data in one write transaction, replacing items with the same identifier
+
+        Kwargs
+        -------
+        overwrite (bool, optional): Defaults to False.
+            Deletes every other item first.
+        """
+        if len(data) == 0:
+            raise ValueError("No data to save")
+
+        with self.env.begin(write=True) as txn:
+            if kwargs.get("overwrite", False):
+                txn.drop(self.env.open_db(), delete=False)
+
+            txn.cursor().putmulti(
+                (item["identifier"].encode("utf-8"), self.serializer.dumps(item))
+                for item in data
+            )
+
+    def load(self, query: Mapping[str, Any], **kwargs) -> Mapping[str, Any]:
+        """
+        Load data given a query, a query with an identifier is a single lookup
+
+        Kwargs
+        -------
+        allow_collisions (bool, optional): Defaults to False.
+            Raises an error if the query returns more than one result.
+        """
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        allow_collisions = kwargs.get("allow_collisions", False)
+
+        with self.env.begin(buffers=True) as txn:
+            matches = []
+            for _, item in self._matches(txn, query):
+                matches.append(item)
+                if not allow_collisions or len(matches) > 1:
+                    break
+
+        if allow_collisions and len(matches) > 1:
+            raise SaverError("Collision found")
+
+        if matches:
+            return matches[0]
+
+        raise SaverError("Item not found")
+
+    def load_many(self, identifiers: List[str], **kwargs) -> List[Mapping[str, Any]]:
+        """
+        Loads the items of many identifiers in one read transaction.
+        Identifiers without an item are skipped, the others keep their order.
+        """
+        items: List[Mapping[str, Any]] = []
+
+        with self.env.begin(buffers=True) as txn:
+            for identifier in identifiers:
+                value = txn.get(identifier.encode("utf-8"))
+                if value is not None:
+                    items.append(self.serializer.loads(value))
+
+        return items
+
+    def iter_all(self, **kwargs) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterates over every item in identifier order, from one read transaction
+        """
+        with self.env.begin(buffers=True) as txn:
+            for _, value in txn.cursor():
+                yield self.serializer.loads(value)
+
+    def delete(self, query: Mapping[str, Any], **kwargs) -> None:
+        """
+        Delete data given a query
+
+        Kwargs
+        -------
+        all_instances (bool, optional): Defaults to True.
+            Deletes all instances of the query.
+
+        clear_all (bool, optional): Defaults to False.
+            Deletes all data in the database.
+        """
+        if not query:
+            raise ValueError("Query dictionary cannot be empty")
+
+        with self.env.begin(write=True) as txn:
+            if kwargs.get("clear_all", False):
+                txn.drop(self.env.open_db(), delete=False)
+                return
+
+            # Collected first, deleting under a live cursor skips items
+            keys = [key for key, _ in self._matches(txn, query)]
+            if not kwargs.get("all_instances", True):
+                keys = keys[:1]
+
+            for key in keys:
+                txn.delete(key)
+
+    def close(self) -> None:
+        self.env.close()
@@ -0,0 +1,196 @@
+"""
+Serializer.py turns sessions into the bytes stored by the key-value savers (RedisSaver,
+AsyncRedisSaver, LMDBSaver) and back.
+
+JSONSerializer writes plain JSON, what these savers always stored. MsgpackSerializer
+writes a versioned binary record:
+
+    b"\\x00" | schema version (1 byte) | codec (1 byte) | body
+
+where the body is the msgpack array `[identifier, password, cookies]`, followed by a map
+of any other keys, and zstd compressed for the zstd codecs. JSON never starts with a null
+byte, so every serializer reads both formats and a store can switch without a migration.
+
+Single sessions are too small for zstd to find much to compress. A dictionary trained on
+sample sessions (`train_dictionary`) holds what they have in common, records compressed
+with it can only be read with the same dictionary.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import Any, Dict, Iterable, Mapping
+
+from spotapi.exceptions import SaverError
+from spotapi.types.interfaces import SerializerProtocol
+from spotapi.utils import fastjson
+
+__all__ = [
+    "JSONSerializer",
+    "MsgpackSerializer",
+    "SerializerProtocol",
+    "SCHEMA_VERSION",
+    "train_dictionary",
+]
+
+# Bumped when the record layout changes, older records stay readable
+SCHEMA_VERSION = 1
+
+_MARKER = 0
+_CODEC_MSGPACK = 0
+_CODEC_MSGPACK_ZSTD = 1
+_CODEC_MSGPACK_ZSTD_DICT = 2
+_FIELDS = ("identifier", "password", "cookies")
+
+
+def _optional(module: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            f"{module} is required for this serializer, install spotapi[{extra}]"
+        ) from None
+
+
+class _Zstd(threading.local):
+    # zstandard contexts must not be shared between threads
+    def __init__(self, level: int, dictionary: bytes | None) -> None:
+        zstd = _optional("zstandard", "zstd")
+        self.decompressor = zstd.ZstdDecompressor()
+
+        if dictionary is None:
+            self.dict_id = None
+            self.compressor = zstd.ZstdCompressor(level=level)
+        else:
+            data = zstd.ZstdCompressionDict(dictionary)
+            self.dict_id = data.dict_id()
+            self.compressor = zstd.ZstdCompressor(level=level, dict_data=data)
+            self.dict_decompressor = zstd.ZstdDecompressor(dict_data=data)
+
+    def decompress(self, codec: int, body: Any) -> bytes:
+        if codec == _CODEC_MSGPACK_ZSTD:
+            return self.decompressor.decompress(body)
+
+        zstd = _optional("zstandard", "zstd")
+        dict_id = zstd.get_frame_parameters(body).dict_id
+        if dict_id != self.dict_id:
+            raise SaverError(
+                f"Session compressed with zstd dictionary {dict_id}, "
+                f"the serializer has {self.dict_id}"
+            )
+        return self.dict_decompressor.decompress(body)
+
+
+def _to_record(item: Mapping[str, Any]) -> list:
+    record = [item.get(field) for field in _FIELDS]
+    rest = {key: value for key, value in item.items() if key not in _FIELDS}
+    if rest:
+        record.append(rest)
+    return record
+
+
+def _from_record(version: int, record: list) -> Dict[str, Any]:
+    # Version 1 is the only layout so far, newer ones add their conversions here
+    item = dict(zip(_FIELDS, record))
+    if len(record) > len(_FIELDS):
+        item.update(record[len(_FIELDS)])
+    return item
+
+
+def _decode(data: Any, zstd: _Zstd | None) -> Mapping[str, Any]:
+    if not data or data[0] != _MARKER:
+        # Plain JSON, orjson also reads buffers like LMDB's without a copy
+        return fastjson.loads(data if fastjson.HAS_ORJSON else bytes(data))
+
+    version, codec = data[1], data[2]
+    if version > SCHEMA_VERSION:
+        raise SaverError(
+            f"Session written with schema version {version}, "
+            f"this version of spotapi reads up to {SCHEMA_VERSION}"
+        )
+
+    body = memoryview(data)[3:]
+    if codec in (_CODEC_MSGPACK_ZSTD, _CODEC_MSGPACK_ZSTD_DICT):
+        body = (zstd or _Zstd(3, None)).decompress(codec, body)
+    elif codec != _CODEC_MSGPACK:
+        raise SaverError(f"Unknown session codec {codec}")
+
+    msgpack = _optional("msgpack", "msgpack")
+    return _from_record(version, msgpack.unpackb(body))
+
+
+class JSONSerializer(SerializerProtocol):
+    """
+    Compact JSON, the format the savers used before serializers
+    """
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return "JSONSerializer()"
+
+    def dumps(self, item: Mapping[str, Any]) -> bytes:
+        return fastjson.dumps_bytes(item)
+
+    def loads(self, data: Any) -> Mapping[str, Any]:
+        return _decode(data, None)
+
+
+class MsgpackSerializer(SerializerProtocol):
+    """
+    Versioned msgpack records, zstd compressed when `level` is set
+
+    Parameters
+    ----------
+    level : int | None
+        zstd compression level (1-22), None stores the records uncompressed.
+    dictionary : bytes | None
+        zstd dictionary from `train_dictionary`, compresses at level 3 unless `level`
+        is set. Keep it, the records written with it can't be read without it.
+    """
+
+    __slots__ = ("level", "_msgpack", "_zstd")
+
+    def __init__(
+        self, level: int | None = None, *, dictionary: bytes | None = None
+    ) -> None:
+        if level is None and dictionary is not None:
+            level = 3
+
+        self.level = level
+        self._msgpack = _optional("msgpack", "msgpack")
+        self._zstd = _Zstd(level, dictionary) if level is not None else None
+
+    def __str__(self) -> str:
+        return "MsgpackSerializer()"
+
+    def dumps(self, item: Mapping[str, Any]) -> bytes:
+        body = self._msgpack.packb(_to_record(item))
+
+        if self._zstd is None:
+            codec = _CODEC_MSGPACK
+        else:
+            codec = (
+                _CODEC_MSGPACK_ZSTD
+                if self._zstd.dict_id is None
+                else _CODEC_MSGPACK_ZSTD_DICT
+            )
+            body = self._zstd.compressor.compress(body)
+
+        return bytes((_MARKER, SCHEMA_VERSION, codec)) + body
+
+    def loads(self, data: Any) -> Mapping[str, Any]:
+        return _decode(data, self._zstd)
+
+
+def train_dictionary(sessions: Iterable[Mapping[str, Any]], size: int = 4096) -> bytes:
+    """
+    Trains a zstd dictionary for MsgpackSerializer on sample sessions.
+    A few thousand samples are enough.
+    """
+    msgpack = _optional("msgpack", "msgpack")
+    zstd = _optional("zstandard", "zstd")
+
+    samples = [msgpack.packb(_to_record(item)) for item in sessions]
+    return zstd.train_dictionary(size, samples).as_bytes()
@@ -1,19 +1,154 @@
 from __future__ import annotations
 
+import asyncio
 import threading
 import atexit
-import json
+import queue
+import random
+import re
 import time
 import signal
-from typing import Any, Dict
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Tuple
 from spotapi.login import Login
 from spotapi.client import BaseClient
-from spotapi.exceptions import WebSocketError
+from spotapi.exceptions import ParentException, WebSocketError
+from spotapi.http.request import TLSClient
 from spotapi.types.annotations import enforce
+from spotapi.types.data import LatencyStats
+from websockets.exceptions import ConnectionClosed, WebSocketException
 from websockets.sync.client import connect
+from spotapi.utils import fastjson
+from spotapi.utils.logger import Logger
 from spotapi.utils.strings import random_hex_string
 
-__all__ = ["WebsocketStreamer", "WebSocketError"]
+try:
+    from websockets.asyncio.client import connect as async_connect
+except ImportError:
+    # websockets < 13
+    from websockets.client import connect as async_connect  # type: ignore
+
+__all__ = ["WebsocketStreamer", "AsyncWebsocketStreamer", "WebSocketError"]
+
+DEALER_URL = "wss://dealer.spotify.com/"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+_PING = '{"type":"ping"}'
+
+
+def _register_device(client: TLSClient, device_id: str, connection_id: str) -> None:
+    url = f"https://gue1-spclient.spotify.com/track-playback/v1/devices"
+    payload = {
+        "device": {
+            "brand": "spotify",
+            "capabilities": {
+                "change_volume": True,
+                "enable_play_token": True,
+                "supports_file_media_type": True,
+                "play_token_lost_behavior": "pause",
+                "disable_connect": False,
+                "audio_podcasts": True,
+                "video_playback": True,
+                "manifest_formats": [
+                    "file_ids_mp3",
+                    "file_urls_mp3",
+                    "manifest_urls_audio_ad",
+                    "manifest_ids_video",
+                    "file_urls_external",
+                    "file_ids_mp4",
+                    "file_ids_mp4_dual",
+                    "manifest_urls_audio_ad",
+                ],
+            },
+            "device_id": device_id,
+            "device_type": "computer",
+            "metadata": {},
+            "model": "web_player",
+            "name": "Web Player (Chrome)",
+            "platform_identifier": "web_player windows 10;chrome 120.0.0.0;desktop",
+            "is_group": False,
+        },
+        "outro_endcontent_snooping": False,
+        "connection_id": connection_id,
+        "client_version": "harmony:4.43.2-a61ecaf5",
+        "volume": 65535,
+    }
+
+    resp = client.post(url, json=payload, authenticate=True)
+
+    if resp.fail:
+        raise WebSocketError("Could not register device", error=resp.error.string)
+
+
+def _connect_device(
+    client: TLSClient, device_id: str, connection_id: str
+) -> Dict[str, Any]:
+    url = f"https://gue1-spclient.spotify.com/connect-state/v1/devices/hobs_{device_id}"
+    payload = {
+        "member_type": "CONNECT_STATE",
+        "device": {
+            "device_info": {
+                "capabilities": {
+                    "can_be_player": False,
+                    "hidden": True,
+                    "needs_full_player_state": True,
+                }
+            }
+        },
+    }
+    headers = {
+        "x-spotify-connection-id": connection_id,
+    }
+
+    resp = client.put(url, json=payload, authenticate=True, headers=headers)
+
+    if resp.fail:
+        raise WebSocketError("Could not connect device", error=resp.error.string)
+
+    return resp.response
+
+
+def _connection_id(packet: Dict[Any, Any]) -> str:
+    if (
+        packet.get("headers") is None
+        or dict(packet["headers"]).get("Spotify-Connection-Id") is None
+    ):
+        raise ValueError("Invalid init packet")
+
+    return packet["headers"]["Spotify-Connection-Id"]
+
+
+# Control frames like {"type":"pong"} are tiny, bigger frames are never checked for them
+_CONTROL_FRAME_SIZE = 128
+_CONTROL_TYPES = frozenset(("ping", "pong"))
+_TYPE = re.compile(r'"type"\s*:\s*"(\w+)"')
+_UPDATE_REASON_KEY = '"update_reason"'
+_UPDATE_REASON_VALUE = re.compile(r'\s*:\s*"(\w+)"')
+
+
+def _frame_text(frame: str | bytes) -> str:
+    return frame if isinstance(frame, str) else frame.decode("utf-8", "replace")
+
+
+def _is_control_frame(frame: str) -> bool:
+    if len(frame) > _CONTROL_FRAME_SIZE:
+        return False
+
+    match = _TYPE.search(frame)
+    return match is not None and match.group(1) in _CONTROL_TYPES
+
+
+def _peek_update_reasons(frame: str) -> List[str]:
+    """The update reasons of a frame's payloads, found without decoding it."""
+    # str.find skips through the cluster far faster than a regex scan
+    reasons = []
+    index = frame.find(_UPDATE_REASON_KEY)
+    while index != -1:
+        index += len(_UPDATE_REASON_KEY)
+        match = _UPDATE_REASON_VALUE.match(frame, index)
+        if match is not None:
+            reasons.append(match.group(1))
+        index = frame.find(_UPDATE_REASON_KEY, index)
+
+    return reasons
 
 
 @enforce
@@ -21,10 +156,17 @@ class WebsocketStreamer:
     """
     Standard streamer to connect to Spotify's websocket API.
 
+    A reader thread moves incoming messages to a queue and a keep-alive thread owns the
+    outgoing side, so pings are sent on schedule even while `get_packet` is waiting.
+
     Parameters
     ----------
     login : Login
         The login object to use for authentication.
+    ping_interval : float
+        Seconds between the application level pings the dealer expects.
+    dealer_url : Optional[str]
+        The dealer endpoint to connect to, defaults to DEALER_URL.
     """
 
     __slots__ = (
@@ -32,13 +174,26 @@ class WebsocketStreamer:
         "client",
         "device_id",
         "ws",
-        "rlock",
         "ws_dump",
         "connection_id",
+        "ping_interval",
+        "last_ping",
+        "recv_latency",
+        "frames_skipped",
+        "frame_hooks",
+        "reader_thread",
         "keep_alive_thread",
+        "_inbox",
+        "_outbox",
     )
 
-    def __init__(self, login: Login) -> None:
+    def __init__(
+        self,
+        login: Login,
+        *,
+        ping_interval: float = 30.0,
+        dealer_url: str | None = None,
+    ) -> None:
         if not login.logged_in:
             raise ValueError("Must be logged in")
 
@@ -50,118 +205,373 @@ class WebsocketStreamer:
 
         self.device_id = random_hex_string(32)
 
-        uri = f"wss://dealer.spotify.com/?access_token={self.base.access_token}"
-        self.ws = connect(
-            uri,
-            user_agent_header="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        )
+        uri = f"{dealer_url or DEALER_URL}?access_token={self.base.access_token}"
+        self.ws = connect(uri, user_agent_header=USER_AGENT)
 
-        self.rlock = threading.Lock()
         self.ws_dump: Dict[Any, Any] | None = None
+        self.ping_interval = ping_interval
+        self.last_ping: float | None = None
+        # Time packets spend between the socket read and get_packet
+        self.recv_latency = LatencyStats()
+        self.frames_skipped = 0
+        # Called on the reader thread with the text of every frame after the init packet
+        self.frame_hooks: List[Callable[[str], None]] = []
+
+        self._inbox: queue.Queue[
+            Tuple[str | bytes | Dict[str, Any] | Exception, float]
+        ] = queue.Queue()
+        self._outbox: queue.Queue[str | None] = queue.Queue()
+
+        self.reader_thread = threading.Thread(target=self._read, daemon=True)
+        self.reader_thread.start()
+
         self.connection_id = self.get_init_packet()
 
         self.keep_alive_thread = threading.Thread(target=self.keep_alive, daemon=True)
         self.keep_alive_thread.start()
 
-        atexit.register(self.ws.close)
+        atexit.register(self.close)
         signal.signal(signal.SIGINT, self.handle_interrupt)
 
     def register_device(self) -> None:
-        url = f"https://gue1-spclient.spotify.com/track-playback/v1/devices"
-        payload = {
-            "device": {
-                "brand": "spotify",
-                "capabilities": {
-                    "change_volume": True,
-                    "enable_play_token": True,
-                    "supports_file_media_type": True,
-                    "play_token_lost_behavior": "pause",
-                    "disable_connect": False,
-                    "audio_podcasts": True,
-                    "video_playback": True,
-                    "manifest_formats": [
-                        "file_ids_mp3",
-                        "file_urls_mp3",
-                        "manifest_urls_audio_ad",
-                        "manifest_ids_video",
-                        "file_urls_external",
-                        "file_ids_mp4",
-                        "file_ids_mp4_dual",
-                        "manifest_urls_audio_ad",
-                    ],
-                },
-                "device_id": self.device_id,
-                "device_type": "computer",
-                "metadata": {},
-                "model": "web_player",
-                "name": "Web Player (Chrome)",
-                "platform_identifier": "web_player windows 10;chrome 120.0.0.0;desktop",
-                "is_group": False,
-            },
-            "outro_endcontent_snooping": False,
-            "connection_id": self.connection_id,
-            "client_version": "harmony:4.43.2-a61ecaf5",
-            "volume": 65535,
-        }
+        _register_device(self.client, self.device_id, self.connection_id)
 
-        resp = self.client.post(url, json=payload, authenticate=True)
+    def connect_device(self) -> Dict[str, Any]:
+        return _connect_device(self.client, self.device_id, self.connection_id)
 
-        if resp.fail:
-            raise WebSocketError("Could not register device", error=resp.error.string)
+    def _read(self) -> None:
+        # The init packet is always queued, get_init_packet waits for it
+        init = True
+        while True:
+            try:
+                message = self.ws.recv()
+            except Exception as e:
+                # Wake up get_packet and the keep-alive thread instead of dying silently
+                self._inbox.put((e, time.monotonic()))
+                self._outbox.put(None)
+                return
 
-    def connect_device(self) -> Dict[str, Any]:
-        url = f"https://gue1-spclient.spotify.com/connect-state/v1/devices/hobs_{self.device_id}"
-        payload = {
-            "member_type": "CONNECT_STATE",
-            "device": {
-                "device_info": {
-                    "capabilities": {
-                        "can_be_player": False,
-                        "hidden": True,
-                        "needs_full_player_state": True,
-                    }
-                }
-            },
-        }
-        headers = {
-            "x-spotify-connection-id": self.connection_id,
-        }
+            if init:
+                item = message
+                init = False
+            else:
+                try:
+                    frame = _frame_text(message)
+                    self._run_hooks(frame)
+                    item = self._process_frame(frame)
+                except Exception as e:
+                    # A malformed frame is dropped, it must not end the reader thread
+                    Logger.error(
+                        f"Dropped a dealer frame that failed to process: {e!r}"
+                    )
+                    item = None
 
-        resp = self.client.put(url, json=payload, authenticate=True, headers=headers)
+            if item is None:
+                self.frames_skipped += 1
+            else:
+                self._inbox.put((item, time.monotonic()))
 
-        if resp.fail:
-            raise WebSocketError("Could not connect device", error=resp.error.string)
+    def _run_hooks(self, frame: str) -> None:
+        # A copy, hooks can be detached from other threads meanwhile
+        for hook in tuple(self.frame_hooks):
+            try:
+                hook(frame)
+            except Exception as e:
+                Logger.error(f"Frame hook {hook!r} failed: {e!r}")
+
+    def _process_frame(self, frame: str) -> str | Dict[str, Any] | None:
+        """
+        Runs on the reader thread for every frame after the init packet.
+        Returns what get_packet receives (the frame or an already decoded packet), or None to drop it.
+        """
+        return frame if self._accept_frame(frame) else None
 
-        return resp.response
+    def _accept_frame(self, frame: str) -> bool:
+        """
+        Decides from the raw text whether a frame is decoded and queued at all.
+        Subclasses can narrow it down.
+        """
+        return not _is_control_frame(frame)
+
+    def send(self, message: str) -> None:
+        """Queues a message, it is sent by the keep-alive thread."""
+        self._outbox.put(message)
 
     def keep_alive(self) -> None:
+        """Sends the queued messages, and a ping every `ping_interval` seconds."""
+        next_ping = time.monotonic() + self.ping_interval
         while True:
+            now = time.monotonic()
+            if now >= next_ping:
+                message = _PING
+                next_ping = now + self.ping_interval
+            else:
+                try:
+                    message = self._outbox.get(timeout=next_ping - now)
+                except queue.Empty:
+                    continue
+
+            if message is None:
+                break
+
             try:
-                time.sleep(60)
-                with self.rlock:
-                    self.ws.send('{"type":"ping"}')
-            except (ConnectionError, KeyboardInterrupt):
+                self.ws.send(message)
+            except (ConnectionClosed, OSError):
                 break
 
+            if message is _PING:
+                self.last_ping = time.time()
+
     def get_packet(self) -> Dict[Any, Any]:
-        with self.rlock:
-            ws_dump = dict(json.loads(self.ws.recv()))
-            self.ws_dump = ws_dump
-            return self.ws_dump
+        message, received_at = self._inbox.get()
+
+        if isinstance(message, Exception):
+            # Keep it queued so every later call fails the same way
+            self._inbox.put((message, received_at))
+            raise WebSocketError("Websocket connection closed", error=str(message))
+
+        self.recv_latency.record(time.monotonic() - received_at)
+        ws_dump = (
+            message if isinstance(message, dict) else dict(fastjson.loads(message))
+        )
+        self.ws_dump = ws_dump
+        return self.ws_dump
 
     def get_init_packet(self) -> str:
         """Gets the Spotify Connection ID in the init packet"""
-        packet = self.get_packet()
-
-        if (
-            packet.get("headers") is None
-            or dict(packet["headers"]).get("Spotify-Connection-Id") is None
-        ):
-            raise ValueError("Invalid init packet")
+        return _connection_id(self.get_packet())
 
-        return packet["headers"]["Spotify-Connection-Id"]
+    def close(self) -> None:
+        self._outbox.put(None)
+        self.ws.close()
 
     def handle_interrupt(self, signum: int, frame: Any) -> None:
         """Handle interrupt signal (Ctrl+C)"""
-        self.ws.close()
+        self.close()
         exit(0)
+
+
+ReconnectCallback = Callable[["AsyncWebsocketStreamer"], Awaitable[None] | None]
+
+
+@enforce
+class AsyncWebsocketStreamer:
+    """
+    Asyncio streamer to connect to Spotify's websocket API.
+
+    Drops of the dealer socket are handled transparently: the access token is refreshed,
+    the socket is reopened with exponential backoff and the device is registered again with
+    the new connection id, so `packets()` keeps yielding across reconnects.
+
+    Parameters
+    ----------
+    login : Login
+        The login object to use for authentication.
+    ping_interval : float
+        Seconds between the application level pings the dealer expects.
+    max_backoff : float
+        Upper bound of the delay between two connection attempts, in seconds.
+    max_retries : int | None
+        Connection attempts before giving up, None retries forever.
+    """
+
+    __slots__ = (
+        "base",
+        "client",
+        "device_id",
+        "ws",
+        "ws_dump",
+        "connection_id",
+        "ping_interval",
+        "max_backoff",
+        "max_retries",
+        "reconnects",
+        "frames_skipped",
+        "_callbacks",
+        "_ping_task",
+        "_connect_lock",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        login: Login,
+        *,
+        ping_interval: float = 30.0,
+        max_backoff: float = 60.0,
+        max_retries: int | None = None,
+    ) -> None:
+        if not login.logged_in:
+            raise ValueError("Must be logged in")
+
+        self.base = BaseClient(login.client)
+        self.client = self.base.client
+
+        self.device_id = random_hex_string(32)
+        self.ws: Any = None
+        self.ws_dump: Dict[Any, Any] | None = None
+        self.connection_id: str | None = None
+
+        self.ping_interval = ping_interval
+        self.max_backoff = max_backoff
+        self.max_retries = max_retries
+        self.reconnects = 0
+        self.frames_skipped = 0
+
+        self._callbacks: List[ReconnectCallback] = []
+        self._ping_task: asyncio.Task[None] | None = None
+        self._connect_lock: asyncio.Lock | None = None
+        self._closed = False
+
+    async def __aenter__(self) -> AsyncWebsocketStreamer:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    def __str__(self) -> str:
+        return "AsyncWebsocketStreamer()"
+
+    def on_reconnect(self, callback: ReconnectCallback) -> None:
+        """
+        Registers a callback (sync or async) run after every reconnect.
+        Useful to refetch state that changed while the socket was down.
+        """
+        self._callbacks.append(callback)
+
+    @property
+    def connected(self) -> bool:
+        return self.ws is not None and self.connection_id is not None
+
+    async def connect(self) -> None:
+        """Opens the dealer socket and registers the device, retrying with backoff."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self.connected:
+                return
+
+            attempt = 0
+            while True:
+                if self._closed:
+                    raise WebSocketError("Streamer is closed")
+
+                try:
+                    await self._open(force_refresh=attempt > 0)
+                    break
+                except (
+                    OSError,
+                    asyncio.TimeoutError,
+                    ValueError,
+                    WebSocketException,
+                    ParentException,
+                ) as e:
+                    await self._drop()
+                    attempt += 1
+                    if self.max_retries is not None and attempt > self.max_retries:
+                        raise WebSocketError(
+                            "Could not connect to the dealer", error=str(e)
+                        ) from e
+
+                    await asyncio.sleep(_backoff(attempt, self.max_backoff))
+
+        self._ping_task = asyncio.create_task(self._keep_alive())
+
+    async def _open(self, *, force_refresh: bool = False) -> None:
+        # The token in the URL is only checked on the handshake, a reconnect needs a fresh one
+        await asyncio.to_thread(self.base.refresh_access_token, force=force_refresh)
+
+        uri = f"{DEALER_URL}?access_token={self.base.access_token}"
+        self.ws = await async_connect(uri, user_agent_header=USER_AGENT)
+
+        connection_id = _connection_id(await self._recv())
+        await asyncio.to_thread(
+            _register_device, self.client, self.device_id, connection_id
+        )
+        await asyncio.to_thread(
+            _connect_device, self.client, self.device_id, connection_id
+        )
+        self.connection_id = connection_id
+
+    async def _drop(self) -> None:
+        if self._ping_task is not None:
+            if self._ping_task is not asyncio.current_task():
+                self._ping_task.cancel()
+            self._ping_task = None
+
+        ws, self.ws = self.ws, None
+        self.connection_id = None
+        if ws is not None:
+            await ws.close()
+
+    async def reconnect(self) -> None:
+        """Drops the current socket and connects again."""
+        await self._drop()
+        await self.connect()
+        self.reconnects += 1
+
+        for callback in self._callbacks:
+            result = callback(self)
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def _keep_alive(self) -> None:
+        while self.ws is not None:
+            await asyncio.sleep(self.ping_interval)
+            try:
+                await self.ws.send(_PING)
+            except (ConnectionClosed, AttributeError):
+                # The reader notices the drop and reconnects
+                return
+
+    async def _recv(self) -> Dict[Any, Any]:
+        while True:
+            frame = await self.ws.recv()
+            if _is_control_frame(_frame_text(frame)):
+                continue
+
+            try:
+                ws_dump = dict(fastjson.loads(frame))
+            except (TypeError, ValueError) as e:
+                # A malformed frame is dropped, it must not end the stream
+                Logger.error(f"Dropped a dealer frame that failed to decode: {e!r}")
+                self.frames_skipped += 1
+                continue
+
+            self.ws_dump = ws_dump
+            return ws_dump
+
+    async def get_packet(self) -> Dict[Any, Any]:
+        """Receives the next packet, reconnecting first if the socket dropped."""
+        while True:
+            if not self.connected:
+                await self.connect()
+
+            try:
+                return await self._recv()
+            except ConnectionClosed:
+                if self._closed:
+                    raise WebSocketError("Streamer is closed")
+
+                await self.reconnect()
+
+    async def packets(self) -> AsyncGenerator[Dict[Any, Any], None]:
+        """Yields every dealer packet until the streamer is closed."""
+        while not self._closed:
+            try:
+                yield await self.get_packet()
+            except WebSocketError:
+                if self._closed:
+                    return
+                raise
+
+    async def close(self) -> None:
+        self._closed = True
+        await self._drop()
+
+
+def _backoff(attempt: int, cap: float) -> float:
+    # Full jitter, so many clients dropped at once do not reconnect in lockstep
+    return random.uniform(0, min(cap, 0.5 * 2**attempt))